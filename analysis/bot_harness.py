@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+"""
+Auto-play benchmark harness - runs seeded batches of bot games per policy and difficulty
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interfaces.game_interfaces import GameState
+from models.minesweeper_model import MinesweeperModel, DIFFICULTY_PRESETS
+from controllers.game_controller import MinesweeperController
+from analysis.policies import IBotPolicy, MoveType, POLICIES
+from analysis.transposition import TranspositionCache
+from utils.headless import HeadlessView
+from utils.rng import game_rng
+
+# Metrics where a higher value is worse, checked against the baseline
+TIMING_METRICS = ('mean_move_ms', 'mean_policy_ms', 'mean_engine_ms', 'mean_game_ms')
+
+
+def board_3bv(model: MinesweeperModel) -> int:
+    """Minimum clicks needed to clear the board: one per opening plus isolated numbers"""
+    rows, cols = model.rows, model.cols
+    seen = set()
+    clicks = 0
+
+    def neighbours(row: int, col: int):
+        for r in range(max(0, row - 1), min(rows, row + 2)):
+            for c in range(max(0, col - 1), min(cols, col + 2)):
+                yield r, c
+
+    zeros = [(r, c) for r in range(rows) for c in range(cols)
+             if (r, c) not in model.mines and model.get_cell_value(r, c) == 0]
+    for cell in zeros:
+        if cell in seen:
+            continue
+        clicks += 1
+        stack = [cell]
+        seen.add(cell)
+        while stack:
+            row, col = stack.pop()
+            if model.get_cell_value(row, col) != 0:
+                continue
+            for neighbour in neighbours(row, col):
+                if neighbour not in seen and neighbour not in model.mines:
+                    seen.add(neighbour)
+                    stack.append(neighbour)
+
+    for row in range(rows):
+        for col in range(cols):
+            if (row, col) not in seen and (row, col) not in model.mines:
+                clicks += 1
+    return clicks
+
+
+class GameResult:
+    """Outcome and timings of one bot game"""
+
+    def __init__(self, won: bool, moves: int, policy_seconds: float, engine_seconds: float, bbbv: int):
+        self.won = won
+        self.moves = moves
+        self.policy_seconds = policy_seconds
+        self.engine_seconds = engine_seconds
+        self.bbbv = bbbv
+
+    @property
+    def total_seconds(self) -> float:
+        return self.policy_seconds + self.engine_seconds
+
+
+def play_game(policy: IBotPolicy, controller: MinesweeperController, model: MinesweeperModel,
+              rows: int, cols: int, mine_count: int) -> GameResult:
+    """Play one game through controller calls, timing policy and engine separately"""
+    controller.initialize_game(rows, cols, mine_count)
+    policy.start_game(model)
+    clock = time.perf_counter
+    policy_seconds = engine_seconds = 0.0
+    moves = 0
+    bbbv = 0
+    max_moves = rows * cols * 2
+    try:
+        while model.get_game_state() not in (GameState.WON, GameState.LOST) and moves < max_moves:
+            start = clock()
+            move_type, row, col = policy.choose_move(model)
+            chosen = clock()
+            if move_type == MoveType.FLAG:
+                controller.on_cell_right_click(row, col)
+            else:
+                controller.on_cell_left_click(row, col)
+            policy_seconds += chosen - start
+            engine_seconds += clock() - chosen
+            moves += 1
+            if moves == 1:
+                bbbv = board_3bv(model)
+    finally:
+        policy.end_game()
+    return GameResult(model.get_game_state() == GameState.WON, moves, policy_seconds, engine_seconds, bbbv)
+
+
+def run_batch(policy_name: str, difficulty: str, games: int, seed: int,
+              transposition_cache: Optional[TranspositionCache] = None) -> Dict[str, float]:
+    """Play a seeded batch and summarize it"""
+    rows, cols, mine_count = DIFFICULTY_PRESETS[difficulty]
+    policy = POLICIES[policy_name](seed, transposition_cache)
+    model = MinesweeperModel()
+    controller = MinesweeperController(model, HeadlessView())
+
+    results: List[GameResult] = []
+    for game in range(games):
+        # Same boards for every policy: one generator stream per game
+        model.rng = game_rng(seed, game)
+        results.append(play_game(policy, controller, model, rows, cols, mine_count))
+
+    moves = sum(result.moves for result in results)
+    won = [result for result in results if result.won]
+    metrics = {
+        'games': games,
+        'wins': len(won),
+        'win_rate': len(won) / games if games else 0.0,
+        'mean_move_ms': sum(result.total_seconds for result in results) / moves * 1000.0 if moves else 0.0,
+        'mean_policy_ms': sum(result.policy_seconds for result in results) / moves * 1000.0 if moves else 0.0,
+        'mean_engine_ms': sum(result.engine_seconds for result in results) / moves * 1000.0 if moves else 0.0,
+        'mean_game_ms': sum(result.total_seconds for result in results) / games * 1000.0 if games else 0.0,
+        # 3BV/s is only meaningful for cleared boards
+        'mean_3bv_per_s': (sum(result.bbbv / result.total_seconds for result in won) / len(won)) if won else 0.0,
+    }
+    if transposition_cache is not None:
+        metrics['cache_hit_rate'] = transposition_cache.hit_rate()
+    return metrics
+
+
+def find_regressions(report: Dict, baseline: Dict, threshold: float,
+                     win_rate_tolerance: float) -> List[str]:
+    """Compare a report with a baseline; return a message per regression"""
+    messages = []
+    for difficulty, policies in report.items():
+        for policy_name, metrics in policies.items():
+            old = baseline.get(difficulty, {}).get(policy_name)
+            if old is None:
+                continue
+            for metric in TIMING_METRICS:
+                if old.get(metric) and metrics[metric] > old[metric] * (1 + threshold / 100.0):
+                    change = (metrics[metric] / old[metric] - 1) * 100.0
+                    messages.append(f"{difficulty}/{policy_name}: {metric} {old[metric]:.3f} -> "
+                                    f"{metrics[metric]:.3f} (+{change:.1f}%)")
+            if metrics['win_rate'] < old['win_rate'] - win_rate_tolerance:
+                messages.append(f"{difficulty}/{policy_name}: win_rate {old['win_rate']:.3f} -> "
+                                f"{metrics['win_rate']:.3f}")
+    return messages
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare auto-play policies on seeded game batches")
+    parser.add_argument('--policies', nargs='+', default=sorted(POLICIES), choices=sorted(POLICIES))
+    parser.add_argument('--difficulties', nargs='+', default=list(DIFFICULTY_PRESETS),
+                        choices=list(DIFFICULTY_PRESETS))
+    parser.add_argument('--games', type=int, default=50)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--output', metavar='PATH', help="write the JSON report to PATH")
+    parser.add_argument('--baseline', metavar='PATH', help="earlier report to check for regressions")
+    parser.add_argument('--threshold', type=float, default=10.0,
+                        help="allowed slowdown in percent before a timing counts as regressed")
+    parser.add_argument('--win-rate-tolerance', type=float, default=0.02)
+    parser.add_argument('--transposition-cache', type=int, default=0, metavar='SIZE',
+                        help="share a transposition cache of SIZE positions per batch (0 = off)")
+    args = parser.parse_args(argv)
+
+    report: Dict[str, Dict[str, Dict[str, float]]] = {}
+    print(f"{'difficulty':12s} {'policy':14s} {'win rate':>8s} {'ms/move':>9s} {'ms/game':>10s} {'3BV/s':>9s}")
+    for difficulty in args.difficulties:
+        report[difficulty] = {}
+        for policy_name in args.policies:
+            cache = TranspositionCache(args.transposition_cache) if args.transposition_cache else None
+            metrics = run_batch(policy_name, difficulty, args.games, args.seed, cache)
+            report[difficulty][policy_name] = metrics
+            print(f"{difficulty:12s} {policy_name:14s} {metrics['win_rate']:8.1%} {metrics['mean_move_ms']:9.3f} "
+                  f"{metrics['mean_game_ms']:10.2f} {metrics['mean_3bv_per_s']:9.1f}"
+                  + (f"  cache hits {metrics['cache_hit_rate']:.1%}" if cache else ""))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = find_regressions(report, baseline, args.threshold, args.win_rate_tolerance)
+        for message in regressions:
+            print(f"REGRESSION {message}")
+        if regressions:
+            return 1
+        print("No regressions against baseline")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+import random
+from abc import ABC, abstractmethod
+from enum import Enum
+from typing import Deque, List, Optional, Set, Tuple
+from collections import deque
+
+from interfaces.game_interfaces import CellState
+from models.minesweeper_model import MinesweeperModel
+from analysis.probability import ProbabilityEngine
+from analysis.transposition import TranspositionCache
+
+Cell = Tuple[int, int]
+
+
+class MoveType(Enum):
+    REVEAL = "reveal"
+    FLAG = "flag"
+
+
+Move = Tuple[MoveType, int, int]
+
+
+class IBotPolicy(ABC):
+    """Interface for auto-play strategies; policies only read visible state.
+
+    Every policy is constructed as Policy(seed=None, transposition_cache=None),
+    so the harness can build any entry of POLICIES the same way. Policies with
+    nothing to cache accept and ignore the cache.
+    """
+
+    name = "policy"
+
+    def start_game(self, model: MinesweeperModel) -> None:
+        """Called after a new game has been initialized"""
+        pass
+
+    def end_game(self) -> None:
+        """Called when the game is over"""
+        pass
+
+    @abstractmethod
+    def choose_move(self, model: MinesweeperModel) -> Move:
+        """Pick the next move for the current board"""
+        pass
+
+
+def hidden_cells(model: MinesweeperModel) -> List[Cell]:
+    """Get all cells that are neither revealed nor flagged"""
+    return [(r, c) for r in range(model.rows) for c in range(model.cols)
+            if model.get_cell_state(r, c) == CellState.HIDDEN]
+
+
+def find_certain_cells(model: MinesweeperModel) -> Tuple[Set[Cell], Set[Cell]]:
+    """Apply the single-number rules to every revealed number.
+
+    Returns (safe cells, mine cells): when a number already has as many flags
+    as its value, its other hidden neighbours are safe; when its unflagged
+    hidden neighbours are exactly the mines still missing, they are mines.
+    """
+    rows, cols = model.rows, model.cols
+    safe: Set[Cell] = set()
+    mines: Set[Cell] = set()
+    for row in range(rows):
+        for col in range(cols):
+            if model.get_cell_state(row, col) != CellState.REVEALED:
+                continue
+            value = model.get_cell_value(row, col)
+            if value <= 0:
+                continue
+            hidden = []
+            flagged = 0
+            for r in range(max(0, row - 1), min(rows, row + 2)):
+                for c in range(max(0, col - 1), min(cols, col + 2)):
+                    state = model.get_cell_state(r, c)
+                    if state == CellState.HIDDEN:
+                        hidden.append((r, c))
+                    elif state == CellState.FLAGGED:
+                        flagged += 1
+            if not hidden:
+                continue
+            if flagged == value:
+                safe.update(hidden)
+            elif value - flagged == len(hidden):
+                mines.update(hidden)
+    return safe, mines
+
+
+class RandomPolicy(IBotPolicy):
+    """Reveals a uniformly random hidden cell every move"""
+
+    name = "random"
+
+    def __init__(self, seed: Optional[int] = None, transposition_cache: Optional[TranspositionCache] = None):
+        """Create the policy; transposition_cache is ignored, random play has nothing worth caching"""
+        self.rng = random.Random(seed)
+
+    def choose_move(self, model: MinesweeperModel) -> Move:
+        """Pick the next move for the current board"""
+        row, col = self.rng.choice(hidden_cells(model))
+        return MoveType.REVEAL, row, col
+
+
+class DeterministicPolicy(IBotPolicy):
+    """Plays only certain moves from the single-number rules.
+
+    Opens in the centre and guesses a random hidden cell only when no
+    certain move is left. Deductions can be shared through a transposition
+    cache.
+    """
+
+    name = "deterministic"
+
+    def __init__(self, seed: Optional[int] = None, transposition_cache: Optional[TranspositionCache] = None):
+        self.rng = random.Random(seed)
+        self.transposition_cache = transposition_cache
+
+    def _certain_cells(self, model: MinesweeperModel) -> Tuple[Set[Cell], Set[Cell]]:
+        """Get find_certain_cells() for the position, from the cache when possible"""
+        cache = self.transposition_cache
+        if cache is None:
+            return find_certain_cells(model)
+        key = ('certain', model.get_position_key())
+        result = cache.get(key)
+        if result is None:
+            result = find_certain_cells(model)
+            cache.put(key, result)
+        return result
+
+    def choose_move(self, model: MinesweeperModel) -> Move:
+        """Pick the next move for the current board"""
+        if model.first_click:
+            return MoveType.REVEAL, model.rows // 2, model.cols // 2
+        safe, mines = self._certain_cells(model)
+        if mines:
+            row, col = min(mines)
+            return MoveType.FLAG, row, col
+        if safe:
+            row, col = min(safe)
+            return MoveType.REVEAL, row, col
+        row, col = self.rng.choice(hidden_cells(model))
+        return MoveType.REVEAL, row, col
+
+
+class ProbabilityGreedyPolicy(IBotPolicy):
+    """Always reveals the hidden cell with the lowest exact mine probability"""
+
+    name = "probability"
+
+    def __init__(self, seed: Optional[int] = None, transposition_cache: Optional[TranspositionCache] = None):
+        self.rng = random.Random(seed)
+        self.transposition_cache = transposition_cache
+        self.engine: Optional[ProbabilityEngine] = None
+        self._safe_queue: Deque[Cell] = deque()
+
+    def start_game(self, model: MinesweeperModel) -> None:
+        """Called after a new game has been initialized"""
+        self.end_game()
+        self.engine = ProbabilityEngine(model, self.transposition_cache)
+
+    def end_game(self) -> None:
+        """Called when the game is over"""
+        if self.engine is not None:
+            self.engine.detach()
+            self.engine = None
+        self._safe_queue.clear()
+
+    def choose_move(self, model: MinesweeperModel) -> Move:
+        """Pick the next move for the current board"""
+        if model.first_click:
+            return MoveType.REVEAL, model.rows // 2, model.cols // 2
+
+        # Cells proven safe stay safe, so use them up before recomputing
+        while self._safe_queue:
+            row, col = self._safe_queue.popleft()
+            if model.get_cell_state(row, col) == CellState.HIDDEN:
+                return MoveType.REVEAL, row, col
+
+        probabilities = self.engine.get_probabilities()
+        candidates = [(p, cell) for cell, p in probabilities.items()
+                      if model.get_cell_state(*cell) == CellState.HIDDEN]
+        lowest = min(p for p, _ in candidates)
+        best = sorted(cell for p, cell in candidates if p == lowest)
+        if lowest == 0:
+            self._safe_queue.extend(best[1:])
+            row, col = best[0]
+        else:
+            row, col = self.rng.choice(best)
+        return MoveType.REVEAL, row, col
+
+
+# Policies available to the harness by name
+POLICIES = {
+    RandomPolicy.name: RandomPolicy,
+    DeterministicPolicy.name: DeterministicPolicy,
+    ProbabilityGreedyPolicy.name: ProbabilityGreedyPolicy,
+}
@@ -0,0 +1,323 @@
+from math import comb
+from typing import Dict, FrozenSet, List, Optional, Tuple
+
+from interfaces.game_interfaces import IGameObserver, CellState, GameState
+from models.minesweeper_model import MinesweeperModel
+from analysis.transposition import TranspositionCache
+
+Cell = Tuple[int, int]
+
+# One constraint: (hidden neighbour cells, number of mines among them)
+Constraint = Tuple[Tuple[Cell, ...], int]
+
+# Configuration counts of a component by mine total:
+# k -> (number of configurations, per-cell count of configurations with a mine there)
+ComponentCounts = Dict[int, Tuple[int, Tuple[int, ...]]]
+
+# Most components an engine keeps counts for; least recently used ones go first
+COMPONENT_CACHE_SIZE = 10000
+
+
+class Component:
+    """Connected set of frontier cells linked by shared constraints"""
+
+    def __init__(self, cells: Tuple[Cell, ...], constraints: Tuple[Constraint, ...]):
+        self.cells = cells
+        self.constraints = constraints
+        # Cache key: the same constraints always give the same counts
+        self.key: FrozenSet[Constraint] = frozenset(constraints)
+
+
+def count_configurations(cells: Tuple[Cell, ...], constraints: Tuple[Constraint, ...]) -> ComponentCounts:
+    """Count valid mine placements of a component, grouped by number of mines.
+
+    Backtracks over the cells in order and memoizes on (cell index, remaining
+    mine need of every constraint), so identical sub-problems are solved once.
+    """
+    index_of = {cell: i for i, cell in enumerate(cells)}
+    cell_constraints: List[List[int]] = [[] for _ in cells]
+    last_index = []
+    for c, (members, _) in enumerate(constraints):
+        positions = [index_of[cell] for cell in members]
+        for position in positions:
+            cell_constraints[position].append(c)
+        last_index.append(max(positions))
+    # Constraints that must be fully satisfied once a cell index is assigned
+    closing: List[List[int]] = [[] for _ in cells]
+    for c, position in enumerate(last_index):
+        closing[position].append(c)
+    # Unassigned members left per constraint before assigning cell i
+    left_before = [[0] * len(constraints) for _ in range(len(cells) + 1)]
+    for i in range(len(cells) - 1, -1, -1):
+        left_before[i] = list(left_before[i + 1])
+        for c in cell_constraints[i]:
+            left_before[i][c] += 1
+
+    size = len(cells)
+    memo: Dict[Tuple[int, Tuple[int, ...]], ComponentCounts] = {}
+
+    def solve(i: int, remaining: Tuple[int, ...]) -> ComponentCounts:
+        if i == size:
+            return {0: (1, ())}
+        key = (i, remaining)
+        cached = memo.get(key)
+        if cached is not None:
+            return cached
+
+        result: Dict[int, Tuple[int, List[int]]] = {}
+        left_after = left_before[i + 1]
+        for mine in (0, 1):
+            updated = list(remaining)
+            valid = True
+            for c in cell_constraints[i]:
+                updated[c] -= mine
+                if updated[c] < 0 or updated[c] > left_after[c]:
+                    valid = False
+                    break
+            if not valid:
+                continue
+            for c in closing[i]:
+                if updated[c] != 0:
+                    valid = False
+                    break
+            if not valid:
+                continue
+
+            for k, (count, tail) in solve(i + 1, tuple(updated)).items():
+                total = k + mine
+                entry = result.get(total)
+                if entry is None:
+                    entry = result[total] = (0, [0] * (size - i))
+                per_cell = entry[1]
+                per_cell[0] += count * mine
+                for j, tail_count in enumerate(tail):
+                    per_cell[j + 1] += tail_count
+                result[total] = (entry[0] + count, per_cell)
+
+        frozen = {k: (count, tuple(per_cell)) for k, (count, per_cell) in result.items()}
+        memo[key] = frozen
+        return frozen
+
+    initial = tuple(mines for _, mines in constraints)
+    return solve(0, initial)
+
+
+def _convolve(a: Dict[int, int], b: Dict[int, int]) -> Dict[int, int]:
+    """Multiply two mine-count polynomials"""
+    result: Dict[int, int] = {}
+    for ka, va in a.items():
+        for kb, vb in b.items():
+            result[ka + kb] = result.get(ka + kb, 0) + va * vb
+    return result
+
+
+class ProbabilityEngine(IGameObserver):
+    """Exact per-cell mine probabilities from the visible state of a model.
+
+    The frontier (hidden cells next to revealed numbers) is split into
+    independent components, each counted separately and cached by its
+    constraints, and the results are combined with binomial weights for
+    the unconstrained interior cells. Flags are treated as unknown cells.
+    The component cache is a bounded LRU, so an engine that follows a model
+    over many games does not grow without limit. With a transposition cache,
+    whole results are shared between all engines that meet the same position.
+    """
+
+    def __init__(self, model: MinesweeperModel, transposition_cache: Optional[TranspositionCache] = None,
+                 component_cache_size: int = COMPONENT_CACHE_SIZE):
+        self.model = model
+        self.transposition_cache = transposition_cache
+        # Counts by component constraints (a frozenset of Constraint)
+        self.component_cache = TranspositionCache(component_cache_size)
+        self._result: Optional[Dict[Cell, float]] = None
+        model.add_observer(self)
+
+    def detach(self) -> None:
+        """Stop observing the model"""
+        self.model.remove_observer(self)
+
+    @property
+    def cache_hits(self) -> int:
+        """Component counts reused from the cache"""
+        return self.component_cache.hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Component counts that had to be computed"""
+        return self.component_cache.misses
+
+    # Observer methods - any visible change invalidates the last result
+    def on_game_state_changed(self, new_state: GameState) -> None:
+        """Called when game state changes"""
+        self._result = None
+
+    def on_cell_updated(self, row: int, col: int, state: CellState, value: int) -> None:
+        """Called when cell is updated"""
+        if state == CellState.REVEALED:
+            self._result = None
+
+    def on_status_updated(self, flagged_count: int, mine_count: int) -> None:
+        """Called when status should be updated"""
+        pass
+
+    def _hidden_and_constraints(self) -> Tuple[List[Cell], List[Constraint]]:
+        """Collect hidden cells and one constraint per revealed number bordering them"""
+        model = self.model
+        rows, cols = model.rows, model.cols
+        hidden: List[Cell] = []
+        constraints: List[Constraint] = []
+        for row in range(rows):
+            for col in range(cols):
+                state = model.get_cell_state(row, col)
+                if state != CellState.REVEALED:
+                    hidden.append((row, col))
+                    continue
+                neighbours = tuple(
+                    (r, c)
+                    for r in range(max(0, row - 1), min(rows, row + 2))
+                    for c in range(max(0, col - 1), min(cols, col + 2))
+                    if model.get_cell_state(r, c) != CellState.REVEALED
+                )
+                if neighbours:
+                    constraints.append((neighbours, model.get_cell_value(row, col)))
+        return hidden, constraints
+
+    def find_components(self) -> List[Component]:
+        """Split the frontier into components that share no constraint"""
+        _, constraints = self._hidden_and_constraints()
+        return self._split(constraints)
+
+    @staticmethod
+    def _split(constraints: List[Constraint]) -> List[Component]:
+        parent: Dict[Cell, Cell] = {}
+
+        def find(cell: Cell) -> Cell:
+            while parent[cell] != cell:
+                parent[cell] = parent[parent[cell]]
+                cell = parent[cell]
+            return cell
+
+        for members, _ in constraints:
+            for cell in members:
+                parent.setdefault(cell, cell)
+            root = find(members[0])
+            for cell in members[1:]:
+                other = find(cell)
+                if other != root:
+                    parent[other] = root
+
+        cells_by_root: Dict[Cell, List[Cell]] = {}
+        for cell in parent:
+            cells_by_root.setdefault(find(cell), []).append(cell)
+        constraints_by_root: Dict[Cell, List[Constraint]] = {}
+        for constraint in constraints:
+            constraints_by_root.setdefault(find(constraint[0][0]), []).append(constraint)
+
+        return [Component(ProbabilityEngine._counting_order(cells_by_root[root], constraints_by_root[root]),
+                          tuple(sorted(constraints_by_root[root])))
+                for root in cells_by_root]
+
+    @staticmethod
+    def _counting_order(cells: List[Cell], constraints: List[Constraint]) -> Tuple[Cell, ...]:
+        """Order cells breadth-first along shared constraints.
+
+        Walking the frontier this way keeps few constraints open at a time, so
+        the counting memo stays small (an order of magnitude faster than
+        row-major on long expert-board frontiers).
+        """
+        linked: Dict[Cell, set] = {cell: set() for cell in cells}
+        for members, _ in constraints:
+            for cell in members:
+                linked[cell].update(members)
+        order = [min(cells)]
+        seen = {order[0]}
+        for cell in order:
+            for other in sorted(linked[cell] - seen):
+                seen.add(other)
+                order.append(other)
+        return tuple(order)
+
+    def _count(self, component: Component) -> ComponentCounts:
+        """Get configuration counts for a component, reusing cached results"""
+        counts = self.component_cache.get(component.key)
+        if counts is None:
+            counts = count_configurations(component.cells, component.constraints)
+            self.component_cache.put(component.key, counts)
+        return counts
+
+    def get_probabilities(self) -> Dict[Cell, float]:
+        """Get the mine probability of every hidden (or flagged) cell"""
+        if self._result is None:
+            cache = self.transposition_cache
+            if cache is None or self.model.first_click:
+                self._result = self._compute()
+            else:
+                key = ('probabilities', self.model.get_position_key())
+                self._result = cache.get(key)
+                if self._result is None:
+                    self._result = self._compute()
+                    cache.put(key, self._result)
+        return self._result
+
+    def _compute(self) -> Dict[Cell, float]:
+        model = self.model
+        hidden, constraints = self._hidden_and_constraints()
+        mine_count = model.get_mine_count()
+        if not hidden:
+            return {}
+        if model.first_click or not constraints:
+            uniform = mine_count / len(hidden)
+            return {cell: uniform for cell in hidden}
+
+        components = self._split(constraints)
+        frontier = set()
+        for component in components:
+            frontier.update(component.cells)
+        interior = [cell for cell in hidden if cell not in frontier]
+        interior_count = len(interior)
+
+        counts = [self._count(component) for component in components]
+        polynomials = [{k: entry[0] for k, entry in c.items()} for c in counts]
+
+        # Weight of each possible frontier mine total: the interior takes the rest
+        def interior_weight(frontier_mines: int) -> int:
+            rest = mine_count - frontier_mines
+            if rest < 0 or rest > interior_count:
+                return 0
+            return comb(interior_count, rest)
+
+        # Products of all polynomials except one, via prefix/suffix products
+        prefix = [{0: 1}]
+        for polynomial in polynomials:
+            prefix.append(_convolve(prefix[-1], polynomial))
+        suffix = [{0: 1}]
+        for polynomial in reversed(polynomials):
+            suffix.append(_convolve(suffix[-1], polynomial))
+        suffix.reverse()
+
+        total_polynomial = prefix[-1]
+        total_weight = sum(ways * interior_weight(k) for k, ways in total_polynomial.items())
+        if total_weight == 0:
+            # Inconsistent with the visible board (cannot happen in a real game)
+            return {cell: 0.0 for cell in hidden}
+
+        probabilities: Dict[Cell, float] = {}
+        for index, component in enumerate(components):
+            others = _convolve(prefix[index], suffix[index + 1])
+            mine_weights = [0] * len(component.cells)
+            for k, (_, per_cell) in counts[index].items():
+                weight = sum(ways * interior_weight(k + k_others) for k_others, ways in others.items())
+                if weight:
+                    for position, cell_count in enumerate(per_cell):
+                        mine_weights[position] += cell_count * weight
+            for cell, mine_weight in zip(component.cells, mine_weights):
+                probabilities[cell] = mine_weight / total_weight
+
+        if interior_count:
+            interior_mines = sum(ways * interior_weight(k) * (mine_count - k)
+                                 for k, ways in total_polynomial.items())
+            interior_probability = interior_mines / (total_weight * interior_count)
+            for cell in interior:
+                probabilities[cell] = interior_probability
+
+        return probabilities
@@ -0,0 +1,47 @@
+import random
+
+from utils.rng import game_rng
+from interfaces.game_interfaces import IGameObserver, CellState, GameState
+from models.minesweeper_model import MinesweeperModel, DIFFICULTY_PRESETS
+
+# Board presets shared by the benchmarks: name -> (rows, cols, mines)
+BOARD_PRESETS = DIFFICULTY_PRESETS
+
+
+class NullObserver(IGameObserver):
+    """Observer that ignores every event, used to measure pure fan-out cost"""
+
+    def on_game_state_changed(self, new_state: GameState) -> None:
+        pass
+
+    def on_cell_updated(self, row: int, col: int, state: CellState, value: int) -> None:
+        pass
+
+    def on_status_updated(self, flagged_count: int, mine_count: int) -> None:
+        pass
+
+
+def new_model(rows: int, cols: int, mine_count: int, seed: int = 0) -> MinesweeperModel:
+    """Create an initialized model with a seeded generator for repeatable boards"""
+    model = MinesweeperModel(rng=game_rng(seed))
+    model.initialize_game(rows, cols, mine_count)
+    return model
+
+
+def started_model(rows: int, cols: int, mine_count: int, seed: int = 0) -> MinesweeperModel:
+    """Create a model whose mines are already placed by a first click in the centre"""
+    model = new_model(rows, cols, mine_count, seed)
+    model.reveal_cell(rows // 2, cols // 2)
+    return model
+
+
+def midgame_model(rows: int, cols: int, mine_count: int, safe_reveals: int, seed: int = 0) -> MinesweeperModel:
+    """Create a started model with extra safe cells revealed (chosen with knowledge of the mines)"""
+    model = started_model(rows, cols, mine_count, seed)
+    rng = random.Random(seed)
+    safe = [(r, c) for r in range(rows) for c in range(cols)
+            if (r, c) not in model.mines and (r, c) not in model.revealed]
+    rng.shuffle(safe)
+    for row, col in safe[:safe_reveals]:
+        model.reveal_cell(row, col)
+    return model
@@ -0,0 +1,14 @@
+import os
+import sys
+
+import pytest
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def no_kivy_imports():
+    """Benchmarks must stay headless - fail loudly if anything pulls in Kivy"""
+    yield
+    assert 'kivy' not in sys.modules, "benchmark imported Kivy"
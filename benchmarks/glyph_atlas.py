@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Glyph atlas benchmark: texture creations and end-of-game reveal time, text vs atlas
+
+Needs Kivy and a display. Each mode plays the same seeded board to a loss on
+a large grid and reports how many textures were created and how long the
+losing click (which reveals every mine) took, including the frame that
+draws it.
+"""
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def measure(use_glyph_atlas: bool, rows: int, cols: int, mine_count: int, seed: int) -> Dict[str, float]:
+    """Play one seeded game to a loss and collect texture and timing numbers"""
+    from kivy.clock import Clock
+    from kivy.core.text import LabelBase
+    from controllers.game_controller import MinesweeperController
+    from models.minesweeper_model import MinesweeperModel
+    from utils.rng import game_rng
+    from views.game_view import MinesweeperView
+
+    view = MinesweeperView(controller=None, rows=rows, cols=cols, use_glyph_atlas=use_glyph_atlas)
+    view_impl = view.view_impl
+    model = MinesweeperModel(rng=game_rng(seed))
+    controller = MinesweeperController(model, view_impl)
+    view_impl.set_controller(controller)
+
+    # Without the atlas, every label texture refresh is a new rasterization
+    label_textures = [0]
+    for cell in view_impl.cells.values():
+        cell.bind(texture=lambda *args: label_textures.__setitem__(0, label_textures[0] + 1))
+
+    # Every text rasterization (cell labels, atlas glyphs, status and popup) goes through refresh()
+    label_renders = [0]
+    refresh = LabelBase.refresh
+
+    def counting_refresh(label):
+        label_renders[0] += 1
+        return refresh(label)
+
+    LabelBase.refresh = counting_refresh
+    try:
+        controller.initialize_game(rows, cols, mine_count)
+        controller.on_cell_left_click(rows // 2, cols // 2)
+        Clock.tick()
+
+        # Flag a few mines so flags are drawn too, then step on an unflagged one
+        mines = sorted(model.get_all_mines())
+        for row, col in mines[:10]:
+            controller.on_cell_right_click(row, col)
+        Clock.tick()
+
+        start = time.perf_counter()
+        controller.on_cell_left_click(*mines[-1])
+        Clock.tick()
+        reveal_seconds = time.perf_counter() - start
+    finally:
+        LabelBase.refresh = refresh
+
+    created = label_textures[0]
+    if use_glyph_atlas:
+        created += sum(atlas.created for atlas in view_impl.cell_renderer.get_glyph_atlases())
+    return {'textures_created': created, 'label_renders': label_renders[0],
+            'end_of_game_reveal_ms': reveal_seconds * 1000.0}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare cell text rendering with the glyph atlas")
+    parser.add_argument('--rows', type=int, default=30)
+    parser.add_argument('--cols', type=int, default=30)
+    parser.add_argument('--mines', type=int, default=200)
+    parser.add_argument('--seed', type=int, default=7)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('KIVY_NO_ARGS', '1')
+    from kivy.app import App
+    from kivy.uix.widget import Widget
+
+    class GlyphAtlasBenchmarkApp(App):
+        def build(self):
+            return Widget()
+
+        def on_start(self):
+            for label, use_glyph_atlas in (('text (before)', False), ('atlas (after)', True)):
+                result = measure(use_glyph_atlas, args.rows, args.cols, args.mines, args.seed)
+                print(f"{label:14s} textures created: {result['textures_created']:6d}   "
+                      f"label renders: {result['label_renders']:6d}   "
+                      f"end-of-game reveal: {result['end_of_game_reveal_ms']:8.2f} ms")
+            self.stop()
+
+    GlyphAtlasBenchmarkApp().run()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+"""
+Leaderboard load benchmark: bulk insert throughput and query latency at scale
+
+Fills a fresh database with synthetic games (win times roughly log-normal,
+players drawn from a fixed pool), then times each leaderboard query and
+the cost of handing a record to the background writer.
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Callable, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.minesweeper_model import DIFFICULTY_PRESETS
+from storage.leaderboard import GameRecord, LeaderboardStore, LeaderboardWriter
+
+# Median win time in seconds per difficulty
+MEDIAN_SECONDS = {'beginner': 15.0, 'intermediate': 70.0, 'expert': 200.0}
+
+
+def synthetic_games(count: int, players: int, seed: int):
+    """Yield count random game records"""
+    rng = random.Random(seed)
+    difficulties = list(DIFFICULTY_PRESETS)
+    start = time.time() - 365 * 86400
+    for index in range(count):
+        difficulty = rng.choice(difficulties)
+        yield GameRecord(f"player{rng.randrange(players)}", difficulty, rng.random() < 0.4,
+                         rng.lognormvariate(0, 0.6) * MEDIAN_SECONDS[difficulty], start + index)
+
+
+def time_query(query: Callable[[], object], repeats: int) -> float:
+    """Median milliseconds of a query"""
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        query()
+        samples.append((time.perf_counter() - start) * 1000.0)
+    return statistics.median(samples)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure leaderboard insert throughput and query latency")
+    parser.add_argument('--rows', type=int, default=10000000)
+    parser.add_argument('--players', type=int, default=100000)
+    parser.add_argument('--batch', type=int, default=50000)
+    parser.add_argument('--repeats', type=int, default=50)
+    parser.add_argument('--path', help="database file (default: a temporary file)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = args.path or os.path.join(directory, 'leaderboard.db')
+        store = LeaderboardStore(path)
+
+        start = time.perf_counter()
+        batch: List[GameRecord] = []
+        for record in synthetic_games(args.rows, args.players, args.seed):
+            batch.append(record)
+            if len(batch) == args.batch:
+                store.add_games(batch)
+                batch = []
+        if batch:
+            store.add_games(batch)
+        elapsed = time.perf_counter() - start
+        print(f"inserted {args.rows} games in {elapsed:.1f} s ({args.rows / elapsed:,.0f} rows/s)")
+
+        rng = random.Random(args.seed + 1)
+        queries = {
+            'top 10 (expert)': lambda: store.top_times('expert', 10),
+            'percentile rank (expert)': lambda: store.percentile_rank('expert', rng.uniform(50, 600)),
+            'p50 time (expert)': lambda: store.time_at_percentile('expert', 50),
+            'p99 time (expert)': lambda: store.time_at_percentile('expert', 99),
+            'personal best': lambda: store.personal_best(f"player{rng.randrange(args.players)}", 'expert'),
+            'recent games': lambda: store.recent_games(f"player{rng.randrange(args.players)}", 10),
+        }
+        for name, query in queries.items():
+            print(f"{name:26s} {time_query(query, args.repeats):8.3f} ms")
+        store.close()
+
+        writer = LeaderboardWriter(path)
+        records = 10000
+        start = time.perf_counter()
+        for index in range(records):
+            writer.record_game('bench', 'expert', index % 2 == 0, 100.0 + index % 50)
+        submitted = time.perf_counter() - start
+        writer.flush()
+        written = time.perf_counter() - start
+        writer.close()
+        print(f"writer: {submitted / records * 1e6:.2f} us per record_game(), "
+              f"{records} records written in {written:.2f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+"""
+Neighbour table benchmark: time and allocations of neighbour walks, before and after
+
+Plays the engine's inner work for a batch of fresh boards of one shape
+(count every cell's adjacent mines, then open the board from the centre)
+three ways:
+
+- range:  range(max(0, row-1), min(rows, row+2)) loops over (r, c) tuples,
+          as the model and game.py did originally
+- tuples: a tuple of neighbour indices per cell, rebuilt for every board
+- csr:    the shared per-shape NeighbourTable (array('i') CSR) used by BoardCore
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.board_core import NEIGHBOUR_OFFSETS, neighbour_table
+from utils.rng import game_rng
+
+
+def mine_layout(rows: int, cols: int, mine_count: int, seed: int) -> List[int]:
+    """Seeded flat mine indices, keeping the centre and its neighbours free"""
+    centre = (rows // 2) * cols + cols // 2
+    free = {centre + dr * cols + dc for dr, dc in NEIGHBOUR_OFFSETS} | {centre}
+    drawn = game_rng(seed).sample(range(rows * cols), mine_count + len(free))
+    return [index for index in drawn if index not in free][:mine_count]
+
+
+def play_range(rows: int, cols: int, mines: List[int]) -> int:
+    """Original style: range loops and (row, col) tuples"""
+    mine_set = {divmod(index, cols) for index in mines}
+    counts = {}
+    for row in range(rows):
+        for col in range(cols):
+            count = 0
+            for r in range(max(0, row - 1), min(rows, row + 2)):
+                for c in range(max(0, col - 1), min(cols, col + 2)):
+                    if (r, c) in mine_set:
+                        count += 1
+            counts[(row, col)] = count
+    start = (rows // 2, cols // 2)
+    revealed = {start}
+    stack = [start]
+    while stack:
+        row, col = stack.pop()
+        if counts[(row, col)]:
+            continue
+        for r in range(max(0, row - 1), min(rows, row + 2)):
+            for c in range(max(0, col - 1), min(cols, col + 2)):
+                if (r, c) not in revealed and (r, c) not in mine_set:
+                    revealed.add((r, c))
+                    stack.append((r, c))
+    return len(revealed)
+
+
+def play_tuples(rows: int, cols: int, mines: List[int]) -> int:
+    """Per-board tuple of neighbour indices for every cell"""
+    table = [tuple((row + dr) * cols + col + dc for dr, dc in NEIGHBOUR_OFFSETS
+                   if 0 <= row + dr < rows and 0 <= col + dc < cols)
+             for row in range(rows) for col in range(cols)]
+    return _play_flat(rows * cols, (rows // 2) * cols + cols // 2, mines, table.__getitem__)
+
+
+def play_csr(rows: int, cols: int, mines: List[int]) -> int:
+    """Shared CSR table, sliced per cell"""
+    table = neighbour_table(rows, cols)
+    starts, indices = table.starts, table.indices
+    return _play_flat(rows * cols, (rows // 2) * cols + cols // 2, mines,
+                      lambda index: indices[starts[index]:starts[index + 1]])
+
+
+def _play_flat(size: int, start: int, mines: List[int], neighbours: Callable) -> int:
+    """Count adjacent mines from the mines outward, then open from start"""
+    is_mine = bytearray(size)
+    counts = bytearray(size)
+    for index in mines:
+        is_mine[index] = 1
+        for neighbour in neighbours(index):
+            counts[neighbour] += 1
+    revealed = bytearray(size)
+    revealed[start] = 1
+    opened = 1
+    stack = [start]
+    while stack:
+        index = stack.pop()
+        if counts[index]:
+            continue
+        for neighbour in neighbours(index):
+            if not revealed[neighbour] and not is_mine[neighbour]:
+                revealed[neighbour] = 1
+                opened += 1
+                stack.append(neighbour)
+    return opened
+
+
+APPROACHES: Dict[str, Callable[[int, int, List[int]], int]] = {
+    'range': play_range,
+    'tuples': play_tuples,
+    'csr': play_csr,
+}
+
+
+def measure(play: Callable, rows: int, cols: int, layouts: List[List[int]]) -> Tuple[float, float, float]:
+    """Return (seconds per board, mean and max peak traced bytes per board)"""
+    neighbour_table.cache_clear()
+    peaks = []
+    tracemalloc.start()
+    for mines in layouts:
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        play(rows, cols, mines)
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    neighbour_table.cache_clear()
+    start = time.perf_counter()
+    for mines in layouts:
+        play(rows, cols, mines)
+    seconds = (time.perf_counter() - start) / len(layouts)
+    return seconds, sum(peaks) / len(peaks), max(peaks)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare neighbour walks: range loops, per-board tuples, shared CSR")
+    parser.add_argument('--shapes', nargs='+', default=['9x9:10', '16x30:99', '200x200:6000'],
+                        help="board shapes as ROWSxCOLS:MINES")
+    parser.add_argument('--boards', type=int, default=20)
+    args = parser.parse_args(argv)
+
+    # Peak bytes allocated while playing a board; the first csr board also builds the shared table
+    print(f"{'shape':14s} {'approach':8s} {'ms/board':>9s} {'mean KiB':>9s} {'max KiB':>9s}")
+    for shape in args.shapes:
+        size, mine_count = shape.split(':')
+        rows, cols = (int(part) for part in size.split('x'))
+        layouts = [mine_layout(rows, cols, int(mine_count), seed) for seed in range(args.boards)]
+        for name, play in APPROACHES.items():
+            seconds, mean_peak, max_peak = measure(play, rows, cols, layouts)
+            print(f"{shape:14s} {name:8s} {seconds * 1000:9.3f} {mean_peak / 1024:9.1f} {max_peak / 1024:9.1f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+"""
+Run the benchmark suite and gate on regressions against a saved baseline
+"""
+import argparse
+import os
+import sys
+from typing import List, Optional
+
+import pytest
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_THRESHOLD = int(os.environ.get('BENCHMARK_THRESHOLD', '10'))
+
+
+def build_pytest_args(save_baseline: bool, threshold: int, compare: Optional[str],
+                      extra: List[str]) -> List[str]:
+    """Translate our options into pytest-benchmark command line flags"""
+    args = [BENCHMARK_DIR, '--benchmark-only', '-q']
+    if save_baseline:
+        args.append('--benchmark-autosave')
+    else:
+        args.append('--benchmark-compare' + (f'={compare}' if compare else ''))
+        args.append(f'--benchmark-compare-fail=mean:{threshold}%')
+    return args + extra
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Run benchmarks with regression gating")
+    parser.add_argument('--save-baseline', action='store_true',
+                        help="record this run as the new baseline instead of comparing")
+    parser.add_argument('--threshold', type=int, default=DEFAULT_THRESHOLD,
+                        help="fail when a mean regresses by more than this percentage "
+                             "(default: $BENCHMARK_THRESHOLD or 10)")
+    parser.add_argument('--compare', metavar='RUN_ID',
+                        help="saved run to compare against (default: the latest one)")
+    args, extra = parser.parse_known_args(argv)
+    return pytest.main(build_pytest_args(args.save_baseline, args.threshold, args.compare, extra))
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+"""
+Startup-time benchmark: `python -X importtime` breakdown plus wall-clock to first frame
+"""
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import List, Optional, Tuple
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Import chains worth comparing: what the game needs vs what headless code needs
+IMPORT_TARGETS = {
+    'app': 'import views.app',
+    'headless': 'import utils.headless',
+    'main': 'import main',
+}
+
+
+def import_times(statement: str) -> List[Tuple[int, int, str]]:
+    """Run statement under -X importtime and return (self_us, cumulative_us, module) rows"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', statement],
+        cwd=REPO_DIR, capture_output=True, text=True,
+        env=dict(os.environ, KIVY_NO_ARGS='1', KIVY_NO_CONSOLELOG='1'),
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'self [us]' in line:
+            continue
+        self_us, cumulative_us, module = line[len('import time:'):].split('|')
+        rows.append((int(self_us), int(cumulative_us), module.rstrip()))
+    return rows
+
+
+def print_import_breakdown(name: str, statement: str, limit: int) -> None:
+    """Print total import time and the slowest top-level imports"""
+    rows = import_times(statement)
+    # Top-level imports are the ones without indentation in the module column
+    top_level = [row for row in rows if not row[2].startswith('  ')]
+    total_ms = sum(row[1] for row in top_level) / 1000.0
+    kivy_modules = sum(1 for row in rows if row[2].strip().startswith('kivy'))
+    print(f"[{name}] {statement!r}: {total_ms:.1f} ms, {len(rows)} modules, {kivy_modules} from kivy")
+    for self_us, cumulative_us, module in sorted(rows, key=lambda row: -row[1])[:limit]:
+        print(f"    {cumulative_us / 1000.0:8.1f} ms cumulative {self_us / 1000.0:8.1f} ms self  {module.strip()}")
+
+
+def time_to_first_frame(timeout: float) -> Optional[Tuple[float, float]]:
+    """Launch main.py until its first board frame; return (wall_clock, in_process) seconds"""
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            [sys.executable, os.path.join(REPO_DIR, 'main.py'), '--exit-after-first-frame'],
+            cwd=REPO_DIR, capture_output=True, text=True, timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        return None
+    wall_clock = time.perf_counter() - start
+    for line in result.stdout.splitlines():
+        if line.startswith('first_frame_seconds='):
+            return wall_clock, float(line.split('=', 1)[1])
+    return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure cold start of the game")
+    parser.add_argument('--runs', type=int, default=5, help="first-frame launches to average")
+    parser.add_argument('--top', type=int, default=10, help="slowest imports to list per chain")
+    parser.add_argument('--timeout', type=float, default=60.0)
+    parser.add_argument('--skip-window', action='store_true', help="only run the import breakdown")
+    args = parser.parse_args(argv)
+
+    for name, statement in IMPORT_TARGETS.items():
+        print_import_breakdown(name, statement, args.top)
+
+    if args.skip_window:
+        return
+
+    samples = []
+    for _ in range(args.runs):
+        sample = time_to_first_frame(args.timeout)
+        if sample is None:
+            print("first frame: could not start the app (no display or Kivy missing?)")
+            return
+        samples.append(sample)
+    wall_clock = sorted(sample[0] for sample in samples)
+    in_process = sorted(sample[1] for sample in samples)
+    print(f"first frame over {len(samples)} runs: "
+          f"median wall-clock {wall_clock[len(wall_clock) // 2]:.3f} s, "
+          f"median in-process {in_process[len(in_process) // 2]:.3f} s")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+import pytest
+
+from benchmarks.common import BOARD_PRESETS, new_model
+from game import MinesweeperGame
+from interfaces.game_interfaces import GameState
+from models.board_core import BoardCore
+from utils.rng import game_rng
+
+pytest.importorskip('pytest_benchmark')
+
+FRONTENDS = ('core', 'model', 'legacy')
+
+
+def clear_board(frontend, rows, cols, mine_count, seed):
+    """Play one board to a win by revealing every safe cell, through one frontend"""
+    if frontend == 'model':
+        model = new_model(rows, cols, mine_count, seed)
+        model.reveal_cell(rows // 2, cols // 2)
+        core = model.core
+        for index in range(rows * cols):
+            if not core.mines[index]:
+                model.reveal_cell(*divmod(index, cols))
+        return model.get_game_state() == GameState.WON
+    if frontend == 'legacy':
+        game = MinesweeperGame(cols, rows, mine_count, rng=game_rng(seed))
+        game.reveal_cell(cols // 2, rows // 2)
+        core = game.core
+        for index in range(rows * cols):
+            if not core.mines[index]:
+                game.reveal_cell(index % cols, index // cols)
+        return game.check_win()
+    core = BoardCore(rows, cols)
+    core.place_random_mines(game_rng(seed), mine_count, (rows // 2 * cols + cols // 2,))
+    for index in range(rows * cols):
+        if not core.mines[index]:
+            core.flood_reveal(index)
+    return core.is_cleared()
+
+
+@pytest.mark.parametrize('frontend', FRONTENDS)
+@pytest.mark.parametrize('preset', sorted(BOARD_PRESETS))
+def test_clear_board(benchmark, frontend, preset):
+    """Reveal every safe cell of a seeded preset board"""
+    rows, cols, mine_count = BOARD_PRESETS[preset]
+    assert benchmark(clear_board, frontend, rows, cols, mine_count, 3)
+
+
+@pytest.mark.parametrize('frontend', FRONTENDS)
+@pytest.mark.parametrize('size', [30, 200])
+def test_empty_board_cascade(benchmark, frontend, size):
+    """One click opening an empty board; the old recursive fills failed past ~40x40"""
+    assert benchmark.pedantic(clear_board, args=(frontend, size, size, 0, 0), rounds=5)
@@ -0,0 +1,15 @@
+import pytest
+
+from benchmarks.common import BOARD_PRESETS
+from utils.headless import run_headless_games
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize('preset', sorted(BOARD_PRESETS))
+def test_headless_games(benchmark, preset):
+    """Ten seeded random games through controller, model and a headless view"""
+    rows, cols, mine_count = BOARD_PRESETS[preset]
+
+    results = benchmark.pedantic(run_headless_games, args=(10, rows, cols, mine_count, 42), rounds=30)
+    assert len(results) == 10
@@ -0,0 +1,79 @@
+import pytest
+
+from benchmarks.common import BOARD_PRESETS, new_model, started_model
+from utils.rng import game_rng
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize('density', [0.1, 0.2, 0.5, 0.8])
+def test_place_mines(benchmark, density):
+    """Mine placement on a 30x30 board across mine densities"""
+    rows = cols = 30
+    # The first click keeps a 3x3 area free, so cap the mines accordingly
+    mine_count = min(int(rows * cols * density), rows * cols - 9)
+    model = new_model(rows, cols, mine_count)
+
+    def setup():
+        model.rng = game_rng(0)
+
+    benchmark.pedantic(model._place_mines, args=(rows // 2, cols // 2), setup=setup, rounds=50)
+    assert len(model.mines) == mine_count
+
+
+@pytest.mark.parametrize('size', [9, 16, 24, 30])
+def test_first_click_cascade(benchmark, size):
+    """First click on an empty board reveals every cell through the flood fill"""
+    def setup():
+        return (new_model(size, size, 0),), {}
+
+    def first_click(model):
+        model.reveal_cell(size // 2, size // 2)
+        return model
+
+    model = benchmark.pedantic(first_click, setup=setup, rounds=20)
+    assert len(model.revealed) == size * size
+
+
+@pytest.mark.parametrize('preset', sorted(BOARD_PRESETS))
+def test_first_click_preset(benchmark, preset):
+    """First click (mine placement plus cascade) on the standard presets"""
+    rows, cols, mine_count = BOARD_PRESETS[preset]
+
+    def setup():
+        return (new_model(rows, cols, mine_count, seed=1),), {}
+
+    def first_click(model):
+        model.reveal_cell(rows // 2, cols // 2)
+
+    benchmark.pedantic(first_click, setup=setup, rounds=50)
+
+
+@pytest.mark.parametrize('preset', sorted(BOARD_PRESETS))
+def test_get_cell_value_throughput(benchmark, preset):
+    """get_cell_value over every cell of a started board"""
+    rows, cols, mine_count = BOARD_PRESETS[preset]
+    model = started_model(rows, cols, mine_count)
+    cells = [(r, c) for r in range(rows) for c in range(cols)]
+
+    def read_all():
+        get_cell_value = model.get_cell_value
+        for row, col in cells:
+            get_cell_value(row, col)
+
+    benchmark(read_all)
+
+
+@pytest.mark.parametrize('preset', sorted(BOARD_PRESETS))
+def test_get_cell_state_throughput(benchmark, preset):
+    """get_cell_state over every cell of a started board"""
+    rows, cols, mine_count = BOARD_PRESETS[preset]
+    model = started_model(rows, cols, mine_count)
+    cells = [(r, c) for r in range(rows) for c in range(cols)]
+
+    def read_all():
+        get_cell_state = model.get_cell_state
+        for row, col in cells:
+            get_cell_state(row, col)
+
+    benchmark(read_all)
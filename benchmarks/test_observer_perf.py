@@ -0,0 +1,81 @@
+import time
+
+import pytest
+
+from benchmarks.common import NullObserver, new_model
+from interfaces.game_interfaces import CellState
+from models.event_bus import GameEvent, Region
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize('size', [24, 128])
+@pytest.mark.parametrize('observer_count', [1, 10, 100])
+def test_cascade_fan_out(benchmark, observer_count, size):
+    """Full-board cascade with N observers attached to the model"""
+    # The model holds observers weakly, so the benchmark keeps them alive
+    observers = [NullObserver() for _ in range(observer_count)]
+
+    def setup():
+        model = new_model(size, size, 0)
+        for observer in observers:
+            model.add_observer(observer)
+        return (model,), {}
+
+    def first_click(model):
+        model.reveal_cell(size // 2, size // 2)
+
+    benchmark.pedantic(first_click, setup=setup, rounds=10)
+
+
+@pytest.mark.parametrize('observer_count', [1, 10, 100])
+def test_cascade_fan_out_viewports(benchmark, observer_count):
+    """Full-board cascade with N observers each watching a 16x16 region of cells"""
+    size = 128
+    observers = [NullObserver() for _ in range(observer_count)]
+
+    def setup():
+        model = new_model(size, size, 0)
+        for index, observer in enumerate(observers):
+            row, col = (16 * part for part in divmod(index % 64, 8))  # 8x8 tiles, reused past 64
+            model.add_observer(observer, [GameEvent.CELL_UPDATED], Region(row, col, row + 16, col + 16))
+        return (model,), {}
+
+    def first_click(model):
+        model.reveal_cell(size // 2, size // 2)
+
+    benchmark.pedantic(first_click, setup=setup, rounds=10)
+
+
+def test_cascade_fan_out_overhead():
+    """Guard: a 128x128 cascade to 100 observers costs about as much as a plain observer loop.
+
+    The plain loop is the dispatch the model did before the event bus: every
+    observer's method called for every cell. The model's cascade adds the
+    flood fill itself on top, so the guard allows it twice the loop's time.
+    """
+    size = 128
+    observers = [NullObserver() for _ in range(100)]
+    cells = [(row, col, CellState.REVEALED, 0) for row in range(size) for col in range(size)]
+
+    def cascade():
+        model = new_model(size, size, 0)
+        for observer in observers:
+            model.add_observer(observer)
+        start = time.perf_counter()
+        model.reveal_cell(size // 2, size // 2)
+        return time.perf_counter() - start
+
+    def plain_loop():
+        start = time.perf_counter()
+        for row, col, state, value in cells:
+            for observer in observers:
+                observer.on_cell_updated(row, col, state, value)
+        return time.perf_counter() - start
+
+    # Interleaved rounds, best of each, so load on the host hits both alike
+    cascade_times, loop_times = [], []
+    for _ in range(5):
+        cascade_times.append(cascade())
+        loop_times.append(plain_loop())
+    assert min(cascade_times) < 2 * min(loop_times)
@@ -0,0 +1,39 @@
+import pytest
+
+from analysis.probability import ProbabilityEngine
+from benchmarks.common import BOARD_PRESETS, midgame_model
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize('safe_reveals', [0, 10, 30, 60])
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_expert_probabilities_cold(benchmark, safe_reveals, seed):
+    """Full probability computation on an expert board with an empty component cache"""
+    rows, cols, mine_count = BOARD_PRESETS['expert']
+    model = midgame_model(rows, cols, mine_count, safe_reveals, seed)
+
+    def setup():
+        engine = ProbabilityEngine(model)
+        engine.detach()
+        return (engine,), {}
+
+    probabilities = benchmark.pedantic(lambda engine: engine.get_probabilities(), setup=setup, rounds=10)
+    assert abs(sum(probabilities.values()) - mine_count) < 1e-6
+
+
+@pytest.mark.parametrize('seed', [1, 2, 3])
+def test_expert_probabilities_after_reveal(benchmark, seed):
+    """Recomputation after one more reveal, with untouched components cached"""
+    rows, cols, mine_count = BOARD_PRESETS['expert']
+    model = midgame_model(rows, cols, mine_count, 30, seed)
+    engine = ProbabilityEngine(model)
+    engine.get_probabilities()
+
+    def recompute():
+        # Invalidate the result only; the component cache stays warm
+        engine._result = None
+        return engine.get_probabilities()
+
+    benchmark(recompute)
+    assert engine.cache_hits > 0
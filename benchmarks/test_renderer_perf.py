@@ -0,0 +1,38 @@
+import pytest
+
+from interfaces.game_interfaces import CellState
+from utils.cell_renderers import DefaultCellRenderer, MinimalistCellRenderer
+
+pytest.importorskip('pytest_benchmark')
+
+# Every (state, value) combination a view can ask a renderer about
+CELL_CASES = [(state, value) for state in CellState for value in range(-1, 9)]
+
+
+@pytest.mark.parametrize('renderer_class', [DefaultCellRenderer, MinimalistCellRenderer])
+def test_renderer_lookups(benchmark, renderer_class):
+    """Text, background and text colour lookups for all cell cases"""
+    renderer = renderer_class()
+
+    def render_all():
+        for state, value in CELL_CASES:
+            renderer.get_cell_text(state, value)
+            renderer.get_background_color(state, value)
+            renderer.get_text_color(state, value)
+
+    benchmark(render_all)
+
+
+@pytest.mark.parametrize('renderer_class', [DefaultCellRenderer, MinimalistCellRenderer])
+def test_glyph_atlas_lookups(benchmark, renderer_class):
+    """Texture lookups for all cell cases once every glyph is in the atlas"""
+    # Rasterizing needs Kivy; here only the cache lookup cost is measured
+    renderer = renderer_class(lambda text, color, font_name, font_size: text)
+
+    def lookup_all():
+        for state, value in CELL_CASES:
+            renderer.get_cell_texture(state, value, "DejaVuSans", 20)
+
+    lookup_all()
+    benchmark(lookup_all)
+    assert renderer.get_glyph_atlas("DejaVuSans", 20).created <= len(CELL_CASES)
@@ -0,0 +1,40 @@
+import pytest
+
+from benchmarks.common import BOARD_PRESETS, new_model
+from utils.rng import BACKENDS, game_rng
+
+pytest.importorskip('pytest_benchmark')
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+@pytest.mark.parametrize('preset', ['expert'])
+def test_bulk_placement(benchmark, backend, preset):
+    """Place mines for 100 boards, each from its own per-game stream"""
+    if backend == 'numpy':
+        pytest.importorskip('numpy')
+    rows, cols, mine_count = BOARD_PRESETS[preset]
+    model = new_model(rows, cols, mine_count)
+
+    def place_all():
+        for stream in range(100):
+            model.rng = game_rng(0, stream, backend)
+            model._place_mines(rows // 2, cols // 2)
+
+    benchmark(place_all)
+    assert len(model.mines) == mine_count
+
+
+@pytest.mark.parametrize('backend', BACKENDS)
+def test_large_board_placement(benchmark, backend):
+    """One 1000x1000 board at 15% density"""
+    if backend == 'numpy':
+        pytest.importorskip('numpy')
+    rows = cols = 1000
+    mine_count = rows * cols * 15 // 100
+    model = new_model(rows, cols, mine_count)
+
+    def setup():
+        model.rng = game_rng(0, 0, backend)
+
+    benchmark.pedantic(model._place_mines, args=(rows // 2, cols // 2), setup=setup, rounds=5)
+    assert len(model.mines) == mine_count
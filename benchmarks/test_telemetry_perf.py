@@ -0,0 +1,45 @@
+import pytest
+
+from benchmarks.common import started_model
+from controllers.game_controller import MinesweeperController
+from utils.headless import HeadlessView
+from utils.telemetry import MoveTelemetry
+
+pytest.importorskip('pytest_benchmark')
+
+MOVES = 1000
+
+
+def test_record_cost(benchmark):
+    """MoveTelemetry.record for 1000 moves (target: well under 1 us each)"""
+    telemetry = MoveTelemetry()
+
+    def record_all():
+        record = telemetry.record
+        for _ in range(MOVES):
+            record(0.0, 1e-6, 2e-6, 3e-6)
+
+    benchmark(record_all)
+
+
+@pytest.mark.parametrize('path', ['model', 'untimed', 'timed', 'posted'])
+def test_flag_move_overhead(benchmark, path):
+    """1000 flag toggles: straight on the model, through the controller without telemetry,
+    timed, and timed with each flush posted to a queue that is run afterwards (the app's
+    path while the latency overlay is visible, minus Kivy's own scheduling cost)"""
+    model = started_model(30, 30, 150)
+    pending = []
+    controller = MinesweeperController(model, HeadlessView(),
+                                       telemetry=None if path == 'untimed' else MoveTelemetry(),
+                                       flush_poster=pending.append if path == 'posted' else None)
+    row, col = next((r, c) for r in range(30) for c in range(30) if (r, c) not in model.revealed)
+    move = model.toggle_flag if path == 'model' else controller.on_cell_right_click
+
+    def toggle_all():
+        for _ in range(MOVES):
+            move(row, col)
+        for flush in pending:
+            flush()
+        pending.clear()
+
+    benchmark(toggle_all)
@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+"""
+Input latency benchmark: synchronous vs worker-thread model execution
+
+Plays the first click on a large board (1000x1000 by default), which places
+every mine and runs the cascade. The view stands in for Kivy by spending a
+fixed time per update_cell (about what MinesweeperViewImpl.update_cell costs
+with the glyph atlas, before drawing). Reported per mode:
+
+- sync: how long the UI thread is blocked by the click (model and view)
+- threaded: click handler latency while the worker is busy, then, with the
+  main loop simulated by running posted callbacks in order, the longest
+  single callback (the worst frame stall), how many callbacks the cascade
+  took, and when its first and last cell updates were on screen. Threaded
+  mode runs twice: replaying each batch whole and with the frame budget.
+"""
+import argparse
+import os
+import queue
+import sys
+import time
+from typing import Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from controllers.game_controller import MinesweeperController
+from controllers.threaded_controller import FRAME_BUDGET, ThreadedGameController
+from interfaces.game_interfaces import CellState
+from models.minesweeper_model import MinesweeperModel
+from utils.headless import HeadlessView
+from utils.rng import game_rng
+
+
+class CostlyView(HeadlessView):
+    """Headless view whose update_cell busy-waits for a fixed time, like a real widget update"""
+
+    def __init__(self, cell_cost: float):
+        super().__init__()
+        self.cell_cost = cell_cost
+
+    def update_cell(self, row: int, col: int, state: CellState, value: int) -> None:
+        """Update visual representation of a cell"""
+        self.cell_updates += 1
+        deadline = time.perf_counter() + self.cell_cost
+        while time.perf_counter() < deadline:
+            pass
+
+
+def measure_sync(rows: int, cols: int, mine_count: int, seed: int, cell_cost: float) -> float:
+    """Seconds the UI thread is blocked by the first click in synchronous mode"""
+    controller = MinesweeperController(MinesweeperModel(rng=game_rng(seed)), CostlyView(cell_cost))
+    controller.initialize_game(rows, cols, mine_count)
+    start = time.perf_counter()
+    controller.on_cell_left_click(rows // 2, cols // 2)
+    return time.perf_counter() - start
+
+
+def measure_threaded(rows: int, cols: int, mine_count: int, seed: int, cell_cost: float,
+                     follow_up_clicks: int, frame_budget: Optional[float]) -> Dict[str, object]:
+    """Handler latencies and UI-thread replay cost of the first click, threaded mode"""
+    main_loop: "queue.Queue" = queue.Queue()
+    view = CostlyView(cell_cost)
+    controller = ThreadedGameController(MinesweeperModel(rng=game_rng(seed)), view, main_loop.put,
+                                        frame_budget=frame_budget)
+    controller.initialize_game(rows, cols, mine_count)
+    controller.wait_idle()
+    while not main_loop.empty():
+        main_loop.get()()
+    view.cell_updates = 0
+
+    latencies: List[float] = []
+    start = time.perf_counter()
+    controller.on_cell_left_click(rows // 2, cols // 2)
+    latencies.append(time.perf_counter() - start)
+
+    # Keep clicking while the worker is busy; each handler must return at once
+    for index in range(follow_up_clicks):
+        click = time.perf_counter()
+        controller.on_cell_right_click(0, index % cols)
+        latencies.append(time.perf_counter() - click)
+    controller.wait_idle()
+
+    # Main loop: one posted callback per frame, in order
+    callbacks: List[float] = []
+    first_visible = None
+    while not main_loop.empty():
+        callback = main_loop.get()
+        begin = time.perf_counter()
+        callback()
+        end = time.perf_counter()
+        callbacks.append(end - begin)
+        if first_visible is None and view.cell_updates:
+            first_visible = end - start
+    all_visible = time.perf_counter() - start
+    controller.shutdown()
+    return {'latencies': sorted(latencies), 'callbacks': callbacks, 'first_visible': first_visible,
+            'all_visible': all_visible, 'updates': view.cell_updates}
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Compare UI-thread blocking of sync and threaded model execution")
+    parser.add_argument('--rows', type=int, default=1000)
+    parser.add_argument('--cols', type=int, default=1000)
+    parser.add_argument('--density', type=float, default=0.15, help="fraction of cells that are mines")
+    parser.add_argument('--seed', type=int, default=3)
+    parser.add_argument('--clicks', type=int, default=100, help="clicks issued while the cascade runs")
+    parser.add_argument('--cell-cost-us', type=float, default=15.0, help="view time per update_cell")
+    args = parser.parse_args(argv)
+
+    mine_count = int(args.rows * args.cols * args.density)
+    cell_cost = args.cell_cost_us / 1e6
+    print(f"{args.rows}x{args.cols} board, {mine_count} mines, {args.cell_cost_us:g} us per cell update")
+
+    blocked = measure_sync(args.rows, args.cols, mine_count, args.seed, cell_cost)
+    print(f"sync:      UI thread blocked {blocked * 1000.0:9.2f} ms by the first click")
+
+    for label, frame_budget in (('whole', None), ('budgeted', FRAME_BUDGET)):
+        result = measure_threaded(args.rows, args.cols, mine_count, args.seed, cell_cost,
+                                  args.clicks, frame_budget)
+        latencies = result['latencies']
+        callbacks = result['callbacks']
+        print(f"{label + ':':10s} handler latency p50 {latencies[len(latencies) // 2] * 1e6:6.1f} us, "
+              f"max {latencies[-1] * 1e6:7.1f} us over {len(latencies)} clicks")
+        print(f"{'':10s} UI callbacks: longest {max(callbacks) * 1000.0:8.2f} ms, "
+              f"median {sorted(callbacks)[len(callbacks) // 2] * 1000.0:6.2f} ms over {len(callbacks)}, "
+              f"{result['updates']} cell updates")
+        print(f"{'':10s} first cells visible after {result['first_visible'] * 1000.0:8.2f} ms, "
+              f"all after {result['all_visible'] * 1000.0:8.2f} ms")
+
+
+if __name__ == '__main__':
+    main()
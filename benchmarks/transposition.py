@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Transposition cache benchmark: hit rate and speedup on batch bot simulations
+
+Each board is replayed several times with differently seeded policies, as
+when comparing guessing strategies or re-running a batch. Every position up
+to the first differing guess repeats, and so do positions reached again
+later. Runs the same workload with and without a shared cache.
+"""
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.bot_harness import play_game
+from analysis.policies import POLICIES
+from analysis.transposition import TranspositionCache
+from controllers.game_controller import MinesweeperController
+from models.minesweeper_model import MinesweeperModel, DIFFICULTY_PRESETS
+from utils.headless import HeadlessView
+from utils.rng import game_rng
+
+
+def run_workload(policy_name: str, difficulty: str, boards: int, replays: int,
+                 cache: Optional[TranspositionCache]) -> float:
+    """Play every board `replays` times and return the total seconds"""
+    rows, cols, mine_count = DIFFICULTY_PRESETS[difficulty]
+    model = MinesweeperModel()
+    controller = MinesweeperController(model, HeadlessView())
+    start = time.perf_counter()
+    for board in range(boards):
+        for replay in range(replays):
+            model.rng = game_rng(0, board)
+            policy = POLICIES[policy_name](replay, cache)
+            play_game(policy, controller, model, rows, cols, mine_count)
+    return time.perf_counter() - start
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure transposition cache hit rate and speedup")
+    parser.add_argument('--policies', nargs='+', default=['deterministic', 'probability'],
+                        choices=sorted(POLICIES))
+    parser.add_argument('--difficulties', nargs='+', default=list(DIFFICULTY_PRESETS),
+                        choices=list(DIFFICULTY_PRESETS))
+    parser.add_argument('--boards', type=int, default=10)
+    parser.add_argument('--replays', type=int, default=5)
+    parser.add_argument('--cache-size', type=int, default=100000)
+    args = parser.parse_args(argv)
+
+    for difficulty in args.difficulties:
+        for policy_name in args.policies:
+            uncached = run_workload(policy_name, difficulty, args.boards, args.replays, None)
+            cache = TranspositionCache(args.cache_size)
+            cached = run_workload(policy_name, difficulty, args.boards, args.replays, cache)
+            print(f"{difficulty:12s} {policy_name:14s} uncached {uncached:7.2f} s  cached {cached:7.2f} s  "
+                  f"speedup {uncached / cached:5.2f}x  hit rate {cache.hit_rate():6.1%}  entries {len(cache)}")
+
+
+if __name__ == '__main__':
+    main()
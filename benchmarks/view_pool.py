@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+"""
+View pooling benchmark: widget allocations and time when switching difficulty
+
+Needs Kivy and a display. Cycles through the difficulty presets and reports
+how many cell widgets exist after each switch (the pool stops growing once
+the largest board has been shown) and how long each switch and reset took.
+"""
+import argparse
+import os
+import sys
+import time
+from typing import List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Measure difficulty switches with pooled cells")
+    parser.add_argument('--cycles', type=int, default=5)
+    args = parser.parse_args(argv)
+
+    os.environ.setdefault('KIVY_NO_ARGS', '1')
+    from kivy.app import App
+    from kivy.clock import Clock
+    from kivy.uix.widget import Widget
+    from controllers.game_controller import MinesweeperController
+    from models.minesweeper_model import MinesweeperModel, DIFFICULTY_PRESETS
+    from views.game_view import MinesweeperView, MinesweeperCell
+
+    created = [0]
+    original_init = MinesweeperCell.__init__
+
+    def counting_init(self, *init_args, **kwargs):
+        created[0] += 1
+        original_init(self, *init_args, **kwargs)
+
+    class ViewPoolBenchmarkApp(App):
+        def build(self):
+            return Widget()
+
+        def on_start(self):
+            MinesweeperCell.__init__ = counting_init
+            try:
+                view = MinesweeperView(controller=None, rows=9, cols=9)
+                controller = MinesweeperController(MinesweeperModel(), view.view_impl)
+                view.view_impl.set_controller(controller)
+                for cycle in range(args.cycles):
+                    for preset in DIFFICULTY_PRESETS:
+                        before = created[0]
+                        start = time.perf_counter()
+                        controller.on_difficulty_selected(preset)
+                        controller.on_cell_left_click(0, 0)
+                        Clock.tick()
+                        elapsed_ms = (time.perf_counter() - start) * 1000.0
+                        print(f"cycle {cycle} {preset:12s} new widgets: {created[0] - before:4d}   "
+                              f"pool: {len(view.view_impl._cell_pool):4d}   switch+click: {elapsed_ms:7.2f} ms")
+            finally:
+                MinesweeperCell.__init__ = original_init
+            self.stop()
+
+    ViewPoolBenchmarkApp().run()
+
+
+if __name__ == '__main__':
+    main()
@@ -1,26 +1,70 @@
-from interfaces.game_interfaces import IGameController, IGameModel, IGameView, IGameObserver, GameState, CellState
-from typing import Optional
+from interfaces.game_interfaces import (IGameController, IGameModel, IGameView, IGameObserver, IGameRecorder,
+                                       GameState, CellState)
+from models.minesweeper_model import DIFFICULTY_PRESETS, difficulty_name
+from utils.telemetry import MoveTelemetry
+from typing import Any, Callable, Dict, Optional
+
+# Schedules a callable to run once the view has drawn pending changes
+FlushPoster = Callable[[Callable[[], None]], None]
 
 class MinesweeperController(IGameController, IGameObserver):
     """Game controller implementing separation of concerns"""
     
-    def __init__(self, model: IGameModel, view: IGameView):
+    def __init__(self, model: IGameModel, view: IGameView,
+                 recorder: Optional[IGameRecorder] = None, player: str = "player",
+                 telemetry: Optional[MoveTelemetry] = None, flush_poster: Optional[FlushPoster] = None):
         self.model = model
         self.view = view
+        self.recorder = recorder  # Receives every won or lost game
+        self.player = player
+        self.telemetry = telemetry  # None skips move timing completely
+        # Without a flush poster, view updates count as flushed when the move returns
+        self.flush_poster = flush_poster
         self.model.add_observer(self)
     
     def initialize_game(self, rows: int = 15, cols: int = 15, mine_count: int = 30) -> None:
         """Initialize new game with default or custom parameters"""
         self.model.initialize_game(rows, cols, mine_count)
+        self.view.resize(rows, cols)
         self.view.reset_view()
     
-    def on_cell_left_click(self, row: int, col: int) -> None:
+    def on_cell_left_click(self, row: int, col: int, received: Optional[float] = None) -> None:
         """Handle left click on cell - reveal cell"""
-        self.model.reveal_cell(row, col)
+        if self.telemetry is None:
+            self.model.reveal_cell(row, col)
+        elif self.flush_poster is None:
+            self.telemetry.time_move(self.model.reveal_cell, row, col, received)
+        else:
+            self._posted_move(self.model.reveal_cell, row, col, received)
     
-    def on_cell_right_click(self, row: int, col: int) -> None:
+    def on_cell_right_click(self, row: int, col: int, received: Optional[float] = None) -> None:
         """Handle right click on cell - toggle flag"""
-        self.model.toggle_flag(row, col)
+        if self.telemetry is None:
+            self.model.toggle_flag(row, col)
+        elif self.flush_poster is None:
+            self.telemetry.time_move(self.model.toggle_flag, row, col, received)
+        else:
+            self._posted_move(self.model.toggle_flag, row, col, received)
+    
+    def _posted_move(self, action: Callable[[int, int], Any], row: int, col: int,
+                     received: Optional[float]) -> None:
+        """Run a move and record its latency once the posted flush runs; received is when the input arrived"""
+        telemetry = self.telemetry
+        clock = telemetry.clock
+        start = clock()
+        action(row, col)
+        end = clock()
+        if received is None:
+            received = start
+        self.flush_poster(lambda: telemetry.record(received, start, end, clock()))
+    
+    def get_elapsed_time(self) -> float:
+        """Get the game timer in seconds"""
+        return self.model.get_elapsed_time()
+    
+    def get_latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Get per-phase move latency percentiles in seconds (empty without telemetry)"""
+        return self.telemetry.summary() if self.telemetry is not None else {}
     
     def on_reset_game(self) -> None:
         """Handle game reset"""
@@ -31,9 +75,17 @@ class MinesweeperController(IGameController, IGameObserver):
         
         self.initialize_game(rows, cols, mine_count)
     
+    def on_difficulty_selected(self, preset: str) -> None:
+        """Handle switching to a difficulty preset"""
+        rows, cols, mine_count = DIFFICULTY_PRESETS[preset]
+        self.initialize_game(rows, cols, mine_count)
+    
     # Observer methods - respond to model changes
     def on_game_state_changed(self, new_state: GameState) -> None:
         """Called when game state changes"""
+        if new_state in (GameState.WON, GameState.LOST):
+            self._record_game(new_state == GameState.WON)
+        
         if new_state == GameState.WON:
             self.view.show_game_over(True)
             self._reveal_all_mines_for_display()
@@ -49,6 +101,13 @@ class MinesweeperController(IGameController, IGameObserver):
         """Called when status should be updated"""
         self.view.update_status(flagged_count, mine_count)
     
+    def _record_game(self, won: bool) -> None:
+        """Hand the finished game to the recorder, if any"""
+        if self.recorder is None:
+            return
+        difficulty = difficulty_name(self.model.rows, self.model.cols, self.model.get_mine_count())
+        self.recorder.record_game(self.player, difficulty, won, self.model.get_elapsed_time())
+    
     def _reveal_all_mines_for_display(self) -> None:
         """Reveal all mines when game ends"""
         if hasattr(self.model, 'get_all_mines'):
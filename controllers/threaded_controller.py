@@ -0,0 +1,211 @@
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+from interfaces.game_interfaces import IGameController, IGameModel, IGameView, IGameRecorder, CellState
+from controllers.game_controller import MinesweeperController
+from utils.telemetry import MoveTelemetry
+
+logger = logging.getLogger(__name__)
+
+# A recorded view call: (method name, arguments); a None name runs arguments[0]() instead
+ViewCall = Tuple[str, Tuple[Any, ...]]
+
+# Schedules a callable to run on the UI thread (e.g. through Kivy's Clock)
+MainThreadPoster = Callable[[Callable[[], None]], None]
+
+# UI-thread time spent replaying view calls per posted callback, in seconds
+FRAME_BUDGET = 0.008
+
+# View calls replayed between clock reads while a budget applies
+CALLS_PER_CLOCK_CHECK = 16
+
+
+class MarshallingView(IGameView):
+    """IGameView that records calls made on the worker thread for replay on the UI thread"""
+
+    def __init__(self, view: IGameView, clock: Callable[[], float] = time.perf_counter):
+        self.view = view
+        self.clock = clock
+        self._pending: List[ViewCall] = []  # Recorded on the worker thread
+        self._queued: Deque[ViewCall] = deque()  # Handed over but not yet applied; UI thread only
+
+    def update_cell(self, row: int, col: int, state: CellState, value: int) -> None:
+        """Update visual representation of a cell"""
+        self._pending.append(('update_cell', (row, col, state, value)))
+
+    def update_status(self, flagged_count: int, mine_count: int) -> None:
+        """Update status display"""
+        self._pending.append(('update_status', (flagged_count, mine_count)))
+
+    def show_game_over(self, won: bool) -> None:
+        """Show game over dialog"""
+        self._pending.append(('show_game_over', (won,)))
+
+    def reset_view(self) -> None:
+        """Reset view to initial state"""
+        self._pending.append(('reset_view', ()))
+
+    def resize(self, rows: int, cols: int) -> None:
+        """Change board dimensions"""
+        self._pending.append(('resize', (rows, cols)))
+
+    def after_apply(self, callback: Callable[[], None]) -> None:
+        """Run callback on the UI thread once the calls recorded so far have been applied"""
+        self._pending.append((None, (callback,)))
+
+    def take_batch(self) -> List[ViewCall]:
+        """Hand over the calls recorded so far and start a new batch"""
+        batch, self._pending = self._pending, []
+        return batch
+
+    def queue_batch(self, batch: List[ViewCall]) -> None:
+        """Queue a batch behind the calls not yet applied; must run on the UI thread"""
+        self._queued.extend(batch)
+
+    def apply_queued(self, budget: Optional[float] = None) -> bool:
+        """Replay queued calls on the real view, for about budget seconds if given.
+
+        Must run on the UI thread. Returns True once nothing is left queued.
+        """
+        view = self.view
+        queued = self._queued
+        clock = self.clock
+        deadline = None if budget is None else clock() + budget
+        applied = 0
+        while queued:
+            name, args = queued.popleft()
+            if name is None:
+                args[0]()
+            else:
+                getattr(view, name)(*args)
+            applied += 1
+            if deadline is not None and applied % CALLS_PER_CLOCK_CHECK == 0 and clock() >= deadline:
+                break
+        return not queued
+
+
+class ModelWorker:
+    """Single worker thread that runs commands strictly in submission order"""
+
+    def __init__(self, after_command: Callable[[], None], name: str = "minesweeper-model"):
+        self.after_command = after_command
+        self._queue: "queue.Queue[Optional[Tuple[Callable[..., Any], Tuple[Any, ...]]]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def submit(self, command: Callable[..., Any], *args: Any) -> None:
+        """Queue a command; returns immediately"""
+        self._queue.put((command, args))
+
+    def wait_idle(self) -> None:
+        """Block until every submitted command has finished"""
+        self._queue.join()
+
+    def stop(self) -> None:
+        """Finish queued commands, then stop the thread"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                command, args = item
+                try:
+                    command(*args)
+                except Exception:
+                    logger.exception("Model command %r failed", command)
+                self.after_command()
+            finally:
+                self._queue.task_done()
+
+
+class ThreadedGameController(IGameController):
+    """Controller that runs the model on a worker thread.
+
+    Input handlers only enqueue commands, so the UI thread never waits for
+    mine placement or a cascade. The wrapped MinesweeperController runs on
+    the worker and its view calls are batched per command and posted back to
+    the UI thread, in command order. Batches are replayed in slices of about
+    frame_budget seconds, so drawing a big cascade spreads over several
+    frames instead of stalling one.
+    """
+
+    def __init__(self, model: IGameModel, view: IGameView, post: MainThreadPoster,
+                 recorder: Optional[IGameRecorder] = None, player: str = "player",
+                 telemetry: Optional[MoveTelemetry] = None, frame_budget: Optional[float] = FRAME_BUDGET):
+        self.model = model
+        self.post = post
+        self.view = MarshallingView(view)
+        # A big cascade is replayed over several posted callbacks (one per frame with
+        # Kivy's Clock) of about frame_budget seconds each; None replays batches whole
+        self.frame_budget = frame_budget
+        self._apply_posted = False  # UI thread only
+        # A move counts as flushed once its batch has been applied on the UI thread
+        self.telemetry = telemetry or MoveTelemetry()
+        self.controller = MinesweeperController(model, self.view, recorder, player,
+                                                self.telemetry, self.view.after_apply)
+        self.worker = ModelWorker(self._flush)
+
+    def _flush(self) -> None:
+        """Post the view calls made by the last command to the UI thread"""
+        batch = self.view.take_batch()
+        if batch:
+            self.post(lambda: self._apply(batch))
+
+    def _apply(self, batch: List[ViewCall]) -> None:
+        """Queue a posted batch on the UI thread and start replaying it"""
+        self.view.queue_batch(batch)
+        if not self._apply_posted:
+            self._apply_queued()
+
+    def _apply_queued(self) -> None:
+        """Replay queued view calls for one frame budget, posting the rest to the next callback"""
+        self._apply_posted = False
+        if not self.view.apply_queued(self.frame_budget):
+            self._apply_posted = True
+            self.post(self._apply_queued)
+
+    def initialize_game(self, rows: int = 15, cols: int = 15, mine_count: int = 30) -> None:
+        """Initialize new game with default or custom parameters"""
+        self.worker.submit(self.controller.initialize_game, rows, cols, mine_count)
+
+    def on_cell_left_click(self, row: int, col: int, received: Optional[float] = None) -> None:
+        """Handle left click on cell - reveal cell"""
+        self.worker.submit(self.controller.on_cell_left_click, row, col,
+                           self.telemetry.clock() if received is None else received)
+
+    def on_cell_right_click(self, row: int, col: int, received: Optional[float] = None) -> None:
+        """Handle right click on cell - toggle flag"""
+        self.worker.submit(self.controller.on_cell_right_click, row, col,
+                           self.telemetry.clock() if received is None else received)
+
+    def on_reset_game(self) -> None:
+        """Handle game reset"""
+        self.worker.submit(self.controller.on_reset_game)
+
+    def on_difficulty_selected(self, preset: str) -> None:
+        """Handle switching to a difficulty preset"""
+        self.worker.submit(self.controller.on_difficulty_selected, preset)
+
+    def get_elapsed_time(self) -> float:
+        """Get the game timer in seconds"""
+        return self.model.get_elapsed_time()
+
+    def get_latency_summary(self) -> Dict[str, Dict[str, float]]:
+        """Get per-phase move latency percentiles in seconds"""
+        return self.telemetry.summary()
+
+    def wait_idle(self) -> None:
+        """Block until all queued commands have run and their view batches are posted"""
+        self.worker.wait_idle()
+
+    def shutdown(self) -> None:
+        """Stop the worker thread after the queued commands"""
+        self.worker.stop()
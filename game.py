@@ -1,52 +1,66 @@
+from random import Random
+
+from models.board_core import BoardCore
+
+
 class MinesweeperGame:
-    def __init__(self, width, height, num_mines):
+    """Legacy (x, y) interface over the shared BoardCore engine"""
+
+    def __init__(self, width, height, num_mines, rng=None):
+        self.rng = rng if rng is not None else Random()
         self.width = width
         self.height = height
         self.num_mines = num_mines
-        self.grid = [[0 for _ in range(width)] for _ in range(height)]
-        self.revealed = [[False for _ in range(width)] for _ in range(height)]
+        self.core = BoardCore(height, width)
         self.first_click = True
 
-    def generate_mines(self, first_click_x, first_click_y):
-        import random
+    @property
+    def grid(self):
+        """Snapshot of cell values by [y][x]: adjacent mine count, or -1 for a mine.
 
-        mines_placed = 0
-        while mines_placed < self.num_mines:
-            x = random.randint(0, self.width - 1)
-            y = random.randint(0, self.height - 1)
+        Builds a new list of lists on every access (O(width * height)); per-cell
+        reads should use cell_value(x, y).
+        """
+        value = self.core.value
+        return [[value(y * self.width + x) for x in range(self.width)] for y in range(self.height)]
 
-            if (x, y) != (first_click_x, first_click_y) and self.grid[y][x] != -1:
-                self.grid[y][x] = -1
-                mines_placed += 1
-                self.update_adjacent_cells(x, y)
+    @property
+    def revealed(self):
+        """Snapshot of revealed flags by [y][x]; O(width * height) per access, see is_revealed(x, y)"""
+        revealed = self.core.revealed
+        return [[bool(revealed[y * self.width + x]) for x in range(self.width)] for y in range(self.height)]
 
-    def update_adjacent_cells(self, mine_x, mine_y):
-        for x in range(mine_x - 1, mine_x + 2):
-            for y in range(mine_y - 1, mine_y + 2):
-                if 0 <= x < self.width and 0 <= y < self.height and self.grid[y][x] != -1:
-                    self.grid[y][x] += 1
+    def _index(self, x, y):
+        """Flat core index of a cell; raises IndexError off the board, like the old grid lookups"""
+        if not (0 <= x < self.width and 0 <= y < self.height):
+            raise IndexError(f"cell ({x}, {y}) is outside the {self.width}x{self.height} board")
+        return y * self.width + x
+
+    def cell_value(self, x, y):
+        """Adjacent mine count of a cell, or -1 for a mine (same as grid[y][x], in O(1))"""
+        return self.core.value(self._index(x, y))
+
+    def is_revealed(self, x, y):
+        """Whether a cell is revealed (same as revealed[y][x], in O(1))"""
+        return bool(self.core.revealed[self._index(x, y)])
+
+    def generate_mines(self, first_click_x, first_click_y):
+        self.core.place_random_mines(self.rng, self.num_mines, (first_click_y * self.width + first_click_x,))
 
     def reveal_cell(self, x, y):
+        index = self._index(x, y)
         if self.first_click:
             self.generate_mines(x, y)
             self.first_click = False
 
-        if self.grid[y][x] == -1:
+        if self.core.mines[index]:
             return "Game Over"
-        elif not self.revealed[y][x]:
-            self.revealed[y][x] = True
-            if self.grid[y][x] == 0:
-                self.reveal_adjacent_cells(x, y)
+        self.core.flood_reveal(index)
 
     def reveal_adjacent_cells(self, x, y):
-        for adj_x in range(x - 1, x + 2):
-            for adj_y in range(y - 1, y + 2):
-                if 0 <= adj_x < self.width and 0 <= adj_y < self.height:
-                    self.reveal_cell(adj_x, adj_y)
+        for index in self.core.neighbours(self._index(x, y)):
+            if not self.core.mines[index]:
+                self.core.flood_reveal(index)
 
     def check_win(self):
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.grid[y][x] != -1 and not self.revealed[y][x]:
-                    return False
-        return True
\ No newline at end of file
+        return self.core.is_cleared()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Set, Callable
+from typing import List, Tuple, Set, Callable, Optional
 from enum import Enum
 
 class CellState(Enum):
@@ -56,6 +56,11 @@ class IGameModel(ABC):
     def get_mine_count(self) -> int:
         """Get total number of mines"""
         pass
+    
+    @abstractmethod
+    def get_elapsed_time(self) -> float:
+        """Get seconds since the first click, stopped when the game ends"""
+        pass
 
 class IGameView(ABC):
     """Interface for game view"""
@@ -79,24 +84,34 @@ class IGameView(ABC):
     def reset_view(self) -> None:
         """Reset view to initial state"""
         pass
+    
+    @abstractmethod
+    def resize(self, rows: int, cols: int) -> None:
+        """Change board dimensions, keeping existing widgets where possible"""
+        pass
 
 class IGameController(ABC):
     """Interface for game controller"""
     
     @abstractmethod
-    def on_cell_left_click(self, row: int, col: int) -> None:
-        """Handle left click on cell"""
+    def on_cell_left_click(self, row: int, col: int, received: Optional[float] = None) -> None:
+        """Handle left click on cell; received is the time.perf_counter() reading of the input"""
         pass
     
     @abstractmethod
-    def on_cell_right_click(self, row: int, col: int) -> None:
-        """Handle right click on cell"""
+    def on_cell_right_click(self, row: int, col: int, received: Optional[float] = None) -> None:
+        """Handle right click on cell; received is the time.perf_counter() reading of the input"""
         pass
     
     @abstractmethod
     def on_reset_game(self) -> None:
         """Handle game reset"""
         pass
+    
+    @abstractmethod
+    def on_difficulty_selected(self, preset: str) -> None:
+        """Handle switching to a difficulty preset"""
+        pass
 
 class IGameObserver(ABC):
     """Observer interface for game events"""
@@ -114,4 +129,12 @@ class IGameObserver(ABC):
     @abstractmethod
     def on_status_updated(self, flagged_count: int, mine_count: int) -> None:
         """Called when status should be updated"""
-        pass
\ No newline at end of file
+        pass
+
+class IGameRecorder(ABC):
+    """Interface for storing finished games"""
+    
+    @abstractmethod
+    def record_game(self, player: str, difficulty: str, won: bool, seconds: float) -> None:
+        """Store the result of a finished game; must not block the caller"""
+        pass
@@ -2,104 +2,82 @@
 """
 Refactored Minesweeper following SOLID principles
 """
+import time
+_PROCESS_START = time.perf_counter()
+
 import sys
 import os
+import argparse
 
 # Add current directory to Python path for module imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from kivy.config import Config
-Config.set('input', 'mouse', 'mouse,multitouch_on_demand')
-
-from kivy.app import App
-from kivy.core.window import Window
-
-# Import our SOLID-compliant components
-from models.minesweeper_model import MinesweeperModel
-from views.game_view import MinesweeperView
-from controllers.game_controller import MinesweeperController
-from utils.cell_renderers import DefaultCellRenderer, MinimalistCellRenderer
+# Kivy is only imported once the app is actually created, so importing this
+# module (or the model, controller and headless harness) stays Kivy-free.
 
-class MinesweeperApp(App):
-    """Main application class following dependency injection principles"""
-    
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        self.kv_file = None  # Disable KV file loading
-        
-        # Game configuration
-        self.rows = 15
-        self.cols = 15
-        self.mine_count = 30
-        
-        # Components (will be injected)
-        self.model = None
-        self.view = None
-        self.controller = None
-    
-    def build(self):
-        """Build the application using dependency injection"""
-        Window.size = (600, 700)
-        
-        # Create model (business logic)
-        self.model = MinesweeperModel()
-        
-        # Create view with renderer strategy
-        cell_renderer = DefaultCellRenderer()  # Could be MinimalistCellRenderer()
-        
-        # Create temporary controller for view initialization
-        temp_controller = type('TempController', (), {
-            'on_cell_left_click': lambda self, r, c: None,
-            'on_cell_right_click': lambda self, r, c: None,
-            'on_reset_game': lambda self: None
-        })()
-        
-        self.view = MinesweeperView(
-            controller=temp_controller,
-            rows=self.rows,
-            cols=self.cols,
-            cell_renderer=cell_renderer
-        )
-        
-        # Create real controller and inject dependencies
-        self.controller = MinesweeperController(self.model, self.view.get_view_interface())
-        
-        # Update view with real controller using the new method
-        self.view.view_impl.set_controller(self.controller)
-        
-        # Initialize game
-        self.controller.initialize_game(self.rows, self.cols, self.mine_count)
-        
-        return self.view
-    
-    def on_start(self):
-        """Called when application starts"""
-        self.title = "SOLID Minesweeper"
+def parse_startup_args(argv):
+    """Pick out our profiling and timing options and leave the rest for Kivy"""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument('--profile-json', metavar='PATH')
+    parser.add_argument('--cprofile', metavar='PATH')
+    parser.add_argument('--exit-after-first-frame', action='store_true')
+    parser.add_argument('--threaded', action='store_true',
+                        help="run model commands on a worker thread")
+    parser.add_argument('--latency-overlay', action='store_true',
+                        help="show per-move latency percentiles (F12 toggles)")
+    return parser.parse_known_args(argv)
 
 # Factory function for easy testing and configuration
-def create_minesweeper_app(rows: int = 15, cols: int = 15, mine_count: int = 30, 
-                          use_minimalist_renderer: bool = False) -> MinesweeperApp:
+def create_minesweeper_app(rows: int = 15, cols: int = 15, mine_count: int = 30,
+                          use_minimalist_renderer: bool = False, threaded_model: bool = False,
+                          show_latency_overlay: bool = False):
     """
     Factory function to create configured minesweeper app
     Demonstrates Open/Closed Principle - easy to extend without modifying existing code
     """
+    from views.app import MinesweeperApp
+
     app = MinesweeperApp()
     app.rows = rows
     app.cols = cols
     app.mine_count = mine_count
-    
-    if use_minimalist_renderer:
-        # This could be extended to support more renderer types
-        pass
-    
+    app.use_minimalist_renderer = use_minimalist_renderer
+    app.threaded_model = threaded_model
+    app.show_latency_overlay = show_latency_overlay
+
     return app
 
+def _report_first_frame(app) -> None:
+    """Print wall-clock time from process start to the first drawn board and quit"""
+    print(f"first_frame_seconds={time.perf_counter() - _PROCESS_START:.4f}", flush=True)
+    app.stop()
+
 if __name__ == '__main__':
+    startup_args, remaining_args = parse_startup_args(sys.argv[1:])
+    sys.argv = sys.argv[:1] + remaining_args
+
     # Use factory function for better configurability
     app = create_minesweeper_app(
-        rows=15, 
-        cols=15, 
+        rows=15,
+        cols=15,
         mine_count=30,
-        use_minimalist_renderer=False  # Change to True for alternative style
+        use_minimalist_renderer=False,  # Change to True for alternative style
+        threaded_model=startup_args.threaded,
+        show_latency_overlay=startup_args.latency_overlay
     )
-    app.run()
\ No newline at end of file
+    if startup_args.exit_after_first_frame:
+        app.on_first_frame = lambda: _report_first_frame(app)
+
+    from utils.profiling import profiler, run_with_cprofile
+    if startup_args.profile_json:
+        profiler.enable()
+
+    try:
+        if startup_args.cprofile:
+            run_with_cprofile(app.run, startup_args.cprofile)
+        else:
+            app.run()
+    finally:
+        if startup_args.profile_json:
+            profiler.disable()
+            profiler.dump_json(startup_args.profile_json)
@@ -0,0 +1,160 @@
+from array import array
+from functools import lru_cache
+from typing import Any, Iterable, List
+
+# Offsets of the eight neighbours as (row delta, col delta)
+NEIGHBOUR_OFFSETS = ((-1, -1), (-1, 0), (-1, 1), (0, -1), (0, 1), (1, -1), (1, 0), (1, 1))
+
+
+class NeighbourTable:
+    """CSR neighbour indices of one board shape.
+
+    The neighbours of flat cell i are indices[starts[i]:starts[i + 1]].
+    Tables are shared by every board of the same shape and must not be
+    modified.
+    """
+
+    __slots__ = ('rows', 'cols', 'starts', 'indices')
+
+    def __init__(self, rows: int, cols: int):
+        self.rows = rows
+        self.cols = cols
+        starts = array('i', [0])
+        indices = array('i')
+        for row in range(rows):
+            # Offsets valid for this row, then clipped per column at the edges
+            row_offsets = [(dr * cols, dc) for dr, dc in NEIGHBOUR_OFFSETS if 0 <= row + dr < rows]
+            base = row * cols
+            for col in range(cols):
+                index = base + col
+                indices.extend([index + dr + dc for dr, dc in row_offsets if 0 <= col + dc < cols])
+                starts.append(len(indices))
+        self.starts = starts
+        self.indices = indices
+
+    def neighbours(self, index: int) -> array:
+        """Get the flat neighbour indices of a cell"""
+        return self.indices[self.starts[index]:self.starts[index + 1]]
+
+
+@lru_cache(maxsize=8)
+def neighbour_table(rows: int, cols: int) -> NeighbourTable:
+    """Get the shared neighbour table for a rows x cols board"""
+    return NeighbourTable(rows, cols)
+
+
+class BoardCore:
+    """Flat-array board engine shared by every frontend.
+
+    Cells are flat indices (row * cols + col). Mines, adjacent counts and
+    revealed cells live in bytearrays and neighbours come from the shared
+    per-shape NeighbourTable. Counts are computed once when mines are
+    placed, reveals flood iteratively and the win check is a counter
+    comparison. Flags are left to the frontends.
+    """
+
+    def __init__(self, rows: int = 0, cols: int = 0):
+        self.reset(rows, cols)
+
+    def reset(self, rows: int, cols: int) -> None:
+        """Clear the board, resizing it to rows x cols"""
+        size = rows * cols
+        self.rows = rows
+        self.cols = cols
+        self.size = size
+        self.table = neighbour_table(rows, cols)
+        self.mines = bytearray(size)
+        self.counts = bytearray(size)
+        self.revealed = bytearray(size)
+        self.mine_total = 0
+        self.revealed_total = 0
+        self.revealed_safe = 0
+
+    def neighbours(self, index: int) -> array:
+        """Get the flat neighbour indices of a cell"""
+        return self.table.neighbours(index)
+
+    def set_mine(self, index: int, mine: bool = True) -> None:
+        """Add or remove one mine, keeping neighbour counts up to date"""
+        if self.mines[index] == mine:
+            return
+        self.mines[index] = mine
+        step = 1 if mine else -1
+        self.mine_total += step
+        counts = self.counts
+        starts, indices = self.table.starts, self.table.indices
+        for neighbour in indices[starts[index]:starts[index + 1]]:
+            counts[neighbour] += step
+        if self.revealed[index]:
+            self.revealed_safe -= step
+
+    def set_mines(self, indices: Iterable[int]) -> None:
+        """Replace all mines with the given cells"""
+        self.mines = bytearray(self.size)
+        self.counts = bytearray(self.size)
+        self.mine_total = 0
+        self.revealed_safe = self.revealed_total
+        for index in indices:
+            self.set_mine(index)
+
+    def place_random_mines(self, rng: Any, mine_count: int, excluded: Iterable[int] = ()) -> None:
+        """Place mine_count mines uniformly at random outside the excluded cells.
+
+        The first mine_count non-excluded cells of a random ordering are a
+        uniform choice, and they always lie within the first
+        mine_count + len(excluded) positions, so one sample() draw is enough.
+        """
+        excluded = set(excluded)
+        drawn = rng.sample(range(self.size), mine_count + len(excluded))
+        self.set_mines([index for index in drawn if index not in excluded][:mine_count])
+
+    def mark_revealed(self, index: int) -> bool:
+        """Reveal a single cell without flooding; False if it already was"""
+        if self.revealed[index]:
+            return False
+        self.revealed[index] = 1
+        self.revealed_total += 1
+        if not self.mines[index]:
+            self.revealed_safe += 1
+        return True
+
+    def unreveal(self, index: int) -> None:
+        """Hide a revealed cell again"""
+        if self.revealed[index]:
+            self.revealed[index] = 0
+            self.revealed_total -= 1
+            if not self.mines[index]:
+                self.revealed_safe -= 1
+
+    def flood_reveal(self, index: int) -> List[int]:
+        """Reveal a safe cell and, through zero counts, everything connected to it.
+
+        Returns the newly revealed cells in reveal order. Mines and cells
+        that are already revealed are never revealed by the flood.
+        """
+        mines, counts, revealed = self.mines, self.counts, self.revealed
+        starts, indices = self.table.starts, self.table.indices
+        if mines[index] or revealed[index]:
+            return []
+        revealed[index] = 1
+        opened = [index]
+        stack = [index] if counts[index] == 0 else []
+        while stack:
+            cell = stack.pop()
+            for neighbour in indices[starts[cell]:starts[cell + 1]]:
+                if not revealed[neighbour] and not mines[neighbour]:
+                    revealed[neighbour] = 1
+                    opened.append(neighbour)
+                    if counts[neighbour] == 0:
+                        stack.append(neighbour)
+        self.revealed_total += len(opened)
+        self.revealed_safe += len(opened)
+        return opened
+
+    def value(self, index: int) -> int:
+        """Get the adjacent mine count of a cell, or -1 for a mine"""
+        return -1 if self.mines[index] else self.counts[index]
+
+    def is_cleared(self) -> bool:
+        """Check if every safe cell is revealed"""
+        return self.revealed_safe == self.size - self.mine_total
@@ -0,0 +1,184 @@
+import weakref
+from enum import Enum
+from types import MethodType
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from interfaces.game_interfaces import CellState, GameState
+
+
+class GameEvent(Enum):
+    """Model events; each value is the observer method that receives it"""
+    GAME_STATE_CHANGED = 'on_game_state_changed'
+    CELL_UPDATED = 'on_cell_updated'
+    STATUS_UPDATED = 'on_status_updated'
+
+
+ALL_EVENTS = frozenset(GameEvent)
+
+
+class Region(NamedTuple):
+    """Rectangle of cells, half-open like range(): rows [row_start, row_stop), cols [col_start, col_stop)"""
+    row_start: int
+    col_start: int
+    row_stop: int
+    col_stop: int
+
+    def contains(self, row: int, col: int) -> bool:
+        return self.row_start <= row < self.row_stop and self.col_start <= col < self.col_stop
+
+
+class _Subscription(NamedTuple):
+    ref: "weakref.ref"
+    events: frozenset
+    region: Optional[Region]
+
+
+def _handler(observer: Any, name: str) -> Callable:
+    """Get a function called as handler(observer, *args) that does not hold the observer"""
+    method = getattr(observer, name)
+    if isinstance(method, MethodType) and method.__self__ is observer:
+        return method.__func__
+    return lambda target, *args: getattr(target, name)(*args)
+
+
+class EventBus:
+    """Dispatches model events to weakly held observers.
+
+    Each observer subscribes to some event types and, for cell updates,
+    optionally to a region of the board only. Observers are held by weak
+    reference, so one that is no longer used elsewhere drops out on its own.
+    Dispatch tables of (reference, function) pairs are rebuilt whenever the
+    subscriptions change, and region subscribers are indexed by row, so a
+    cell update only visits observers that can want it.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[int, _Subscription] = {}
+        self._state_handlers: Tuple = ()
+        self._status_handlers: Tuple = ()
+        self._cell_handlers: Tuple = ()
+        self._region_handlers: Tuple = ()
+        self._region_rows: Dict[int, Tuple] = {}
+
+    def subscribe(self, observer: Any, events: Iterable[GameEvent] = ALL_EVENTS,
+                  region: Optional[Region] = None) -> None:
+        """Send events to observer, replacing any earlier subscription of it"""
+        key = id(observer)
+        ref = weakref.ref(observer, lambda ref: self._forget(key, ref))
+        self._subscriptions[key] = _Subscription(ref, frozenset(events), region)
+        self._compile()
+
+    def unsubscribe(self, observer: Any) -> None:
+        """Stop sending events to observer"""
+        if self._subscriptions.pop(id(observer), None) is not None:
+            self._compile()
+
+    def observers(self) -> List[Any]:
+        """Get the live observers in subscription order"""
+        observers = (subscription.ref() for subscription in self._subscriptions.values())
+        return [observer for observer in observers if observer is not None]
+
+    def __len__(self) -> int:
+        return len(self.observers())
+
+    def _forget(self, key: int, ref: "weakref.ref") -> None:
+        subscription = self._subscriptions.get(key)
+        if subscription is not None and subscription.ref is ref:
+            del self._subscriptions[key]
+            self._compile()
+
+    def _compile(self) -> None:
+        """Rebuild the dispatch tables from the subscriptions"""
+        state, status, cell, region = [], [], [], []
+        for subscription in self._subscriptions.values():
+            observer = subscription.ref()
+            if observer is None:
+                continue
+            events = subscription.events
+            if GameEvent.GAME_STATE_CHANGED in events:
+                state.append((subscription.ref, _handler(observer, GameEvent.GAME_STATE_CHANGED.value)))
+            if GameEvent.STATUS_UPDATED in events:
+                status.append((subscription.ref, _handler(observer, GameEvent.STATUS_UPDATED.value)))
+            if GameEvent.CELL_UPDATED in events:
+                handler = _handler(observer, GameEvent.CELL_UPDATED.value)
+                if subscription.region is None:
+                    cell.append((subscription.ref, handler))
+                else:
+                    region.append((subscription.ref, handler, subscription.region))
+        self._state_handlers = tuple(state)
+        self._status_handlers = tuple(status)
+        self._cell_handlers = tuple(cell)
+        self._region_handlers = tuple(region)
+        self._region_rows = {}
+
+    def _region_row(self, row: int) -> Tuple:
+        """Get (reference, function, col_start, col_stop) of the region subscribers covering row"""
+        handlers = self._region_rows.get(row)
+        if handlers is None:
+            handlers = tuple((ref, handler, region.col_start, region.col_stop)
+                             for ref, handler, region in self._region_handlers
+                             if region.row_start <= row < region.row_stop)
+            self._region_rows[row] = handlers
+        return handlers
+
+    def publish_game_state_changed(self, new_state: GameState) -> None:
+        for ref, handler in self._state_handlers:
+            observer = ref()
+            if observer is not None:
+                handler(observer, new_state)
+
+    def publish_status_updated(self, flagged_count: int, mine_count: int) -> None:
+        for ref, handler in self._status_handlers:
+            observer = ref()
+            if observer is not None:
+                handler(observer, flagged_count, mine_count)
+
+    def publish_cell_updated(self, row: int, col: int, state: CellState, value: int) -> None:
+        for ref, handler in self._cell_handlers:
+            observer = ref()
+            if observer is not None:
+                handler(observer, row, col, state, value)
+        if self._region_handlers:
+            for ref, handler, col_start, col_stop in self._region_row(row):
+                if col_start <= col < col_stop:
+                    observer = ref()
+                    if observer is not None:
+                        handler(observer, row, col, state, value)
+
+    def publish_cells_updated(self, cells: Sequence[Tuple[int, int, CellState, int]]) -> None:
+        """Publish (row, col, state, value) updates in order, e.g. for a cascade.
+
+        Observers are looked up once for the whole batch instead of once per
+        cell, and stay alive until it has been delivered.
+        """
+        handlers = [(handler, observer) for handler, observer in
+                    ((handler, ref()) for ref, handler in self._cell_handlers) if observer is not None]
+        if not self._region_handlers:
+            for row, col, state, value in cells:
+                for handler, observer in handlers:
+                    handler(observer, row, col, state, value)
+            return
+        region_rows: Dict[int, List] = {}
+        for row, col, state, value in cells:
+            for handler, observer in handlers:
+                handler(observer, row, col, state, value)
+            region_handlers = region_rows.get(row)
+            if region_handlers is None:
+                region_handlers = region_rows[row] = [
+                    (handler, observer, col_start, col_stop) for handler, observer, col_start, col_stop in
+                    ((handler, ref(), col_start, col_stop) for ref, handler, col_start, col_stop in self._region_row(row))
+                    if observer is not None]
+            for handler, observer, col_start, col_stop in region_handlers:
+                if col_start <= col < col_stop:
+                    handler(observer, row, col, state, value)
+
+    def wants_cells(self) -> bool:
+        """Check whether any subscriber receives cell updates at all"""
+        return bool(self._cell_handlers or self._region_handlers)
+
+    def wants_cell(self, row: int, col: int) -> bool:
+        """Check whether any subscriber would receive an update of this cell"""
+        if self._cell_handlers:
+            return True
+        return bool(self._region_handlers) and any(
+            col_start <= col < col_stop for _, _, col_start, col_stop in self._region_row(row))
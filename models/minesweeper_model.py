@@ -1,138 +1,235 @@
-from typing import List, Set, Tuple
-from random import randint
+from abc import abstractmethod
+from collections.abc import MutableSet
+from typing import Any, Iterable, Iterator, List, Optional, Set, Tuple
+from random import Random
+import time
 from interfaces.game_interfaces import IGameModel, IGameObserver, CellState, GameState
+from models.board_core import BoardCore
+from models.event_bus import ALL_EVENTS, EventBus, GameEvent, Region
+from models.zobrist import zobrist_key, FLAG_SYMBOL, MINE_SYMBOL
+
+# Classic difficulty presets: name -> (rows, cols, mine_count)
+DIFFICULTY_PRESETS = {
+    'beginner': (9, 9, 10),
+    'intermediate': (16, 16, 40),
+    'expert': (16, 30, 99),
+}
+
+def difficulty_name(rows: int, cols: int, mine_count: int) -> str:
+    """Get the preset name of a board, or 'ROWSxCOLS:MINES' for custom boards"""
+    for name, preset in DIFFICULTY_PRESETS.items():
+        if preset == (rows, cols, mine_count):
+            return name
+    return f"{rows}x{cols}:{mine_count}"
+
+class _CoreCellSet(MutableSet):
+    """Live set of (row, col) cells over one flag array of a BoardCore"""
+
+    def __init__(self, core: BoardCore):
+        self.core = core
+
+    @abstractmethod
+    def _flags(self) -> bytearray:
+        """The core's current flag array (BoardCore.reset replaces it)"""
+
+    def __contains__(self, cell: Any) -> bool:
+        row, col = cell
+        core = self.core
+        return 0 <= row < core.rows and 0 <= col < core.cols and bool(self._flags()[row * core.cols + col])
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        cols = self.core.cols
+        flags = self._flags()
+        return (divmod(index, cols) for index in range(len(flags)) if flags[index])
+
+    def update(self, cells: Iterable[Tuple[int, int]]) -> None:
+        for cell in cells:
+            self.add(cell)
+
+    def copy(self) -> Set[Tuple[int, int]]:
+        return set(self)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({set(self)!r})"
+
+
+class _MineSet(_CoreCellSet):
+    def _flags(self) -> bytearray:
+        return self.core.mines
+
+    def __len__(self) -> int:
+        return self.core.mine_total
+
+    def add(self, cell: Tuple[int, int]) -> None:
+        self.core.set_mine(cell[0] * self.core.cols + cell[1], True)
+
+    def discard(self, cell: Tuple[int, int]) -> None:
+        if cell in self:
+            self.core.set_mine(cell[0] * self.core.cols + cell[1], False)
+
+
+class _RevealedSet(_CoreCellSet):
+    def _flags(self) -> bytearray:
+        return self.core.revealed
+
+    def __len__(self) -> int:
+        return self.core.revealed_total
+
+    def add(self, cell: Tuple[int, int]) -> None:
+        self.core.mark_revealed(cell[0] * self.core.cols + cell[1])
+
+    def discard(self, cell: Tuple[int, int]) -> None:
+        if cell in self:
+            self.core.unreveal(cell[0] * self.core.cols + cell[1])
 
 class MinesweeperModel(IGameModel):
     """Game logic model implementing single responsibility principle"""
     
-    def __init__(self):
+    def __init__(self, rng: Optional[Any] = None):
+        # Any object with random.Random's randint/sample (see utils.rng.game_rng)
+        self.rng = rng if rng is not None else Random()
         self.rows = 0
         self.cols = 0
         self.mine_count = 0
-        self.mines: Set[Tuple[int, int]] = set()
-        self.revealed: Set[Tuple[int, int]] = set()
+        self.core = BoardCore()
         self.flagged: Set[Tuple[int, int]] = set()
         self.game_state = GameState.NOT_STARTED
         self.first_click = True
-        self.observers: List[IGameObserver] = []
+        self.position_hash = 0  # Zobrist hash of revealed numbers and flags
+        self.start_time: Optional[float] = None  # perf_counter() at the first click
+        self.end_time: Optional[float] = None  # perf_counter() when the game was won or lost
+        self.events = EventBus()  # Observers, weakly held
+    
+    @property
+    def mines(self) -> MutableSet:
+        """Mine cells as a live (row, col) set over the core board"""
+        return _MineSet(self.core)
+    
+    @mines.setter
+    def mines(self, cells: Iterable[Tuple[int, int]]) -> None:
+        self.core.set_mines(row * self.cols + col for row, col in cells)
     
-    def add_observer(self, observer: IGameObserver) -> None:
-        """Add observer for game events"""
-        self.observers.append(observer)
+    @property
+    def revealed(self) -> MutableSet:
+        """Revealed cells as a live (row, col) set over the core board"""
+        return _RevealedSet(self.core)
+    
+    @property
+    def observers(self) -> List[IGameObserver]:
+        """Live observers in the order they were added"""
+        return self.events.observers()
+    
+    def add_observer(self, observer: IGameObserver, events: Iterable[GameEvent] = ALL_EVENTS,
+                     region: Optional[Region] = None) -> None:
+        """Add observer for game events, optionally only some event types or cells in a region.
+        
+        The model holds observers by weak reference; the caller keeps them alive.
+        """
+        self.events.subscribe(observer, events, region)
     
     def remove_observer(self, observer: IGameObserver) -> None:
         """Remove observer"""
-        if observer in self.observers:
-            self.observers.remove(observer)
+        self.events.unsubscribe(observer)
     
     def _notify_game_state_changed(self) -> None:
         """Notify observers about game state change"""
-        for observer in self.observers:
-            observer.on_game_state_changed(self.game_state)
+        self.events.publish_game_state_changed(self.game_state)
     
     def _notify_cell_updated(self, row: int, col: int) -> None:
         """Notify observers about cell update"""
-        state = self.get_cell_state(row, col)
-        value = self.get_cell_value(row, col)
-        for observer in self.observers:
-            observer.on_cell_updated(row, col, state, value)
+        events = self.events
+        if events.wants_cell(row, col):
+            events.publish_cell_updated(row, col, self.get_cell_state(row, col), self.get_cell_value(row, col))
+    
+    def _notify_cells_updated(self, indices: List[int]) -> None:
+        """Notify observers about newly revealed safe cells, given by flat index"""
+        events = self.events
+        if not events.wants_cells():
+            return
+        cols, counts, flagged = self.cols, self.core.counts, self.flagged
+        cells = []
+        for index in indices:
+            row, col = divmod(index, cols)
+            state = CellState.FLAGGED if (row, col) in flagged else CellState.REVEALED
+            cells.append((row, col, state, counts[index]))
+        events.publish_cells_updated(cells)
     
     def _notify_status_updated(self) -> None:
         """Notify observers about status update"""
-        for observer in self.observers:
-            observer.on_status_updated(self.get_flagged_count(), self.mine_count)
+        self.events.publish_status_updated(self.get_flagged_count(), self.mine_count)
     
     def initialize_game(self, rows: int, cols: int, mine_count: int) -> None:
         """Initialize new game with given parameters"""
         self.rows = rows
         self.cols = cols
         self.mine_count = mine_count
-        self.mines.clear()
-        self.revealed.clear()
+        self.core.reset(rows, cols)
         self.flagged.clear()
         self.game_state = GameState.NOT_STARTED
         self.first_click = True
+        self.position_hash = 0
+        self.start_time = None
+        self.end_time = None
         self._notify_game_state_changed()
         self._notify_status_updated()
     
     def _place_mines(self, first_row: int, first_col: int) -> None:
         """Place mines avoiding the first clicked cell and its neighbors"""
-        self.mines.clear()
-        mines_placed = 0
-        
-        while mines_placed < self.mine_count:
-            row = randint(0, self.rows - 1)
-            col = randint(0, self.cols - 1)
-            
-            # Skip the first clicked cell and its neighbors
-            if abs(row - first_row) <= 1 and abs(col - first_col) <= 1:
-                continue
-                
-            if (row, col) not in self.mines:
-                self.mines.add((row, col))
-                mines_placed += 1
-    
-    def _count_adjacent_mines(self, row: int, col: int) -> int:
-        """Count mines adjacent to the given cell"""
-        count = 0
-        for r in range(max(0, row-1), min(self.rows, row+2)):
-            for c in range(max(0, col-1), min(self.cols, col+2)):
-                if (r, c) in self.mines:
-                    count += 1
-        return count
+        first = first_row * self.cols + first_col
+        self.core.place_random_mines(self.rng, self.mine_count, [first, *self.core.neighbours(first)])
     
     def _is_valid_position(self, row: int, col: int) -> bool:
         """Check if position is within game bounds"""
         return 0 <= row < self.rows and 0 <= col < self.cols
     
-    def _reveal_cell_recursive(self, row: int, col: int) -> None:
-        """Recursively reveal cells when empty cell is clicked"""
-        if not self._is_valid_position(row, col) or (row, col) in self.revealed or (row, col) in self.mines:
-            return
-            
-        self.revealed.add((row, col))
-        self._notify_cell_updated(row, col)
-        
-        # If no adjacent mines, reveal neighboring cells
-        if self._count_adjacent_mines(row, col) == 0:
-            for r in range(max(0, row-1), min(self.rows, row+2)):
-                for c in range(max(0, col-1), min(self.cols, col+2)):
-                    if (r, c) != (row, col):
-                        self._reveal_cell_recursive(r, c)
+    def _flood_fill(self, row: int, col: int) -> None:
+        """Reveal a safe cell and every cell its empty neighbours open up"""
+        counts = self.core.counts
+        position_hash = self.position_hash
+        opened = self.core.flood_reveal(row * self.cols + col)
+        for index in opened:
+            position_hash ^= zobrist_key(index, counts[index])
+        self.position_hash = position_hash
+        self._notify_cells_updated(opened)
     
     def _check_win_condition(self) -> bool:
         """Check if player has won the game"""
-        return len(self.revealed) == (self.rows * self.cols - len(self.mines))
+        return self.core.is_cleared()
     
     def reveal_cell(self, row: int, col: int) -> bool:
         """Reveal cell at given position"""
         if (not self._is_valid_position(row, col) or 
             self.game_state in [GameState.WON, GameState.LOST] or
-            (row, col) in self.revealed or 
+            self.core.revealed[row * self.cols + col] or 
             (row, col) in self.flagged):
             return False
         
         # Place mines on first click
         if self.first_click:
+            self.start_time = time.perf_counter()
             self._place_mines(row, col)
             self.first_click = False
             self.game_state = GameState.IN_PROGRESS
             self._notify_game_state_changed()
         
         # Check if mine
-        if (row, col) in self.mines:
+        index = row * self.cols + col
+        if self.core.mines[index]:
             self.game_state = GameState.LOST
-            self.revealed.add((row, col))
+            self.end_time = time.perf_counter()
+            self.core.mark_revealed(index)
+            self.position_hash ^= zobrist_key(index, MINE_SYMBOL)
             self._notify_cell_updated(row, col)
             self._notify_game_state_changed()
             return True
         
         # Reveal cell and potentially neighbors
-        self._reveal_cell_recursive(row, col)
+        self._flood_fill(row, col)
         
         # Check for win condition
         if self._check_win_condition():
             self.game_state = GameState.WON
+            self.end_time = time.perf_counter()
             self._notify_game_state_changed()
         
         return True
@@ -141,13 +238,14 @@ class MinesweeperModel(IGameModel):
         """Toggle flag on cell"""
         if (not self._is_valid_position(row, col) or 
             self.game_state in [GameState.WON, GameState.LOST] or
-            (row, col) in self.revealed):
+            self.core.revealed[row * self.cols + col]):
             return False
         
         if (row, col) in self.flagged:
             self.flagged.remove((row, col))
         else:
             self.flagged.add((row, col))
+        self.position_hash ^= zobrist_key(row * self.cols + col, FLAG_SYMBOL)
         
         self._notify_cell_updated(row, col)
         self._notify_status_updated()
@@ -158,10 +256,11 @@ class MinesweeperModel(IGameModel):
         if not self._is_valid_position(row, col):
             return CellState.HIDDEN
         
+        index = row * self.cols + col
         if (row, col) in self.flagged:
             return CellState.FLAGGED
-        elif (row, col) in self.revealed:
-            if (row, col) in self.mines and self.game_state == GameState.LOST:
+        elif self.core.revealed[index]:
+            if self.core.mines[index] and self.game_state == GameState.LOST:
                 return CellState.MINE_EXPLODED
             return CellState.REVEALED
         else:
@@ -172,10 +271,7 @@ class MinesweeperModel(IGameModel):
         if not self._is_valid_position(row, col):
             return 0
         
-        if (row, col) in self.mines:
-            return -1
-        else:
-            return self._count_adjacent_mines(row, col)
+        return self.core.value(row * self.cols + col)
     
     def get_game_state(self) -> GameState:
         """Get current game state"""
@@ -189,6 +285,17 @@ class MinesweeperModel(IGameModel):
         """Get total number of mines"""
         return self.mine_count
     
+    def get_elapsed_time(self) -> float:
+        """Get seconds since the first click, stopped when the game ends"""
+        if self.start_time is None:
+            return 0.0
+        end = self.end_time if self.end_time is not None else time.perf_counter()
+        return end - self.start_time
+    
+    def get_position_key(self) -> Tuple[int, int, int, int]:
+        """Get a key identifying the visible position (board shape, mine count, Zobrist hash)"""
+        return (self.rows, self.cols, self.mine_count, self.position_hash)
+    
     def get_all_mines(self) -> Set[Tuple[int, int]]:
         """Get all mine positions (for game over display)"""
-        return self.mines.copy()
\ No newline at end of file
+        return set(self.mines)
\ No newline at end of file
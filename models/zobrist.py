@@ -0,0 +1,19 @@
+# Visible symbols a cell can show besides hidden: numbers 0-8, a flag, a revealed mine
+FLAG_SYMBOL = 9
+MINE_SYMBOL = 10
+SYMBOL_COUNT = 11
+
+_MASK = (1 << 64) - 1
+
+
+def zobrist_key(index: int, symbol: int) -> int:
+    """Get the 64-bit Zobrist key for a flat cell index showing a symbol.
+
+    Keys come from a splitmix64 mix of (index, symbol) instead of a random
+    table, so they cost O(1) for any board size and are identical across
+    games and processes.
+    """
+    z = ((index * SYMBOL_COUNT + symbol + 1) * 0x9E3779B97F4A7C15) & _MASK
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK
+    return z ^ (z >> 31)
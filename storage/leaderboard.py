@@ -0,0 +1,204 @@
+import logging
+import math
+import queue
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from interfaces.game_interfaces import IGameRecorder
+
+logger = logging.getLogger(__name__)
+
+# Width in seconds of the win-time histogram buckets used for percentiles
+BUCKET_SECONDS = 1
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    player TEXT NOT NULL,
+    difficulty TEXT NOT NULL,
+    won INTEGER NOT NULL,
+    time REAL NOT NULL,
+    date REAL NOT NULL
+);
+-- Leaderboards only rank wins, so the time index leaves losses out
+CREATE INDEX IF NOT EXISTS games_difficulty_time ON games (difficulty, time) WHERE won = 1;
+CREATE INDEX IF NOT EXISTS games_player_date ON games (player, date);
+-- Personal bests: one seek to a player's fastest win per difficulty
+CREATE INDEX IF NOT EXISTS games_player_best ON games (player, difficulty, time) WHERE won = 1;
+
+-- Wins per difficulty and whole-second bucket, kept in step by a trigger
+CREATE TABLE IF NOT EXISTS win_times (
+    difficulty TEXT NOT NULL,
+    bucket INTEGER NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (difficulty, bucket)
+) WITHOUT ROWID;
+CREATE TRIGGER IF NOT EXISTS games_count_win AFTER INSERT ON games WHEN NEW.won = 1
+BEGIN
+    INSERT INTO win_times (difficulty, bucket, count)
+    VALUES (NEW.difficulty, CAST(NEW.time / {BUCKET_SECONDS} AS INTEGER), 1)
+    ON CONFLICT (difficulty, bucket) DO UPDATE SET count = count + 1;
+END;
+"""
+
+
+class GameRecord(NamedTuple):
+    """One finished game"""
+    player: str
+    difficulty: str
+    won: bool
+    seconds: float
+    date: float  # Unix timestamp of the end of the game
+
+
+class LeaderboardStore:
+    """SQLite store of finished games with leaderboard queries.
+
+    Runs in WAL mode so readers never wait for the writer. Times are
+    indexed per difficulty for top-N lists, a per-second histogram of win
+    times answers percentiles without scanning, and games are indexed per
+    player and date for personal records. A store must be used from the
+    thread that opened it.
+    """
+
+    def __init__(self, path: str = ':memory:'):
+        self.path = path
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode = WAL")
+        self.connection.execute("PRAGMA synchronous = NORMAL")
+        self.connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection"""
+        self.connection.close()
+
+    def add_games(self, records: Iterable[GameRecord]) -> None:
+        """Insert a batch of games in a single transaction"""
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO games (player, difficulty, won, time, date) VALUES (?, ?, ?, ?, ?)",
+                ((r.player, r.difficulty, int(r.won), r.seconds, r.date) for r in records))
+
+    def add_game(self, record: GameRecord) -> None:
+        """Insert one game"""
+        self.add_games((record,))
+
+    def count_wins(self, difficulty: str) -> int:
+        """Get the number of won games on a difficulty"""
+        row = self.connection.execute(
+            "SELECT COALESCE(SUM(count), 0) FROM win_times WHERE difficulty = ?", (difficulty,)).fetchone()
+        return row[0]
+
+    def top_times(self, difficulty: str, limit: int = 10) -> List[Tuple[str, float, float]]:
+        """Get the fastest wins as (player, seconds, date)"""
+        return self.connection.execute(
+            "SELECT player, time, date FROM games WHERE difficulty = ? AND won = 1 "
+            "ORDER BY time LIMIT ?", (difficulty, limit)).fetchall()
+
+    def percentile_rank(self, difficulty: str, seconds: float) -> float:
+        """Get the fraction of wins on a difficulty that were faster than seconds"""
+        bucket = int(seconds // BUCKET_SECONDS)
+        faster_buckets, total = self.connection.execute(
+            "SELECT COALESCE(SUM(CASE WHEN bucket < ? THEN count END), 0), COALESCE(SUM(count), 0) "
+            "FROM win_times WHERE difficulty = ?", (bucket, difficulty)).fetchone()
+        if not total:
+            return 0.0
+        # Only the bucket containing seconds is counted row by row
+        faster_in_bucket = self.connection.execute(
+            "SELECT COUNT(*) FROM games WHERE difficulty = ? AND won = 1 AND time >= ? AND time < ?",
+            (difficulty, bucket * BUCKET_SECONDS, seconds)).fetchone()[0]
+        return (faster_buckets + faster_in_bucket) / total
+
+    def time_at_percentile(self, difficulty: str, percentile: float) -> Optional[float]:
+        """Get the win time at a percentile (0-100) on a difficulty, nearest-rank"""
+        buckets = self.connection.execute(
+            "SELECT bucket, count FROM win_times WHERE difficulty = ? ORDER BY bucket", (difficulty,)).fetchall()
+        total = sum(count for _, count in buckets)
+        if not total:
+            return None
+        rank = min(total, max(1, math.ceil(percentile / 100.0 * total))) - 1
+        for bucket, count in buckets:
+            if rank < count:
+                row = self.connection.execute(
+                    "SELECT time FROM games WHERE difficulty = ? AND won = 1 AND time >= ? "
+                    "ORDER BY time LIMIT 1 OFFSET ?", (difficulty, bucket * BUCKET_SECONDS, rank)).fetchone()
+                return row[0]
+            rank -= count
+        return None
+
+    def personal_best(self, player: str, difficulty: str) -> Optional[float]:
+        """Get a player's fastest win on a difficulty"""
+        return self.connection.execute(
+            "SELECT MIN(time) FROM games WHERE player = ? AND difficulty = ? AND won = 1",
+            (player, difficulty)).fetchone()[0]
+
+    def recent_games(self, player: str, limit: int = 10) -> List[GameRecord]:
+        """Get a player's latest games, newest first"""
+        rows = self.connection.execute(
+            "SELECT player, difficulty, won, time, date FROM games WHERE player = ? "
+            "ORDER BY date DESC LIMIT ?", (player, limit)).fetchall()
+        return [GameRecord(player, difficulty, bool(won), seconds, date)
+                for player, difficulty, won, seconds, date in rows]
+
+
+class LeaderboardWriter(IGameRecorder):
+    """Background thread that inserts finished games into a LeaderboardStore.
+
+    record_game() only queues the record. The writer thread owns its own
+    connection and inserts whatever has queued up (up to batch_size) in one
+    transaction. The database is opened once up front, so a bad path raises
+    sqlite3.Error here rather than in the thread.
+    """
+
+    def __init__(self, path: str, batch_size: int = 500, name: str = "minesweeper-leaderboard"):
+        self.path = path
+        self.batch_size = batch_size
+        LeaderboardStore(path).close()
+        self._queue: "queue.Queue[Optional[GameRecord]]" = queue.Queue()
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    def record_game(self, player: str, difficulty: str, won: bool, seconds: float) -> None:
+        """Store the result of a finished game; must not block the caller"""
+        self._queue.put(GameRecord(player, difficulty, won, seconds, time.time()))
+
+    def flush(self) -> None:
+        """Block until every queued record has been written"""
+        self._queue.join()
+
+    def close(self) -> None:
+        """Write the queued records, then stop the thread"""
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        try:
+            store: Optional[LeaderboardStore] = LeaderboardStore(self.path)
+        except sqlite3.Error:
+            # Keep draining the queue so record_game() and flush() still return
+            logger.exception("Could not open leaderboard %s; games will not be stored", self.path)
+            store = None
+        try:
+            stopping = False
+            while not stopping:
+                batch = [self._queue.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+                records = [record for record in batch if record is not None]
+                stopping = len(records) < len(batch)
+                try:
+                    if records and store is not None:
+                        store.add_games(records)
+                except sqlite3.Error:
+                    logger.exception("Could not store %d game records", len(records))
+                finally:
+                    for _ in batch:
+                        self._queue.task_done()
+        finally:
+            if store is not None:
+                store.close()
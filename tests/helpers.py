@@ -0,0 +1,10 @@
+from models.minesweeper_model import MinesweeperModel
+
+
+def board_model(layout):
+    """Build a started model from rows of '*' (mine) and '.' (safe), nothing revealed"""
+    model = MinesweeperModel()
+    model.initialize_game(len(layout), len(layout[0]), sum(line.count('*') for line in layout))
+    model.mines = {(r, c) for r, line in enumerate(layout) for c, ch in enumerate(line) if ch == '*'}
+    model.first_click = False
+    return model
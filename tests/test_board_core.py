@@ -0,0 +1,229 @@
+import unittest
+import sys
+import os
+import random
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game import MinesweeperGame
+from models.board_core import BoardCore, neighbour_table
+from models.minesweeper_model import MinesweeperModel
+from interfaces.game_interfaces import GameState, CellState
+
+
+class LegacyGameReference:
+    """The list-of-lists MinesweeperGame engine as it was before BoardCore"""
+
+    def __init__(self, width, height, mines):
+        self.width = width
+        self.height = height
+        self.grid = [[0] * width for _ in range(height)]
+        self.revealed = [[False] * width for _ in range(height)]
+        for x, y in mines:
+            self.grid[y][x] = -1
+        for x, y in mines:
+            for ax in range(x - 1, x + 2):
+                for ay in range(y - 1, y + 2):
+                    if 0 <= ax < width and 0 <= ay < height and self.grid[ay][ax] != -1:
+                        self.grid[ay][ax] += 1
+
+    def reveal_cell(self, x, y):
+        if self.grid[y][x] == -1:
+            return "Game Over"
+        elif not self.revealed[y][x]:
+            self.revealed[y][x] = True
+            if self.grid[y][x] == 0:
+                for ax in range(x - 1, x + 2):
+                    for ay in range(y - 1, y + 2):
+                        if 0 <= ax < self.width and 0 <= ay < self.height:
+                            self.reveal_cell(ax, ay)
+
+    def check_win(self):
+        return all(self.grid[y][x] == -1 or self.revealed[y][x]
+                   for y in range(self.height) for x in range(self.width))
+
+
+class ModelReference:
+    """The set-based MinesweeperModel reveal logic as it was before BoardCore"""
+
+    def __init__(self, rows, cols, mines):
+        self.rows = rows
+        self.cols = cols
+        self.mines = set(mines)
+        self.revealed = set()
+        self.flagged = set()
+        self.state = GameState.IN_PROGRESS
+
+    def count(self, row, col):
+        return sum((r, c) in self.mines
+                   for r in range(max(0, row - 1), min(self.rows, row + 2))
+                   for c in range(max(0, col - 1), min(self.cols, col + 2)))
+
+    def flood(self, row, col):
+        if not (0 <= row < self.rows and 0 <= col < self.cols) or (row, col) in self.revealed \
+                or (row, col) in self.mines:
+            return
+        self.revealed.add((row, col))
+        if self.count(row, col) == 0:
+            for r in range(row - 1, row + 2):
+                for c in range(col - 1, col + 2):
+                    if (r, c) != (row, col):
+                        self.flood(r, c)
+
+    def reveal_cell(self, row, col):
+        if self.state != GameState.IN_PROGRESS or (row, col) in self.revealed or (row, col) in self.flagged:
+            return False
+        if (row, col) in self.mines:
+            self.state = GameState.LOST
+            self.revealed.add((row, col))
+            return True
+        self.flood(row, col)
+        if len(self.revealed) == self.rows * self.cols - len(self.mines):
+            self.state = GameState.WON
+        return True
+
+    def toggle_flag(self, row, col):
+        if self.state != GameState.IN_PROGRESS or (row, col) in self.revealed:
+            return False
+        self.flagged ^= {(row, col)}
+        return True
+
+
+def random_layout(rng, rows, cols, mine_count):
+    """Random set of (row, col) mines"""
+    return {divmod(index, cols) for index in rng.sample(range(rows * cols), mine_count)}
+
+
+class TestBoardCore(unittest.TestCase):
+    """Unit tests for the flat-array engine"""
+
+    def test_neighbour_table_matches_range_loops(self):
+        """Test CSR neighbour indices against explicit bounds-checked loops"""
+        for rows, cols in [(1, 1), (1, 5), (4, 1), (3, 7), (6, 6)]:
+            table = neighbour_table(rows, cols)
+            self.assertEqual(len(table.starts), rows * cols + 1)
+            for row in range(rows):
+                for col in range(cols):
+                    expected = sorted(r * cols + c
+                                      for r in range(max(0, row - 1), min(rows, row + 2))
+                                      for c in range(max(0, col - 1), min(cols, col + 2))
+                                      if (r, c) != (row, col))
+                    self.assertEqual(sorted(table.neighbours(row * cols + col)), expected)
+
+    def test_neighbour_table_shared_per_shape(self):
+        """Test that boards of the same shape share one table"""
+        self.assertIs(BoardCore(16, 30).table, BoardCore(16, 30).table)
+        self.assertIsNot(BoardCore(16, 30).table, BoardCore(30, 16).table)
+
+    def test_counts_follow_mine_changes(self):
+        """Test that adding and removing mines keeps neighbour counts exact"""
+        core = BoardCore(3, 3)
+        core.set_mines([0, 8])
+        self.assertEqual(core.value(4), 2)
+        self.assertEqual(core.value(0), -1)
+        core.set_mine(0, False)
+        self.assertEqual((core.value(4), core.value(1), core.mine_total), (1, 0, 1))
+
+    def test_flood_is_iterative(self):
+        """Test that a huge empty board opens with one call and no recursion limit"""
+        core = BoardCore(300, 300)
+        opened = core.flood_reveal(0)
+        self.assertEqual(len(opened), 300 * 300)
+        self.assertTrue(core.is_cleared())
+
+    def test_win_check_counts_safe_cells(self):
+        """Test the O(1) win check against the revealed cells"""
+        core = BoardCore(2, 2)
+        core.set_mines([3])
+        core.flood_reveal(0)
+        self.assertFalse(core.is_cleared())
+        core.flood_reveal(1)
+        core.flood_reveal(2)
+        self.assertTrue(core.is_cleared())
+
+
+class TestEngineParity(unittest.TestCase):
+    """Both frontends must behave exactly like their original engines"""
+
+    def test_legacy_game_parity(self):
+        """Test MinesweeperGame against the original list-of-lists engine"""
+        rng = random.Random(3)
+        for _ in range(40):
+            width, height = rng.randint(2, 12), rng.randint(2, 12)
+            layout = random_layout(rng, height, width, rng.randint(0, width * height // 3))
+            reference = LegacyGameReference(width, height, [(c, r) for r, c in layout])
+            game = MinesweeperGame(width, height, len(layout))
+            game.core.set_mines(r * width + c for r, c in layout)
+            game.first_click = False
+            self.assertEqual(game.grid, reference.grid)
+
+            for _ in range(10):
+                x, y = rng.randrange(width), rng.randrange(height)
+                self.assertEqual(game.reveal_cell(x, y), reference.reveal_cell(x, y))
+                self.assertEqual(game.revealed, reference.revealed)
+                self.assertEqual(game.check_win(), reference.check_win())
+
+            for y in range(height):
+                for x in range(width):
+                    self.assertEqual(game.cell_value(x, y), reference.grid[y][x])
+                    self.assertEqual(game.is_revealed(x, y), reference.revealed[y][x])
+
+    def test_legacy_game_rejects_off_board_cells(self):
+        """Test that off-board coordinates raise IndexError instead of reaching another cell"""
+        game = MinesweeperGame(4, 3, 2)
+        reference = LegacyGameReference(4, 3, [])
+        # In the flat arrays (4, 0) would land on (0, 1) and (0, 3) past the end
+        for x, y in ((4, 0), (0, 3), (4, 2)):
+            with self.assertRaises(IndexError):
+                reference.reveal_cell(x, y)
+        for x, y in ((4, 0), (0, 3), (4, 2), (-1, 0), (0, -1)):
+            for call in (game.reveal_cell, game.reveal_adjacent_cells, game.cell_value, game.is_revealed):
+                with self.assertRaises(IndexError):
+                    call(x, y)
+        self.assertTrue(game.first_click)
+        self.assertEqual(game.revealed, reference.revealed)
+
+    def test_model_parity(self):
+        """Test MinesweeperModel against the original set-based engine"""
+        rng = random.Random(5)
+        for _ in range(40):
+            rows, cols = rng.randint(2, 12), rng.randint(2, 12)
+            layout = random_layout(rng, rows, cols, rng.randint(0, rows * cols // 4))
+            reference = ModelReference(rows, cols, layout)
+            model = MinesweeperModel()
+            model.initialize_game(rows, cols, len(layout))
+            model.mines = layout
+            model.first_click = False
+            model.game_state = GameState.IN_PROGRESS
+
+            for _ in range(15):
+                row, col = rng.randrange(rows), rng.randrange(cols)
+                if rng.random() < 0.2:
+                    self.assertEqual(model.toggle_flag(row, col), reference.toggle_flag(row, col))
+                else:
+                    self.assertEqual(model.reveal_cell(row, col), reference.reveal_cell(row, col))
+                self.assertEqual(set(model.revealed), reference.revealed)
+                self.assertEqual(model.get_game_state(), reference.state)
+            for row in range(rows):
+                for col in range(cols):
+                    expected = -1 if (row, col) in layout else reference.count(row, col)
+                    self.assertEqual(model.get_cell_value(row, col), expected)
+
+    def test_model_cell_sets_are_live(self):
+        """Test that the mines and revealed views track and update the core"""
+        model = MinesweeperModel()
+        model.initialize_game(4, 4, 2)
+        model.mines = {(0, 0), (3, 3)}
+        model.revealed.add((1, 1))
+        self.assertEqual(len(model.mines), 2)
+        self.assertIn((3, 3), model.mines)
+        self.assertNotIn((4, 4), model.mines)
+        self.assertEqual(model.get_cell_state(1, 1), CellState.REVEALED)
+        self.assertEqual(model.get_cell_value(1, 1), 1)
+        model.revealed.discard((1, 1))
+        self.assertEqual(len(model.revealed), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.bot_harness import board_3bv, find_regressions, play_game
+from analysis.policies import POLICIES, find_certain_cells
+from controllers.game_controller import MinesweeperController
+from models.minesweeper_model import MinesweeperModel
+from tests.helpers import board_model
+from utils.headless import HeadlessView
+
+
+class TestBotHarness(unittest.TestCase):
+    """Unit tests for auto-play policies and the benchmark harness"""
+
+    def test_certain_cells(self):
+        """Test the single-number rules on a corner mine"""
+        model = board_model([
+            '*..',
+            '...',
+            '...',
+        ])
+        model.revealed.update({(0, 1), (0, 2), (1, 0), (1, 1), (1, 2), (2, 0), (2, 1)})
+        safe, mines = find_certain_cells(model)
+        # (0, 1) shows 1 with only (0, 0) hidden next to it
+        self.assertEqual(mines, {(0, 0)})
+        self.assertEqual(safe, set())
+
+        # Once (0, 0) is flagged, (1, 1) has all its mines and (2, 2) is safe
+        model.toggle_flag(0, 0)
+        safe, mines = find_certain_cells(model)
+        self.assertEqual(mines, set())
+        self.assertEqual(safe, {(2, 2)})
+
+    def test_board_3bv(self):
+        """Test 3BV: one opening plus one isolated number"""
+        model = board_model([
+            '*.*',
+            '...',
+            '...',
+        ])
+        # Row 2 is an opening that also uncovers row 1; (0, 1) needs its own click
+        self.assertEqual(board_3bv(model), 2)
+
+    def test_every_policy_finishes_games(self):
+        """Test that each policy plays seeded games to the end"""
+        model = MinesweeperModel()
+        controller = MinesweeperController(model, HeadlessView())
+        for name, policy_class in POLICIES.items():
+            result = play_game(policy_class(1), controller, model, 9, 9, 10)
+            self.assertGreater(result.moves, 0, name)
+            self.assertIn(result.won, (True, False))
+            self.assertEqual(model.observers, [controller])
+
+    def test_find_regressions(self):
+        """Test that slower timings and lower win rates are flagged"""
+        baseline = {'expert': {'probability': {'mean_move_ms': 1.0, 'mean_policy_ms': 1.0,
+                                               'mean_engine_ms': 1.0, 'mean_game_ms': 10.0,
+                                               'win_rate': 0.5}}}
+        report = {'expert': {'probability': {'mean_move_ms': 1.05, 'mean_policy_ms': 1.5,
+                                             'mean_engine_ms': 1.0, 'mean_game_ms': 10.0,
+                                             'win_rate': 0.4}}}
+        messages = find_regressions(report, baseline, threshold=10, win_rate_tolerance=0.02)
+        self.assertEqual(len(messages), 2)
+        self.assertTrue(any('mean_policy_ms' in message for message in messages))
+        self.assertTrue(any('win_rate' in message for message in messages))
+
+
+if __name__ == '__main__':
+    unittest.main()
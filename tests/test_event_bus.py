@@ -0,0 +1,136 @@
+import unittest
+import sys
+import os
+import gc
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interfaces.game_interfaces import IGameObserver, CellState, GameState
+from models.event_bus import EventBus, GameEvent, Region
+from models.minesweeper_model import MinesweeperModel
+from utils.rng import game_rng
+
+
+class RecordingObserver(IGameObserver):
+    """Observer that keeps every event it receives"""
+
+    def __init__(self):
+        self.states = []
+        self.cells = []
+        self.statuses = []
+
+    def on_game_state_changed(self, new_state):
+        self.states.append(new_state)
+
+    def on_cell_updated(self, row, col, state, value):
+        self.cells.append((row, col))
+
+    def on_status_updated(self, flagged_count, mine_count):
+        self.statuses.append((flagged_count, mine_count))
+
+
+class StateObserver(RecordingObserver):
+    """Observer that also keeps the state and value of every cell update"""
+
+    def __init__(self):
+        super().__init__()
+        self.updates = []
+
+    def on_cell_updated(self, row, col, state, value):
+        self.updates.append((row, col, state, value))
+
+
+class TestEventBus(unittest.TestCase):
+    """Unit tests for observer dispatch"""
+
+    def setUp(self):
+        self.model = MinesweeperModel(rng=game_rng(1))
+
+    def test_event_type_filter(self):
+        """Test that observers only get the event types they subscribed to"""
+        everything = RecordingObserver()
+        states_only = RecordingObserver()
+        self.model.add_observer(everything)
+        self.model.add_observer(states_only, [GameEvent.GAME_STATE_CHANGED])
+        self.model.initialize_game(9, 9, 10)
+        self.model.reveal_cell(4, 4)
+        self.model.toggle_flag(*next(iter(self.model.mines)))
+        self.assertEqual(states_only.states, everything.states)
+        self.assertEqual(states_only.states[-1], GameState.IN_PROGRESS)
+        self.assertEqual((states_only.cells, states_only.statuses), ([], []))
+        self.assertEqual(len(everything.statuses), 2)
+        self.assertEqual(len(everything.cells), len(self.model.revealed) + 1)
+
+    def test_region_filter(self):
+        """Test that a region subscriber only gets the cells inside its region"""
+        everything = RecordingObserver()
+        viewport = RecordingObserver()
+        region = Region(2, 3, 6, 8)
+        self.model.add_observer(everything)
+        self.model.add_observer(viewport, [GameEvent.CELL_UPDATED], region)
+        self.model.initialize_game(16, 16, 0)
+        self.model.reveal_cell(0, 0)
+        self.assertEqual(len(everything.cells), 256)
+        self.assertEqual(sorted(viewport.cells), [(row, col) for row in range(2, 6) for col in range(3, 8)])
+
+    def test_batch_matches_single_updates(self):
+        """Test that a batch of cell updates reaches observers like the same updates one by one"""
+        cells = [(row, col, CellState.REVEALED, row + col) for row in range(4) for col in range(4)]
+        results = []
+        for batched in (False, True):
+            bus = EventBus()
+            everything = RecordingObserver()
+            viewport = RecordingObserver()
+            bus.subscribe(everything)
+            bus.subscribe(viewport, [GameEvent.CELL_UPDATED], Region(1, 1, 3, 4))
+            if batched:
+                bus.publish_cells_updated(cells)
+            else:
+                for cell in cells:
+                    bus.publish_cell_updated(*cell)
+            results.append((everything.cells, viewport.cells))
+        self.assertEqual(results[0], results[1])
+        self.assertEqual(len(results[1][0]), 16)
+        self.assertEqual(results[1][1], [(1, 1), (1, 2), (1, 3), (2, 1), (2, 2), (2, 3)])
+
+    def test_cascade_reports_cell_states(self):
+        """Test that a cascade reports each opened cell with its state and value"""
+        observer = StateObserver()
+        self.model.add_observer(observer)
+        self.model.initialize_game(8, 8, 0)
+        self.model.toggle_flag(7, 7)
+        self.model.reveal_cell(0, 0)
+        self.assertEqual(len(observer.updates), 64 + 1)
+        for row, col, state, value in observer.updates[1:]:
+            self.assertEqual((state, value), (self.model.get_cell_state(row, col), self.model.get_cell_value(row, col)))
+        self.assertIn((7, 7, CellState.FLAGGED, 0), observer.updates[1:])
+
+    def test_weak_references(self):
+        """Test that abandoned observers are dropped and removal works"""
+        kept = RecordingObserver()
+        self.model.add_observer(kept)
+        self.model.add_observer(RecordingObserver())
+        gc.collect()
+        self.assertEqual(self.model.observers, [kept])
+        self.model.remove_observer(kept)
+        self.model.remove_observer(kept)
+        self.assertEqual(self.model.observers, [])
+
+    def test_resubscribe_replaces(self):
+        """Test that subscribing again replaces the earlier subscription"""
+        bus = EventBus()
+        observer = RecordingObserver()
+        bus.subscribe(observer)
+        bus.subscribe(observer, [GameEvent.CELL_UPDATED], Region(0, 0, 1, 1))
+        self.assertEqual(len(bus), 1)
+        bus.publish_game_state_changed(GameState.WON)
+        bus.publish_cell_updated(0, 0, None, 0)
+        bus.publish_cell_updated(1, 0, None, 0)
+        self.assertEqual((observer.states, observer.cells), ([], [(0, 0)]))
+        self.assertTrue(bus.wants_cell(0, 0))
+        self.assertFalse(bus.wants_cell(0, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from controllers.game_controller import MinesweeperController
+from models.minesweeper_model import MinesweeperModel, DIFFICULTY_PRESETS
+from utils.headless import HeadlessView
+
+
+class RecordingView(HeadlessView):
+    """Headless view that remembers the calls that shape the board"""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = []
+
+    def resize(self, rows: int, cols: int) -> None:
+        self.calls.append(('resize', rows, cols))
+
+    def reset_view(self) -> None:
+        self.calls.append(('reset_view',))
+
+
+class TestMinesweeperController(unittest.TestCase):
+    """Unit tests for MinesweeperController"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.model = MinesweeperModel()
+        self.view = RecordingView()
+        self.controller = MinesweeperController(self.model, self.view)
+
+    def test_initialize_game_resizes_before_reset(self):
+        """Test that the view is resized in place before being reset"""
+        self.controller.initialize_game(8, 12, 10)
+        self.assertEqual(self.view.calls, [('resize', 8, 12), ('reset_view',)])
+
+    def test_difficulty_selected(self):
+        """Test that each preset initializes the model with its dimensions"""
+        for preset, (rows, cols, mine_count) in DIFFICULTY_PRESETS.items():
+            self.controller.on_difficulty_selected(preset)
+            self.assertEqual((self.model.rows, self.model.cols, self.model.get_mine_count()),
+                             (rows, cols, mine_count))
+            self.assertEqual(self.view.calls[-2], ('resize', rows, cols))
+
+    def test_reset_keeps_dimensions(self):
+        """Test that reset restarts with the current board size"""
+        self.controller.on_difficulty_selected('expert')
+        self.controller.on_reset_game()
+        self.assertEqual((self.model.rows, self.model.cols), (16, 30))
+
+
+if __name__ == '__main__':
+    unittest.main()
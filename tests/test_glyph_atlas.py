@@ -0,0 +1,56 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.glyph_atlas import GlyphAtlas
+from utils.cell_renderers import DefaultCellRenderer, MinimalistCellRenderer
+from interfaces.game_interfaces import CellState
+
+
+def fake_render(text, color, font_name, font_size):
+    """Stand-in for CoreLabel rendering that returns a plain tuple"""
+    return (text, color, font_name, font_size)
+
+
+class TestGlyphAtlas(unittest.TestCase):
+    """Unit tests for the shared glyph texture cache"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.atlas = GlyphAtlas("DejaVuSans", 20, render_func=fake_render)
+
+    def test_each_glyph_rendered_once(self):
+        """Test that repeated lookups reuse the first texture"""
+        first = self.atlas.get_texture('1', (0, 0, 1, 1))
+        second = self.atlas.get_texture('1', (0, 0, 1, 1))
+        self.assertIs(first, second)
+        self.assertEqual(self.atlas.get_stats(), {'textures': 1, 'created': 1, 'hits': 1})
+
+    def test_color_is_part_of_key(self):
+        """Test that the same text in another color gets its own texture"""
+        self.atlas.get_texture('F', (0, 0, 0, 1))
+        self.atlas.get_texture('F', (1, 0, 0, 1))
+        self.assertEqual(self.atlas.created, 2)
+
+    def test_empty_text_has_no_texture(self):
+        """Test that empty cells do not create textures"""
+        self.assertIsNone(self.atlas.get_texture('', (1, 1, 1, 1)))
+        self.assertEqual(self.atlas.created, 0)
+
+    def test_renderers_share_atlas_per_font(self):
+        """Test that a renderer keeps one atlas per font and size"""
+        for renderer in (DefaultCellRenderer(fake_render), MinimalistCellRenderer(fake_render)):
+            for _ in range(3):
+                for value in range(1, 9):
+                    renderer.get_cell_texture(CellState.REVEALED, value, "DejaVuSans", 20)
+            self.assertIs(renderer.get_glyph_atlas("DejaVuSans", 20), renderer.get_glyph_atlas("DejaVuSans", 20))
+            self.assertIsNot(renderer.get_glyph_atlas("DejaVuSans", 20), renderer.get_glyph_atlas("DejaVuSans", 30))
+            self.assertEqual(renderer.get_glyph_atlas("DejaVuSans", 20).created, 8)
+            self.assertEqual(len(renderer.get_glyph_atlases()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
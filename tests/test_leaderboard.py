@@ -0,0 +1,133 @@
+import unittest
+import sys
+import os
+import math
+import random
+import sqlite3
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from controllers.game_controller import MinesweeperController
+from interfaces.game_interfaces import IGameRecorder
+from models.minesweeper_model import MinesweeperModel
+from storage.leaderboard import GameRecord, LeaderboardStore, LeaderboardWriter
+from utils.headless import HeadlessView
+from utils.rng import game_rng
+
+
+class ListRecorder(IGameRecorder):
+    """Recorder that keeps results in a list"""
+
+    def __init__(self):
+        self.games = []
+
+    def record_game(self, player, difficulty, won, seconds):
+        self.games.append((player, difficulty, won, seconds))
+
+
+class TestLeaderboardStore(unittest.TestCase):
+    """Unit tests for the SQLite leaderboard queries"""
+
+    def setUp(self):
+        self.store = LeaderboardStore()
+        rng = random.Random(4)
+        self.records = [GameRecord(f"p{rng.randrange(20)}", rng.choice(['beginner', 'expert']),
+                                   rng.random() < 0.6, rng.uniform(1, 60), float(i))
+                        for i in range(2000)]
+        self.store.add_games(self.records)
+
+    def tearDown(self):
+        self.store.close()
+
+    def wins(self, difficulty):
+        return sorted(r.seconds for r in self.records if r.won and r.difficulty == difficulty)
+
+    def test_top_times(self):
+        """Test the fastest wins come back in order"""
+        top = self.store.top_times('expert', 5)
+        self.assertEqual([seconds for _, seconds, _ in top], self.wins('expert')[:5])
+
+    def test_percentile_rank(self):
+        """Test percentile rank against a full sort"""
+        wins = self.wins('beginner')
+        self.assertEqual(self.store.count_wins('beginner'), len(wins))
+        for seconds in (0.5, 7.25, wins[100], 30.0, 61.0):
+            expected = sum(1 for t in wins if t < seconds) / len(wins)
+            self.assertAlmostEqual(self.store.percentile_rank('beginner', seconds), expected)
+        self.assertEqual(self.store.percentile_rank('custom', 10.0), 0.0)
+
+    def test_time_at_percentile(self):
+        """Test nearest-rank percentiles against a full sort"""
+        wins = self.wins('expert')
+        for percentile in (0, 1, 50, 90, 99.9, 100):
+            rank = min(len(wins), max(1, math.ceil(percentile / 100.0 * len(wins))))
+            self.assertEqual(self.store.time_at_percentile('expert', percentile), wins[rank - 1])
+        self.assertIsNone(self.store.time_at_percentile('custom', 50))
+
+    def test_personal_records(self):
+        """Test personal best and recent games for one player"""
+        mine = [r for r in self.records if r.player == 'p3']
+        best = min(r.seconds for r in mine if r.won and r.difficulty == 'beginner')
+        self.assertEqual(self.store.personal_best('p3', 'beginner'), best)
+        self.assertIsNone(self.store.personal_best('nobody', 'beginner'))
+        recent = self.store.recent_games('p3', 3)
+        self.assertEqual(recent, sorted(mine, key=lambda r: r.date, reverse=True)[:3])
+
+
+class TestLeaderboardWriter(unittest.TestCase):
+    """Unit tests for background recording"""
+
+    def test_writer_and_controller(self):
+        """Test that finished games reach the database through the writer"""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'scores.db')
+            writer = LeaderboardWriter(path)
+            model = MinesweeperModel(rng=game_rng(1))
+            controller = MinesweeperController(model, HeadlessView(), writer, 'alice')
+            controller.initialize_game(9, 9, 10)
+            controller.on_cell_left_click(4, 4)
+            controller.on_cell_left_click(*next(iter(model.mines)))
+            for seconds in (3.0, 2.0):
+                writer.record_game('bob', 'beginner', True, seconds)
+            writer.close()
+
+            store = LeaderboardStore(path)
+            try:
+                journal_mode = store.connection.execute("PRAGMA journal_mode").fetchone()[0]
+                self.assertEqual(journal_mode, 'wal')
+                self.assertEqual([(p, s) for p, s, _ in store.top_times('beginner')], [('bob', 2.0), ('bob', 3.0)])
+                self.assertEqual([(r.difficulty, r.won) for r in store.recent_games('alice')],
+                                 [('beginner', False)])
+            finally:
+                store.close()
+
+    def test_writer_bad_path_fails_fast(self):
+        """Test that a writer on an unusable path raises instead of dying in its thread"""
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertRaises(sqlite3.Error):
+                LeaderboardWriter(os.path.join(directory, 'missing', 'scores.db'))
+
+    def test_controller_records_win_and_loss(self):
+        """Test that the controller reports each finished game once"""
+        recorder = ListRecorder()
+        model = MinesweeperModel(rng=game_rng(1))
+        controller = MinesweeperController(model, HeadlessView(), recorder, 'alice')
+        controller.initialize_game(9, 9, 10)
+        controller.on_cell_left_click(4, 4)
+        mine = next(iter(model.mines))
+        controller.on_cell_left_click(*mine)
+        controller.on_cell_left_click(0, 0)
+        self.assertEqual(len(recorder.games), 1)
+        player, difficulty, won, seconds = recorder.games[0]
+        self.assertEqual((player, difficulty, won), ('alice', 'beginner', False))
+        self.assertGreaterEqual(seconds, 0.0)
+
+        controller.initialize_game(2, 2, 0)
+        controller.on_cell_left_click(0, 0)
+        self.assertEqual(recorder.games[1][1:3], ('2x2:0', True))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -6,6 +6,7 @@ import os
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from models.minesweeper_model import MinesweeperModel
+from models.zobrist import zobrist_key, FLAG_SYMBOL
 from interfaces.game_interfaces import GameState, CellState
 
 
@@ -105,5 +106,29 @@ class TestMinesweeperModel(unittest.TestCase):
         self.assertFalse(result)
 
 
+    def test_position_hash_tracks_visible_cells(self):
+        """Test that the incremental hash matches one computed from scratch"""
+        self.model.initialize_game(8, 8, 6)
+        self.model.reveal_cell(4, 4)
+        hidden = next((r, c) for r in range(8) for c in range(8) if (r, c) not in self.model.revealed)
+        self.model.toggle_flag(*hidden)
+
+        expected = 0
+        for row, col in self.model.revealed:
+            expected ^= zobrist_key(row * 8 + col, self.model.get_cell_value(row, col))
+        expected ^= zobrist_key(hidden[0] * 8 + hidden[1], FLAG_SYMBOL)
+        self.assertEqual(self.model.position_hash, expected)
+
+    def test_position_hash_flag_toggle_restores(self):
+        """Test that flagging and unflagging a cell restores the hash"""
+        self.model.initialize_game(5, 5, 5)
+        self.assertEqual(self.model.position_hash, 0)
+        self.model.toggle_flag(1, 1)
+        self.assertNotEqual(self.model.position_hash, 0)
+        self.model.toggle_flag(1, 1)
+        self.assertEqual(self.model.position_hash, 0)
+        self.assertEqual(self.model.get_position_key(), (5, 5, 5, 0))
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,100 @@
+import unittest
+import sys
+import os
+from itertools import combinations
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.probability import ProbabilityEngine, count_configurations
+from models.minesweeper_model import MinesweeperModel
+from tests.helpers import board_model
+
+
+def brute_force(model):
+    """Mine probabilities by enumerating every placement consistent with the visible board"""
+    hidden = [(r, c) for r in range(model.rows) for c in range(model.cols) if (r, c) not in model.revealed]
+    numbers = {cell: model.get_cell_value(*cell) for cell in model.revealed}
+    counts = {cell: 0 for cell in hidden}
+    total = 0
+    for mines in combinations(hidden, model.mine_count):
+        mine_set = set(mines)
+        if all(sum((r, c) in mine_set for r in range(row - 1, row + 2) for c in range(col - 1, col + 2)) == value
+               for (row, col), value in numbers.items()):
+            total += 1
+            for cell in mines:
+                counts[cell] += 1
+    return {cell: count / total for cell, count in counts.items()}
+
+
+class TestProbabilityEngine(unittest.TestCase):
+    """Unit tests for exact mine probabilities"""
+
+    def test_count_configurations_single_constraint(self):
+        """Test one '1' over two cells: two placements with one mine each"""
+        cells = ((0, 0), (0, 1))
+        counts = count_configurations(cells, ((cells, 1),))
+        self.assertEqual(counts, {1: (2, (1, 1))})
+
+    def test_matches_brute_force(self):
+        """Test exact agreement with full enumeration on a small board"""
+        model = board_model([
+            '*....',
+            '.....',
+            '..*..',
+            '.....',
+            '*...*',
+        ])
+        for cell in [(0, 3), (0, 4), (1, 3), (1, 4), (2, 4), (1, 1), (3, 2)]:
+            model.revealed.add(cell)
+        engine = ProbabilityEngine(model)
+        expected = brute_force(model)
+        actual = engine.get_probabilities()
+        self.assertEqual(set(actual), set(expected))
+        for cell, probability in expected.items():
+            self.assertAlmostEqual(actual[cell], probability, places=12)
+
+    def test_probabilities_sum_to_mine_count(self):
+        """Test that the expected number of mines equals the mine count"""
+        model = MinesweeperModel()
+        model.initialize_game(9, 9, 10)
+        model.reveal_cell(4, 4)
+        probabilities = ProbabilityEngine(model).get_probabilities()
+        if probabilities:
+            self.assertAlmostEqual(sum(probabilities.values()), 10, places=9)
+
+    def test_components_cached_until_touched(self):
+        """Test that untouched components reuse their cached counts"""
+        model = board_model([
+            '*........*',
+            '..........',
+            '..........',
+        ])
+        model.revealed.update({(0, 1), (1, 1), (0, 8), (1, 8)})
+        engine = ProbabilityEngine(model)
+        engine.get_probabilities()
+        self.assertEqual((engine.cache_hits, engine.cache_misses), (0, 2))
+
+        # Revealing a cell next to one component leaves the other cached
+        model.reveal_cell(1, 9)
+        engine.get_probabilities()
+        self.assertEqual(engine.cache_hits, 1)
+        self.assertEqual(engine.cache_misses, 3)
+
+    def test_component_cache_is_bounded(self):
+        """Test that the component cache keeps only the most recently used components"""
+        model = board_model([
+            '*........*',
+            '..........',
+            '..........',
+        ])
+        engine = ProbabilityEngine(model, component_cache_size=2)
+        for cell in ((0, 1), (1, 1), (0, 8), (1, 8), (2, 4)):
+            model.reveal_cell(*cell)
+            engine.get_probabilities()
+            self.assertLessEqual(len(engine.component_cache), 2)
+        self.assertGreater(engine.cache_misses, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
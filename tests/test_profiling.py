@@ -0,0 +1,77 @@
+import unittest
+import sys
+import os
+import json
+import subprocess
+import tempfile
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.minesweeper_model import MinesweeperModel
+from utils.profiling import Histogram, Profiler
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestProfiler(unittest.TestCase):
+    """Unit tests for the instrumentation hooks"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.profiler = Profiler()
+
+    def tearDown(self):
+        """Always restore the original methods"""
+        self.profiler.disable()
+
+    def test_histogram_percentiles(self):
+        """Test nearest-rank percentiles"""
+        histogram = Histogram()
+        for value in range(1, 101):
+            histogram.record(value)
+        summary = histogram.summary()
+        self.assertEqual(summary['count'], 100)
+        self.assertEqual(summary['p50'], 50)
+        self.assertEqual(summary['p99'], 99)
+        self.assertEqual(summary['max'], 100)
+
+    def test_disabled_profiler_leaves_methods_untouched(self):
+        """Test that hooks are only installed while enabled"""
+        original = MinesweeperModel.reveal_cell
+        self.profiler.enable()
+        self.assertIsNot(MinesweeperModel.reveal_cell, original)
+        self.profiler.disable()
+        self.assertIs(MinesweeperModel.reveal_cell, original)
+
+    def test_reveal_is_counted_and_timed(self):
+        """Test that a first click records reveal, placement and flood-fill data"""
+        self.profiler.enable()
+        model = MinesweeperModel()
+        model.initialize_game(10, 10, 0)
+        model.reveal_cell(0, 0)
+
+        report = self.profiler.report()
+        self.assertEqual(report['timers']['model.reveal_cell']['calls'], 1)
+        self.assertEqual(report['timers']['model.place_mines']['calls'], 1)
+        self.assertEqual(report['timers']['model.flood_fill']['calls'], 1)
+        self.assertEqual(report['histograms']['model.flood_fill.cells_touched']['max'], 100)
+        self.assertEqual(report['histograms']['model.reveal_cell.cells_touched']['max'], 100)
+
+    def test_headless_profile_json(self):
+        """Test that the headless harness writes a report without loading Kivy"""
+        env = {key: value for key, value in os.environ.items() if key != 'KIVY_NO_ARGS'}
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'hooks.json')
+            result = subprocess.run([sys.executable, '-m', 'utils.headless', '--games', '2', '--seed', '1',
+                                     '--profile-json', path], cwd=REPO_DIR, env=env,
+                                    capture_output=True, text=True)
+            self.assertEqual(result.returncode, 0, result.stderr)
+            with open(path) as report_file:
+                report = json.load(report_file)
+        self.assertGreater(report['timers']['model.reveal_cell']['calls'], 0)
+        self.assertNotIn('view.update_cell', report['timers'])
+
+
+if __name__ == '__main__':
+    unittest.main()
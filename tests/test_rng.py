@@ -0,0 +1,66 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from models.minesweeper_model import MinesweeperModel
+from utils.rng import game_rng, spawn_rngs
+
+
+def place(rng, rows=16, cols=30, mine_count=99, first=(8, 15)):
+    """Place mines on a fresh model with the given generator"""
+    model = MinesweeperModel(rng=rng)
+    model.initialize_game(rows, cols, mine_count)
+    model._place_mines(*first)
+    return model.get_all_mines()
+
+
+class TestGameRng(unittest.TestCase):
+    """Unit tests for seeded board generation"""
+
+    def test_same_seed_same_board(self):
+        """Test that a seed and stream always give the same board"""
+        self.assertEqual(place(game_rng(7, 3)), place(game_rng(7, 3)))
+
+    def test_streams_are_independent(self):
+        """Test that different streams and seeds give different boards"""
+        boards = [place(rng) for rng in spawn_rngs(7, 5)]
+        self.assertEqual(len({frozenset(board) for board in boards}), 5)
+        self.assertNotEqual(place(game_rng(7, 0)), place(game_rng(8, 0)))
+
+    def test_global_random_state_is_not_used(self):
+        """Test that reseeding the module-level generator does not change boards"""
+        import random
+        random.seed(1)
+        first = place(game_rng(5))
+        random.seed(2)
+        self.assertEqual(place(game_rng(5)), first)
+
+    def test_placement_avoids_first_click(self):
+        """Test mine count and the free 3x3 area around the first click"""
+        for stream in range(20):
+            mines = place(game_rng(0, stream), rows=9, cols=9, mine_count=72, first=(0, 0))
+            self.assertEqual(len(mines), 72)
+            self.assertFalse(mines & {(0, 0), (0, 1), (1, 0), (1, 1)})
+
+    def test_numpy_backend(self):
+        """Test that the NumPy backend is deterministic per stream"""
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            self.skipTest("NumPy is not installed")
+        first = place(game_rng(7, 1, backend='numpy'))
+        self.assertEqual(len(first), 99)
+        self.assertEqual(place(game_rng(7, 1, backend='numpy')), first)
+        self.assertNotEqual(place(game_rng(7, 2, backend='numpy')), first)
+
+    def test_unknown_backend(self):
+        """Test that an unknown backend name is rejected"""
+        with self.assertRaises(ValueError):
+            game_rng(1, backend='mt19937')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+import subprocess
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import fonts
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestStartup(unittest.TestCase):
+    """Unit tests for Kivy-free imports and lazy font lookup"""
+
+    def assert_no_kivy(self, statement: str):
+        """Run statement in a fresh interpreter and check Kivy was never imported"""
+        code = f"{statement}; import sys; sys.exit('kivy' in sys.modules)"
+        result = subprocess.run([sys.executable, '-c', code], cwd=REPO_DIR)
+        self.assertEqual(result.returncode, 0, f"{statement!r} imported Kivy")
+
+    def test_headless_imports_do_not_load_kivy(self):
+        """Test that model, controller and headless code import without Kivy"""
+        self.assert_no_kivy("import models.minesweeper_model, controllers.game_controller, utils.headless")
+
+    def test_main_module_does_not_load_kivy(self):
+        """Test that importing main defers Kivy until the app is created"""
+        self.assert_no_kivy("import main")
+
+    def test_profiler_does_not_load_kivy(self):
+        """Test that enabling the profiler in a headless run leaves Kivy unloaded"""
+        self.assert_no_kivy("from utils.profiling import profiler; profiler.enable()")
+
+    def test_font_lookup_uses_platform_candidates(self):
+        """Test that the font lookup picks an existing candidate for the platform"""
+        fonts.find_emoji_font.cache_clear()
+        original = fonts.FONT_CANDIDATES['linux']
+        fonts.FONT_CANDIDATES['linux'] = ('/nonexistent/font.ttf', os.path.abspath(__file__))
+        try:
+            self.assertEqual(fonts.find_emoji_font('linux'), os.path.abspath(__file__))
+        finally:
+            fonts.FONT_CANDIDATES['linux'] = original
+            fonts.find_emoji_font.cache_clear()
+
+    def test_font_lookup_returns_none_without_candidates(self):
+        """Test that a missing emoji font is reported as None"""
+        fonts.find_emoji_font.cache_clear()
+        original = fonts.FONT_CANDIDATES['darwin']
+        fonts.FONT_CANDIDATES['darwin'] = ('/nonexistent/font.ttf',)
+        try:
+            self.assertIsNone(fonts.find_emoji_font('darwin'))
+        finally:
+            fonts.FONT_CANDIDATES['darwin'] = original
+            fonts.find_emoji_font.cache_clear()
+
+
+if __name__ == '__main__':
+    unittest.main()
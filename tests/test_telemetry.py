@@ -0,0 +1,112 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from controllers.game_controller import MinesweeperController
+from controllers.threaded_controller import ThreadedGameController
+from models.minesweeper_model import MinesweeperModel
+from utils.headless import HeadlessView
+from utils.telemetry import MoveTelemetry, summarize
+
+
+class FakeClock:
+    """Clock that advances by one second per reading"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        self.now += 1.0
+        return self.now
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Unit tests for the fixed-size sample buffer"""
+
+    def test_keeps_latest_moves(self):
+        """Test that the oldest moves are overwritten once full"""
+        telemetry = MoveTelemetry(capacity=4)
+        for value in range(1, 7):
+            telemetry.record(0.0, float(value), 2.0 * value, 3.0 * value)
+        self.assertEqual(telemetry.samples('input_to_model'), [3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(telemetry.samples('model_to_view'), [3.0, 4.0, 5.0, 6.0])
+        self.assertEqual(telemetry.moves, 6)
+
+    def test_summary_percentiles(self):
+        """Test nearest-rank percentiles over the retained samples"""
+        summary = summarize([float(value) for value in range(100, 0, -1)])
+        self.assertEqual((summary['p50'], summary['p90'], summary['p99'], summary['max']), (50.0, 90.0, 99.0, 100.0))
+        self.assertEqual(MoveTelemetry(capacity=3).summary()['model']['count'], 0)
+
+
+class TestMoveTelemetry(unittest.TestCase):
+    """Unit tests for per-move latency and the game timer"""
+
+    def test_controller_records_each_phase(self):
+        """Test the three phases of a synchronous move"""
+        telemetry = MoveTelemetry(clock=FakeClock())
+        controller = MinesweeperController(MinesweeperModel(), HeadlessView(), telemetry=telemetry)
+        controller.initialize_game(5, 5, 0)
+        controller.on_cell_right_click(0, 0, received=-1.0)
+        self.assertEqual(telemetry.moves, 1)
+        # Clock readings: start 1, end 2; without a flush poster the view is flushed at end
+        self.assertEqual(telemetry.samples('input_to_model'), [2.0])
+        self.assertEqual(telemetry.samples('model'), [1.0])
+        self.assertEqual(telemetry.samples('model_to_view'), [0.0])
+        controller.on_cell_right_click(0, 0)
+        self.assertEqual(telemetry.samples('input_to_model'), [2.0, 0.0])
+
+    def test_flush_poster_delays_flush(self):
+        """Test that a move is only complete once the posted flush runs"""
+        posted = []
+        controller = MinesweeperController(MinesweeperModel(), HeadlessView(), telemetry=MoveTelemetry(),
+                                           flush_poster=posted.append)
+        controller.initialize_game(5, 5, 0)
+        controller.on_cell_right_click(0, 0)
+        self.assertEqual(controller.telemetry.moves, 0)
+        posted.pop()()
+        self.assertEqual(controller.telemetry.moves, 1)
+        self.assertEqual(set(controller.get_latency_summary()), {'input_to_model', 'model', 'model_to_view'})
+
+    def test_no_telemetry(self):
+        """Test that moves are not timed without telemetry"""
+        controller = MinesweeperController(MinesweeperModel(), HeadlessView())
+        controller.initialize_game(5, 5, 0)
+        controller.on_cell_right_click(0, 0)
+        self.assertIsNone(controller.telemetry)
+        self.assertEqual(controller.get_latency_summary(), {})
+        self.assertIn((0, 0), controller.model.flagged)
+
+    def test_threaded_move_flushes_on_ui_thread(self):
+        """Test that threaded moves are recorded when their batch is applied"""
+        posted = []
+        controller = ThreadedGameController(MinesweeperModel(), HeadlessView(), posted.append)
+        try:
+            controller.initialize_game(5, 5, 0)
+            controller.on_cell_right_click(0, 0)
+            controller.wait_idle()
+            self.assertEqual(controller.telemetry.moves, 0)
+            while posted:
+                posted.pop(0)()
+            self.assertEqual(controller.telemetry.moves, 1)
+        finally:
+            controller.shutdown()
+
+    def test_game_timer(self):
+        """Test that the timer starts on the first click and stops when the game ends"""
+        model = MinesweeperModel()
+        model.initialize_game(3, 3, 0)
+        self.assertEqual(model.get_elapsed_time(), 0.0)
+        model.reveal_cell(1, 1)
+        elapsed = model.get_elapsed_time()
+        self.assertGreater(elapsed, 0.0)
+        self.assertEqual(model.get_elapsed_time(), elapsed)
+        model.initialize_game(3, 3, 0)
+        self.assertEqual(model.get_elapsed_time(), 0.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from controllers.threaded_controller import ThreadedGameController
+from interfaces.game_interfaces import CellState, GameState
+from models.minesweeper_model import MinesweeperModel
+from utils.headless import HeadlessView
+
+
+class RecordingView(HeadlessView):
+    """Headless view that remembers every cell update and the thread it ran on"""
+
+    def __init__(self):
+        super().__init__()
+        self.updates = []
+
+    def update_cell(self, row: int, col: int, state: CellState, value: int) -> None:
+        self.updates.append((row, col, state))
+
+
+class TestThreadedGameController(unittest.TestCase):
+    """Unit tests for running model commands on a worker thread"""
+
+    def setUp(self):
+        """Set up test fixtures before each test method."""
+        self.posted = []
+        self.model = MinesweeperModel()
+        self.view = RecordingView()
+        self.controller = ThreadedGameController(self.model, self.view, self.posted.append)
+
+    def tearDown(self):
+        """Stop the worker thread"""
+        self.controller.shutdown()
+
+    def run_posted(self):
+        """Play the role of the UI main loop"""
+        self.controller.wait_idle()
+        while self.posted:
+            self.posted.pop(0)()
+
+    def test_view_untouched_until_batch_runs(self):
+        """Test that view calls only happen when the posted batch runs"""
+        self.controller.initialize_game(5, 5, 0)
+        self.controller.on_cell_right_click(0, 0)
+        self.controller.wait_idle()
+        self.assertEqual(self.view.updates, [])
+
+        self.run_posted()
+        self.assertEqual(self.view.updates, [(0, 0, CellState.FLAGGED)])
+
+    def test_commands_run_in_order(self):
+        """Test that a flag queued before a reveal protects the flagged cell"""
+        self.controller.initialize_game(5, 5, 0)
+        self.controller.on_cell_right_click(4, 4)
+        self.controller.on_cell_left_click(0, 0)
+        self.run_posted()
+
+        self.assertEqual(self.model.get_cell_state(4, 4), CellState.FLAGGED)
+        self.assertEqual(self.view.updates[0], (4, 4, CellState.FLAGGED))
+
+    def test_one_batch_per_command(self):
+        """Test that each command's view calls are posted together"""
+        self.controller.initialize_game(5, 5, 0)
+        self.controller.on_cell_left_click(0, 0)
+        self.controller.wait_idle()
+        self.assertEqual(len(self.posted), 2)
+
+        self.run_posted()
+        self.assertEqual(self.model.get_game_state(), GameState.WON)
+        self.assertEqual(self.view.games_over, [True])
+
+    def test_cascade_split_across_callbacks(self):
+        """Test that a budgeted replay spreads a cascade over several posts, in order"""
+        def play(frame_budget):
+            posted = []
+            view = RecordingView()
+            controller = ThreadedGameController(MinesweeperModel(), view, posted.append, frame_budget=frame_budget)
+            try:
+                controller.initialize_game(10, 10, 0)
+                controller.on_cell_right_click(9, 9)
+                controller.on_cell_left_click(0, 0)
+                controller.wait_idle()
+                callbacks = 0
+                while posted:
+                    posted.pop(0)()
+                    callbacks += 1
+            finally:
+                controller.shutdown()
+            return view, callbacks
+
+        whole, whole_callbacks = play(None)
+        sliced, sliced_callbacks = play(0.0)
+        self.assertEqual(whole_callbacks, 3)
+        # With no time to spare, each callback replays one slice of 16 calls
+        self.assertGreater(sliced_callbacks, len(whole.updates) // 16)
+        self.assertEqual(sliced.updates, whole.updates)
+        self.assertEqual(sliced.games_over, [True])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analysis.probability import ProbabilityEngine
+from analysis.transposition import TranspositionCache
+from models.minesweeper_model import MinesweeperModel
+
+
+class TestTranspositionCache(unittest.TestCase):
+    """Unit tests for the bounded LRU transposition cache"""
+
+    def test_lru_eviction(self):
+        """Test that the least recently used entry is evicted first"""
+        cache = TranspositionCache(maxsize=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 1)
+        self.assertEqual(cache.get('c'), 3)
+
+    def test_hit_rate(self):
+        """Test hit and miss accounting"""
+        cache = TranspositionCache()
+        cache.get('missing')
+        cache.put('key', 'value')
+        cache.get('key')
+        self.assertEqual(cache.get_stats(), {'size': 1, 'hits': 1, 'misses': 1, 'hit_rate': 0.5})
+
+    def test_engines_share_positions(self):
+        """Test that two games reaching the same position share one computation"""
+        cache = TranspositionCache()
+        results = []
+        for _ in range(2):
+            model = MinesweeperModel()
+            model.initialize_game(6, 6, 4)
+            model.mines = {(0, 0), (0, 5), (5, 0), (5, 5)}
+            model.first_click = False
+            model.reveal_cell(2, 2)
+            results.append(ProbabilityEngine(model, cache).get_probabilities())
+        self.assertIs(results[0], results[1])
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()
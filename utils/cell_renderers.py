@@ -1,9 +1,19 @@
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import Any, Dict, List, Optional, Tuple
 from interfaces.game_interfaces import CellState
+from utils.glyph_atlas import GlyphAtlas, GlyphRenderFunc
 
 class ICellRenderer(ABC):
-    """Interface for cell rendering strategies"""
+    """Interface for cell rendering strategies.
+
+    Subclasses that define __init__ must call super().__init__(), which sets
+    up the per-font glyph atlases.
+    """
+    
+    def __init__(self, glyph_render_func: Optional[GlyphRenderFunc] = None):
+        # Renders glyph textures; None means Kivy's CoreLabel
+        self.glyph_render_func = glyph_render_func
+        self._glyph_atlases: Dict[Tuple[str, float], GlyphAtlas] = {}
     
     @abstractmethod
     def get_cell_text(self, state: CellState, value: int) -> str:
@@ -19,11 +29,29 @@ class ICellRenderer(ABC):
     def get_text_color(self, state: CellState, value: int) -> Tuple[float, float, float, float]:
         """Get text color for cell"""
         pass
+    
+    def get_glyph_atlas(self, font_name: str, font_size: float) -> GlyphAtlas:
+        """Get this renderer's glyph atlas for a font, creating it on first use"""
+        atlas = self._glyph_atlases.get((font_name, font_size))
+        if atlas is None:
+            atlas = GlyphAtlas(font_name, font_size, self.glyph_render_func)
+            self._glyph_atlases[(font_name, font_size)] = atlas
+        return atlas
+    
+    def get_glyph_atlases(self) -> List[GlyphAtlas]:
+        """Get the glyph atlases created so far, one per font name and size"""
+        return list(self._glyph_atlases.values())
+    
+    def get_cell_texture(self, state: CellState, value: int, font_name: str, font_size: float) -> Optional[Any]:
+        """Get the shared pre-rendered texture for a cell, or None for an empty cell"""
+        atlas = self.get_glyph_atlas(font_name, font_size)
+        return atlas.get_texture(self.get_cell_text(state, value), self.get_text_color(state, value))
 
 class DefaultCellRenderer(ICellRenderer):
     """Default cell renderer with emoji support"""
     
-    def __init__(self):
+    def __init__(self, glyph_render_func: Optional[GlyphRenderFunc] = None):
+        super().__init__(glyph_render_func)
         # Color coding for mine count numbers
         self.number_colors = [
             (0, 0, 1, 1),      # 1 - blue
@@ -0,0 +1,60 @@
+import os
+import sys
+from functools import lru_cache
+from typing import Optional, Tuple
+
+# Name the emoji-capable font is registered under with Kivy
+EMOJI_FONT_NAME = "DejaVuSans"
+
+# Kivy's bundled font, used when no emoji font is installed
+FALLBACK_FONT_NAME = "Roboto"
+
+# Candidate emoji-capable fonts per platform, most preferred first
+FONT_CANDIDATES = {
+    'win32': (
+        os.path.join(os.environ.get('WINDIR', 'C:/Windows'), 'Fonts', 'seguiemj.ttf'),
+        os.path.join(os.environ.get('WINDIR', 'C:/Windows'), 'Fonts', 'seguisym.ttf'),
+    ),
+    'darwin': (
+        '/System/Library/Fonts/Apple Color Emoji.ttc',
+        '/Library/Fonts/Arial Unicode.ttf',
+    ),
+    'linux': (
+        '/usr/share/fonts/truetype/noto/NotoColorEmoji.ttf',
+        '/usr/share/fonts/noto/NotoColorEmoji.ttf',
+        '/usr/share/fonts/google-noto-emoji/NotoColorEmoji.ttf',
+        '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf',
+        '/usr/share/fonts/dejavu/DejaVuSans.ttf',
+    ),
+}
+
+
+def _platform_key(platform: str) -> str:
+    """Map sys.platform values onto FONT_CANDIDATES keys"""
+    if platform.startswith('win'):
+        return 'win32'
+    if platform == 'darwin':
+        return 'darwin'
+    return 'linux'
+
+
+@lru_cache(maxsize=None)
+def find_emoji_font(platform: Optional[str] = None) -> Optional[str]:
+    """Get the path of the first installed emoji-capable font (cached)"""
+    candidates: Tuple[str, ...] = FONT_CANDIDATES[_platform_key(platform or sys.platform)]
+    for path in candidates:
+        if os.path.isfile(path):
+            return path
+    return None
+
+
+@lru_cache(maxsize=None)
+def register_emoji_font() -> str:
+    """Register the emoji font with Kivy on first use and return the font name to use"""
+    path = find_emoji_font()
+    if path is None:
+        return FALLBACK_FONT_NAME
+
+    from kivy.core.text import LabelBase
+    LabelBase.register(name=EMOJI_FONT_NAME, fn_regular=path)
+    return EMOJI_FONT_NAME
@@ -0,0 +1,55 @@
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Color = Tuple[float, float, float, float]
+GlyphKey = Tuple[str, Color]
+
+# Renders (text, color, font_name, font_size) into a texture
+GlyphRenderFunc = Callable[[str, Color, str, float], Any]
+
+
+def render_glyph_with_kivy(text: str, color: Color, font_name: str, font_size: float) -> Any:
+    """Rasterize one glyph with Kivy's CoreLabel and return its texture"""
+    from kivy.core.text import Label as CoreLabel
+
+    label = CoreLabel(text=text, font_name=font_name, font_size=font_size, color=color)
+    label.refresh()
+    return label.texture
+
+
+class GlyphAtlas:
+    """Cache of pre-rendered cell glyphs for one font name and size.
+
+    Every distinct (text, color) pair is rasterized once and its texture is
+    shared by all cells that show it.
+    """
+
+    def __init__(self, font_name: str, font_size: float,
+                 render_func: Optional[GlyphRenderFunc] = None):
+        self.font_name = font_name
+        self.font_size = font_size
+        self.render_func = render_func or render_glyph_with_kivy
+        self.textures: Dict[GlyphKey, Any] = {}
+        self.created = 0
+        self.hits = 0
+
+    def get_texture(self, text: str, color: Color) -> Optional[Any]:
+        """Get the texture for text drawn in color, rendering it on first use"""
+        if not text:
+            return None
+        key = (text, tuple(color))
+        texture = self.textures.get(key)
+        if texture is None:
+            texture = self.render_func(text, key[1], self.font_name, self.font_size)
+            self.textures[key] = texture
+            self.created += 1
+        else:
+            self.hits += 1
+        return texture
+
+    def clear(self) -> None:
+        """Drop all cached textures (e.g. after the GL context is lost)"""
+        self.textures.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """Get texture creation and reuse counts"""
+        return {'textures': len(self.textures), 'created': self.created, 'hits': self.hits}
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+Headless game harness - drives model and controller without Kivy
+"""
+import argparse
+import os
+import random
+import sys
+from typing import List, Optional, Tuple
+
+if __name__ == '__main__':
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from interfaces.game_interfaces import IGameView, CellState, GameState
+from models.minesweeper_model import MinesweeperModel
+from controllers.game_controller import MinesweeperController
+from utils.rng import game_rng
+
+
+class HeadlessView(IGameView):
+    """IGameView implementation that only counts the calls it receives"""
+
+    def __init__(self):
+        self.cell_updates = 0
+        self.status_updates = 0
+        self.games_over: List[bool] = []
+
+    def update_cell(self, row: int, col: int, state: CellState, value: int) -> None:
+        """Update visual representation of a cell"""
+        self.cell_updates += 1
+
+    def update_status(self, flagged_count: int, mine_count: int) -> None:
+        """Update status display"""
+        self.status_updates += 1
+
+    def show_game_over(self, won: bool) -> None:
+        """Show game over dialog"""
+        self.games_over.append(won)
+
+    def reset_view(self) -> None:
+        """Reset view to initial state"""
+        pass
+
+    def resize(self, rows: int, cols: int) -> None:
+        """Change board dimensions"""
+        pass
+
+
+def play_random_game(controller: MinesweeperController, model: MinesweeperModel,
+                     rng: random.Random) -> GameState:
+    """Click random hidden cells through the controller until the game ends"""
+    hidden: List[Tuple[int, int]] = [(r, c) for r in range(model.rows) for c in range(model.cols)]
+    rng.shuffle(hidden)
+    while hidden and model.get_game_state() not in (GameState.WON, GameState.LOST):
+        row, col = hidden.pop()
+        if model.get_cell_state(row, col) == CellState.HIDDEN:
+            controller.on_cell_left_click(row, col)
+    return model.get_game_state()
+
+
+def run_headless_games(games: int, rows: int, cols: int, mine_count: int,
+                       seed: Optional[int] = None) -> List[GameState]:
+    """Play a batch of random games and return their final states"""
+    rng = random.Random(seed)
+    model = MinesweeperModel()
+    controller = MinesweeperController(model, HeadlessView())
+    results = []
+    for game in range(games):
+        # Boards come from their own per-game stream, clicks from rng
+        model.rng = game_rng(seed, game)
+        controller.initialize_game(rows, cols, mine_count)
+        results.append(play_random_game(controller, model, rng))
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Run minesweeper games without a display")
+    parser.add_argument('--games', type=int, default=100)
+    parser.add_argument('--rows', type=int, default=15)
+    parser.add_argument('--cols', type=int, default=15)
+    parser.add_argument('--mines', type=int, default=30)
+    parser.add_argument('--seed', type=int, default=None)
+    parser.add_argument('--profile-json', metavar='PATH',
+                        help="enable instrumentation hooks and write their report to PATH")
+    parser.add_argument('--cprofile', metavar='PATH',
+                        help="run under cProfile and write pstats output to PATH")
+    args = parser.parse_args(argv)
+
+    from utils.profiling import profiler, run_with_cprofile, print_cprofile_report
+
+    if args.profile_json:
+        profiler.enable()
+
+    def run() -> List[GameState]:
+        return run_headless_games(args.games, args.rows, args.cols, args.mines, args.seed)
+
+    if args.cprofile:
+        results = run_with_cprofile(run, args.cprofile)
+    else:
+        results = run()
+
+    wins = sum(1 for state in results if state == GameState.WON)
+    print(f"Played {len(results)} games: {wins} won, {len(results) - wins} lost")
+
+    if args.profile_json:
+        profiler.disable()
+        profiler.dump_json(args.profile_json)
+        print(f"Instrumentation report written to {args.profile_json}")
+    if args.cprofile:
+        print_cprofile_report(args.cprofile)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,200 @@
+import cProfile
+import functools
+import json
+import math
+import pstats
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class Histogram:
+    """Collects numeric samples and summarizes them with percentiles"""
+
+    def __init__(self):
+        self.samples: List[float] = []
+        self.total = 0.0
+
+    def record(self, value: float) -> None:
+        """Add a sample"""
+        self.samples.append(value)
+        self.total += value
+
+    def count(self) -> int:
+        """Get number of recorded samples"""
+        return len(self.samples)
+
+    def percentile(self, p: float) -> float:
+        """Get the p-th percentile (0-100) using nearest-rank"""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = max(1, math.ceil(p / 100.0 * len(ordered)))
+        return ordered[min(rank, len(ordered)) - 1]
+
+    def summary(self) -> Dict[str, float]:
+        """Get count, mean, p50, p99 and max of the samples"""
+        count = self.count()
+        return {
+            'count': count,
+            'total': self.total,
+            'mean': self.total / count if count else 0.0,
+            'p50': self.percentile(50),
+            'p99': self.percentile(99),
+            'max': max(self.samples) if self.samples else 0.0,
+        }
+
+
+class Profiler:
+    """Opt-in instrumentation for game hot paths.
+
+    Hooks are installed by patching methods on their classes, so nothing is
+    wrapped (and nothing costs anything) until enable() is called.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.timers: Dict[str, Histogram] = {}
+        self.histograms: Dict[str, Histogram] = {}
+        self.counters: Dict[str, int] = {}
+        self._patched: List[Tuple[Any, str, Any]] = []
+
+    def reset(self) -> None:
+        """Drop all collected data but keep hooks installed"""
+        self.timers.clear()
+        self.histograms.clear()
+        self.counters.clear()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        """Increment a named counter"""
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def observe(self, name: str, value: float) -> None:
+        """Record a sample in a named (non-timing) histogram"""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.record(value)
+
+    def record_time(self, name: str, seconds: float) -> None:
+        """Record a duration in seconds for a named timer"""
+        timer = self.timers.get(name)
+        if timer is None:
+            timer = self.timers[name] = Histogram()
+        timer.record(seconds)
+
+    def instrument(self, owner: Any, attr: str, name: str,
+                   touched: Optional[Callable[[Any], int]] = None) -> None:
+        """Wrap owner.attr so that every call is counted and timed.
+
+        With touched, a function of the instance the method is called on,
+        how much its result grew during each call is recorded in the
+        '<name>.cells_touched' histogram.
+        """
+        original = getattr(owner, attr)
+        profiler = self
+        clock = time.perf_counter
+
+        if touched is not None:
+            touched_name = name + '.cells_touched'
+
+            @functools.wraps(original)
+            def wrapper(instance, *args, **kwargs):
+                touched_before = touched(instance)
+                start = clock()
+                try:
+                    return original(instance, *args, **kwargs)
+                finally:
+                    profiler.record_time(name, clock() - start)
+                    profiler.count(name + '.calls')
+                    profiler.observe(touched_name, touched(instance) - touched_before)
+        else:
+            @functools.wraps(original)
+            def wrapper(*args, **kwargs):
+                start = clock()
+                try:
+                    return original(*args, **kwargs)
+                finally:
+                    profiler.record_time(name, clock() - start)
+                    profiler.count(name + '.calls')
+
+        self._patched.append((owner, attr, original))
+        setattr(owner, attr, wrapper)
+
+    def enable(self) -> None:
+        """Install the default hooks on model, controller and view"""
+        if self.enabled:
+            return
+        self.enabled = True
+
+        from models.minesweeper_model import MinesweeperModel
+        from controllers.game_controller import MinesweeperController
+
+        # The cells a reveal touches are the ones it turns from hidden to revealed
+        def revealed(model: MinesweeperModel) -> int:
+            return model.core.revealed_total
+
+        self.instrument(MinesweeperModel, 'reveal_cell', 'model.reveal_cell', touched=revealed)
+        self.instrument(MinesweeperModel, '_place_mines', 'model.place_mines')
+        self.instrument(MinesweeperModel, '_flood_fill', 'model.flood_fill', touched=revealed)
+        self.instrument(MinesweeperModel, '_notify_cell_updated', 'model.notify_cell_updated')
+        self.instrument(MinesweeperModel, '_notify_cells_updated', 'model.notify_cells_updated')
+        self.instrument(MinesweeperController, 'on_cell_left_click', 'controller.on_cell_left_click')
+        self.instrument(MinesweeperController, 'on_cell_right_click', 'controller.on_cell_right_click')
+        self.instrument(MinesweeperController, 'on_reset_game', 'controller.on_reset_game')
+
+        # The view needs Kivy, so it is only hooked when the app has already loaded it;
+        # importing it here would pull Kivy (and its argv parser) into headless runs
+        game_view = sys.modules.get('views.game_view')
+        if game_view is not None:
+            self.instrument(game_view.MinesweeperViewImpl, 'update_cell', 'view.update_cell')
+
+    def disable(self) -> None:
+        """Remove all installed hooks, restoring the original methods"""
+        while self._patched:
+            owner, attr, original = self._patched.pop()
+            setattr(owner, attr, original)
+        self.enabled = False
+
+    def report(self) -> Dict[str, Any]:
+        """Get collected data as a JSON-serializable dict (times in microseconds)"""
+        timers = {}
+        for name, timer in sorted(self.timers.items()):
+            summary = timer.summary()
+            timers[name] = {
+                'calls': summary['count'],
+                'total_us': summary['total'] * 1e6,
+                'mean_us': summary['mean'] * 1e6,
+                'p50_us': summary['p50'] * 1e6,
+                'p99_us': summary['p99'] * 1e6,
+                'max_us': summary['max'] * 1e6,
+            }
+        histograms = {name: histogram.summary() for name, histogram in sorted(self.histograms.items())}
+        return {
+            'timers': timers,
+            'histograms': histograms,
+            'counters': dict(sorted(self.counters.items())),
+        }
+
+    def dump_json(self, path: str) -> None:
+        """Write report() to a JSON file"""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2)
+
+
+def run_with_cprofile(func: Callable[[], Any], path: str) -> Any:
+    """Run func under cProfile and save pstats-compatible output to path"""
+    profile = cProfile.Profile()
+    try:
+        return profile.runcall(func)
+    finally:
+        profile.dump_stats(path)
+
+
+def print_cprofile_report(path: str, limit: int = 25) -> None:
+    """Print the top entries of a saved cProfile report by cumulative time"""
+    pstats.Stats(path).sort_stats('cumulative').print_stats(limit)
+
+
+# Shared profiler instance used by main.py and the headless harness
+profiler = Profiler()
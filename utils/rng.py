@@ -0,0 +1,50 @@
+import random
+from typing import Any, List, Optional, Sequence
+
+# Generator backends for board generation
+BACKENDS = ('random', 'numpy')
+
+
+class NumpyRandomAdapter:
+    """Exposes a NumPy Generator through the random.Random methods the model uses"""
+
+    def __init__(self, generator: Any):
+        self.generator = generator
+
+    def randint(self, a: int, b: int) -> int:
+        """Random integer in [a, b]"""
+        return int(self.generator.integers(a, b + 1))
+
+    def sample(self, population: Sequence[Any], k: int) -> List[Any]:
+        """k unique elements of population in random order"""
+        indices = self.generator.choice(len(population), size=k, replace=False)
+        return [population[int(i)] for i in indices]
+
+
+def game_rng(seed: Optional[int], stream: int = 0, backend: str = 'random') -> Any:
+    """Get an independent, deterministic generator for one game.
+
+    Each (seed, stream) pair gives its own stream, so boards generated in
+    threads or processes never share state and can be reproduced exactly
+    from the two numbers. A seed of None gives an unpredictable generator.
+    """
+    if backend == 'numpy':
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("The 'numpy' RNG backend requires NumPy (pip install numpy)")
+        if seed is None:
+            return NumpyRandomAdapter(numpy.random.default_rng())
+        sequence = numpy.random.SeedSequence(seed, spawn_key=(stream,))
+        return NumpyRandomAdapter(numpy.random.Generator(numpy.random.PCG64(sequence)))
+    if backend != 'random':
+        raise ValueError(f"Unknown RNG backend {backend!r}, expected one of {BACKENDS}")
+    if seed is None:
+        return random.Random()
+    # String seeds are hashed with SHA-512, independent of PYTHONHASHSEED
+    return random.Random(f"minesweeper:{seed}:{stream}")
+
+
+def spawn_rngs(seed: Optional[int], count: int, backend: str = 'random') -> List[Any]:
+    """Get generators for `count` games, e.g. one per worker"""
+    return [game_rng(seed, stream, backend) for stream in range(count)]
@@ -0,0 +1,80 @@
+import math
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
+
+# Phases of a move, in order: input handler -> model call -> view flushed
+PHASES = ('input_to_model', 'model', 'model_to_view')
+
+
+def summarize(samples: List[float]) -> Dict[str, float]:
+    """Get count, mean, p50, p90, p99 and max of samples (nearest-rank percentiles)"""
+    ordered = sorted(samples)
+    count = len(ordered)
+
+    def percentile(p: float) -> float:
+        if not ordered:
+            return 0.0
+        return ordered[min(count, max(1, math.ceil(p / 100.0 * count))) - 1]
+
+    return {
+        'count': count,
+        'mean': sum(ordered) / count if count else 0.0,
+        'p50': percentile(50),
+        'p90': percentile(90),
+        'p99': percentile(99),
+        'max': ordered[-1] if ordered else 0.0,
+    }
+
+
+class MoveTelemetry:
+    """Per-move latency in seconds, split by phase, over the last `capacity` moves.
+
+    A move is timed from its input handler to the model call, through the
+    model call, and from the model's return until the view has applied (or,
+    for a UI view, drawn) the result. Each move keeps its raw clock readings
+    in a bounded deque; phases are only subtracted out when samples are read,
+    so recording is one tuple append and stays on in production.
+    """
+
+    def __init__(self, capacity: int = 1024, clock: Callable[[], float] = time.perf_counter):
+        self.capacity = capacity
+        self.clock = clock
+        self.moves = 0  # Moves ever recorded
+        # (received, model_start, model_end, flushed) of the latest moves
+        self._readings: Deque[Tuple[float, float, float, float]] = deque(maxlen=capacity)
+
+    def record(self, received: float, model_start: float, model_end: float, flushed: float) -> None:
+        """Add one move from its four clock readings"""
+        self._readings.append((received, model_start, model_end, flushed))
+        self.moves += 1
+
+    def time_move(self, action: Callable[[int, int], Any], row: int, col: int,
+                  received: Optional[float] = None) -> None:
+        """Run action(row, col) and record it as flushed when it returns.
+
+        Same as record() with the view flushed at model_end; a move without
+        received starts at the model call.
+        """
+        clock = self.clock
+        start = clock()
+        action(row, col)
+        end = clock()
+        self._readings.append((start if received is None else received, start, end, end))
+        self.moves += 1
+
+    def samples(self, phase: str) -> List[float]:
+        """Get the retained samples of one phase, oldest first"""
+        offset = PHASES.index(phase)
+        return [readings[offset + 1] - readings[offset] for readings in self._readings]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Get percentile summaries per phase"""
+        return {phase: summarize(self.samples(phase)) for phase in PHASES}
+
+    def format_summary(self) -> str:
+        """One line per phase with p50/p99 in milliseconds, for on-screen display"""
+        lines = []
+        for phase, stats in self.summary().items():
+            lines.append(f"{phase}: p50 {stats['p50'] * 1000:.2f} ms  p99 {stats['p99'] * 1000:.2f} ms")
+        return "\n".join(lines)
@@ -0,0 +1,151 @@
+from kivy.config import Config
+Config.set('input', 'mouse', 'mouse,multitouch_on_demand')
+
+from kivy.app import App
+from kivy.clock import Clock
+from kivy.core.window import Window
+from kivy.uix.boxlayout import BoxLayout
+from kivy.uix.label import Label
+from typing import Callable, Optional
+import logging
+import os
+import sqlite3
+
+from models.minesweeper_model import MinesweeperModel
+from views.game_view import MinesweeperView
+from controllers.game_controller import MinesweeperController
+from controllers.threaded_controller import ThreadedGameController
+from storage.leaderboard import LeaderboardWriter
+from utils.telemetry import MoveTelemetry
+from utils.cell_renderers import DefaultCellRenderer, MinimalistCellRenderer
+
+logger = logging.getLogger(__name__)
+
+def post_to_main_thread(callback: Callable[[], None]) -> None:
+    """Run callback on the Kivy main loop (safe to call from any thread)"""
+    Clock.schedule_once(lambda dt: callback(), 0)
+
+class MinesweeperApp(App):
+    """Main application class following dependency injection principles"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.kv_file = None  # Disable KV file loading
+
+        # Game configuration
+        self.rows = 15
+        self.cols = 15
+        self.mine_count = 30
+        self.use_minimalist_renderer = False
+        self.threaded_model = False  # Run model commands on a worker thread
+        self.player = "player"
+        self.leaderboard_path: Optional[str] = None  # Defaults to leaderboard.db in user_data_dir
+        self.show_latency_overlay = False  # Move latency percentiles on screen (toggle with F12)
+
+        # Components (will be injected)
+        self.root_layout = None
+        self.model = None
+        self.view = None
+        self.controller = None
+        self.leaderboard = None
+
+        # Called once the board has been drawn for the first time
+        self.on_first_frame: Optional[Callable[[], None]] = None
+
+    def build(self):
+        """Build a lightweight root so the window can appear immediately"""
+        Window.size = (600, 700)
+
+        self.root_layout = BoxLayout(orientation='vertical')
+        self.root_layout.add_widget(Label(text="Loading..."))
+        return self.root_layout
+
+    def on_start(self):
+        """Called when application starts"""
+        self.title = "SOLID Minesweeper"
+
+        # Build the board on the next frame, after the window is shown
+        Clock.schedule_once(self._build_board, 0)
+        Window.bind(on_key_down=self._on_key_down)
+
+    def _build_board(self, dt: float) -> None:
+        """Create model, view and controller using dependency injection"""
+        # Create model (business logic)
+        self.model = MinesweeperModel()
+
+        # Create view with renderer strategy
+        cell_renderer = MinimalistCellRenderer() if self.use_minimalist_renderer else DefaultCellRenderer()
+
+        # Create temporary controller for view initialization
+        temp_controller = type('TempController', (), {
+            'on_cell_left_click': lambda self, r, c, received=None: None,
+            'on_cell_right_click': lambda self, r, c, received=None: None,
+            'on_reset_game': lambda self: None,
+            'on_difficulty_selected': lambda self, preset: None
+        })()
+
+        self.view = MinesweeperView(
+            controller=temp_controller,
+            rows=self.rows,
+            cols=self.cols,
+            cell_renderer=cell_renderer
+        )
+
+        # Finished games are written to the leaderboard on a background thread
+        leaderboard_path = self.leaderboard_path or os.path.join(self.user_data_dir, 'leaderboard.db')
+        try:
+            self.leaderboard = LeaderboardWriter(leaderboard_path)
+        except sqlite3.Error:
+            logger.exception("Could not open leaderboard %s; games will not be recorded", leaderboard_path)
+
+        # Create real controller and inject dependencies
+        if self.threaded_model:
+            self.controller = ThreadedGameController(self.model, self.view.get_view_interface(),
+                                                     post_to_main_thread, self.leaderboard, self.player,
+                                                     MoveTelemetry())
+        else:
+            self.controller = MinesweeperController(self.model, self.view.get_view_interface(),
+                                                    self.leaderboard, self.player, MoveTelemetry())
+
+        # Update view with real controller using the new method
+        self.view.view_impl.set_controller(self.controller)
+
+        # Initialize game
+        self.controller.initialize_game(self.rows, self.cols, self.mine_count)
+
+        self.root_layout.clear_widgets()
+        self.root_layout.add_widget(self.view)
+        if self.show_latency_overlay:
+            self._set_latency_overlay(True)
+
+        if self.on_first_frame is not None:
+            Clock.schedule_once(lambda dt: self.on_first_frame(), 0)
+
+    def _on_key_down(self, window, key, scancode, codepoint, modifiers):
+        """F12 toggles the latency overlay"""
+        if key == 293 and self.controller is not None:
+            self._set_latency_overlay(self.view.view_impl.latency_label is None)
+            return True
+        return False
+
+    def _set_latency_overlay(self, visible: bool) -> None:
+        """Show or hide the latency overlay.
+
+        While it is visible, a synchronous move counts as flushed on the next
+        frame, when its changes are drawn; waiting for that costs a Clock
+        callback per move, so hidden moves count as flushed when they return.
+        """
+        view_impl = self.view.view_impl
+        if visible:
+            view_impl.show_latency_overlay(self.controller.telemetry)
+        else:
+            view_impl.hide_latency_overlay()
+        if isinstance(self.controller, MinesweeperController):
+            self.controller.flush_poster = post_to_main_thread if visible else None
+
+    def on_stop(self):
+        """Stop the model worker and leaderboard threads"""
+        if isinstance(self.controller, ThreadedGameController):
+            self.controller.shutdown()
+        if self.leaderboard is not None:
+            self.leaderboard.close()
@@ -3,14 +3,21 @@ from kivy.uix.gridlayout import GridLayout
 from kivy.uix.button import Button
 from kivy.uix.label import Label
 from kivy.uix.popup import Popup
-from kivy.core.text import LabelBase
+from kivy.graphics import Color, Rectangle
+from kivy.clock import Clock
 from interfaces.game_interfaces import IGameView, IGameController, CellState
 from utils.cell_renderers import ICellRenderer, DefaultCellRenderer
-from typing import Dict, Tuple, Optional
+from utils.fonts import register_emoji_font
+from utils.telemetry import MoveTelemetry
+from typing import Dict, List, Set, Tuple, Optional
+import time
 
-# Register emoji font
-LabelBase.register(name="DejaVuSans", 
-                   fn_regular="C:/Windows/Fonts/seguiemj.ttf")
+# Difficulty buttons: preset name -> button caption
+DIFFICULTY_BUTTONS = (
+    ('beginner', "Новичок"),
+    ('intermediate', "Любитель"),
+    ('expert', "Профессионал"),
+)
 
 class MinesweeperCell(Button):
     """Custom button for minesweeper cell with clean separation of concerns"""
@@ -20,24 +27,42 @@ class MinesweeperCell(Button):
         self.row = row
         self.col = col
         self.controller = controller
-        self.font_name = "DejaVuSans"
+        self.font_name = register_emoji_font()  # Registered lazily on first cell
         self.font_size = '20sp'
         self.text = ''
         self.background_normal = ''
         self.background_color = (0.7, 0.7, 0.7, 1)
+        
+        # Glyph drawn from a shared pre-rendered texture instead of self.text
+        with self.canvas.after:
+            Color(1, 1, 1, 1)
+            self._glyph_rect = Rectangle(size=(0, 0))
+        self.bind(pos=self._update_glyph_rect, size=self._update_glyph_rect)
+    
+    def set_glyph(self, texture) -> None:
+        """Show a pre-rendered glyph texture, or nothing for None"""
+        self._glyph_rect.texture = texture
+        self._glyph_rect.size = texture.size if texture is not None else (0, 0)
+        self._update_glyph_rect()
+    
+    def _update_glyph_rect(self, *args) -> None:
+        """Keep the glyph centered in the cell"""
+        width, height = self._glyph_rect.size
+        self._glyph_rect.pos = (self.center_x - width / 2, self.center_y - height / 2)
     
     def on_touch_down(self, touch):
         if not self.collide_point(*touch.pos):
             return super(MinesweeperCell, self).on_touch_down(touch)
         
         if touch.button == 'right':
-            self.controller.on_cell_right_click(self.row, self.col)
+            # Start of the move's input_to_model phase; only the touched cell reads the clock
+            self.controller.on_cell_right_click(self.row, self.col, time.perf_counter())
         
         return True
     
     def on_touch_up(self, touch):
         if touch.button == 'left' and self.collide_point(*touch.pos):
-            self.controller.on_cell_left_click(self.row, self.col)
+            self.controller.on_cell_left_click(self.row, self.col, time.perf_counter())
         
         return super(MinesweeperCell, self).on_touch_up(touch)
 
@@ -45,19 +70,24 @@ class MinesweeperViewImpl(IGameView):
     """Implementation of IGameView interface using composition pattern"""
     
     def __init__(self, widget: BoxLayout, controller: IGameController, rows: int = 15, cols: int = 15, 
-                 cell_renderer: Optional[ICellRenderer] = None):
+                 cell_renderer: Optional[ICellRenderer] = None, use_glyph_atlas: bool = True):
         self.widget = widget
         self.controller = controller
         self.rows = rows
         self.cols = cols
         self.cell_renderer = cell_renderer or DefaultCellRenderer()
+        self.use_glyph_atlas = use_glyph_atlas  # False re-renders cell.text (for comparison)
         
         # UI components
         self.cells: Dict[Tuple[int, int], MinesweeperCell] = {}
+        self._cell_pool: List[MinesweeperCell] = []  # Every cell ever created, reused on resize
+        self._dirty_cells: Set[MinesweeperCell] = set()  # Cells changed since the last reset
         self.status_label: Optional[Label] = None
         self.grid: Optional[GridLayout] = None
         self.reset_button: Optional[Button] = None
         self._reset_callback = None  # Store callback reference for unbinding
+        self.latency_label: Optional[Label] = None  # Only exists while the overlay is shown
+        self._latency_event = None
         
         self._setup_ui()
     
@@ -79,18 +109,18 @@ class MinesweeperViewImpl(IGameView):
         )
         
         # Create cell buttons
-        for row in range(self.rows):
-            for col in range(self.cols):
-                cell = MinesweeperCell(
-                    row=row,
-                    col=col,
-                    controller=self.controller
-                )
-                self.cells[(row, col)] = cell
-                self.grid.add_widget(cell)
+        self._layout_cells()
         
         self.widget.add_widget(self.grid)
         
+        # Difficulty buttons
+        difficulty_layout = BoxLayout(orientation='horizontal', size_hint=(1, 0.08), spacing=2)
+        for preset, caption in DIFFICULTY_BUTTONS:
+            button = Button(text=caption, font_size='14sp')
+            button.bind(on_release=lambda x, preset=preset: self.controller.on_difficulty_selected(preset))
+            difficulty_layout.add_widget(button)
+        self.widget.add_widget(difficulty_layout)
+        
         # Reset button
         self.reset_button = Button(
             text="Перезапустить игру", 
@@ -101,6 +131,31 @@ class MinesweeperViewImpl(IGameView):
         self.reset_button.bind(on_release=self._reset_callback)
         self.widget.add_widget(self.reset_button)
     
+    def _layout_cells(self) -> None:
+        """Fill the grid for the current size, taking cells from the pool"""
+        needed = self.rows * self.cols
+        while len(self._cell_pool) < needed:
+            self._cell_pool.append(MinesweeperCell(row=0, col=0, controller=self.controller))
+        
+        self.grid.clear_widgets()
+        self.grid.cols = self.cols
+        self.cells = {}
+        for index in range(needed):
+            row, col = divmod(index, self.cols)
+            cell = self._cell_pool[index]
+            cell.row = row
+            cell.col = col
+            self.cells[(row, col)] = cell
+            self.grid.add_widget(cell)
+    
+    def resize(self, rows: int, cols: int) -> None:
+        """Change board dimensions in place, recycling pooled cell widgets"""
+        if (rows, cols) == (self.rows, self.cols):
+            return
+        self.rows = rows
+        self.cols = cols
+        self._layout_cells()
+    
     def set_controller(self, controller: IGameController) -> None:
         """Update controller reference for all UI elements"""
         self.controller = controller
@@ -112,8 +167,8 @@ class MinesweeperViewImpl(IGameView):
             self._reset_callback = lambda x: self.controller.on_reset_game()
             self.reset_button.bind(on_release=self._reset_callback)
         
-        # Update all cells with new controller
-        for cell in self.cells.values():
+        # Update all cells with new controller, including pooled ones
+        for cell in self._cell_pool:
             cell.controller = controller
     
     def update_cell(self, row: int, col: int, state: CellState, value: int) -> None:
@@ -122,11 +177,15 @@ class MinesweeperViewImpl(IGameView):
             return
         
         cell = self.cells[(row, col)]
+        self._dirty_cells.add(cell)
         
         # Use renderer strategy to get visual properties
-        cell.text = self.cell_renderer.get_cell_text(state, value)
+        if self.use_glyph_atlas:
+            cell.set_glyph(self.cell_renderer.get_cell_texture(state, value, cell.font_name, cell.font_size))
+        else:
+            cell.text = self.cell_renderer.get_cell_text(state, value)
+            cell.color = self.cell_renderer.get_text_color(state, value)
         cell.background_color = self.cell_renderer.get_background_color(state, value)
-        cell.color = self.cell_renderer.get_text_color(state, value)
     
     def update_status(self, flagged_count: int, mine_count: int) -> None:
         """Update status display"""
@@ -166,14 +225,37 @@ class MinesweeperViewImpl(IGameView):
     
     def reset_view(self) -> None:
         """Reset view to initial state"""
-        for cell in self.cells.values():
+        # Only cells touched since the last reset can differ from the initial look
+        for cell in self._dirty_cells:
+            cell.set_glyph(None)
             cell.text = ''
             cell.background_color = (0.7, 0.7, 0.7, 1)
             cell.color = (1, 1, 1, 1)
+        self._dirty_cells.clear()
         
         if self.status_label:
             self.status_label.text = "Mines: 0/0"
     
+    def show_latency_overlay(self, telemetry: MoveTelemetry, interval: float = 0.5) -> None:
+        """Show move latency percentiles above the board, refreshed every interval seconds"""
+        if self.latency_label is not None:
+            return
+        self.latency_label = Label(size_hint=(1, 0.12), font_size='12sp')
+        # Highest index is drawn first in a vertical BoxLayout, i.e. at the top
+        self.widget.add_widget(self.latency_label, index=len(self.widget.children))
+        refresh = lambda dt: setattr(self.latency_label, 'text', telemetry.format_summary())
+        refresh(0)
+        self._latency_event = Clock.schedule_interval(refresh, interval)
+    
+    def hide_latency_overlay(self) -> None:
+        """Remove the latency overlay; nothing is refreshed while it is hidden"""
+        if self.latency_label is None:
+            return
+        self._latency_event.cancel()
+        self._latency_event = None
+        self.widget.remove_widget(self.latency_label)
+        self.latency_label = None
+    
     def set_cell_renderer(self, renderer: ICellRenderer) -> None:
         """Change cell rendering strategy (Open/Closed Principle)"""
         self.cell_renderer = renderer
@@ -182,7 +264,7 @@ class MinesweeperView(BoxLayout):
     """Kivy widget that wraps the view implementation"""
     
     def __init__(self, controller: IGameController, rows: int = 15, cols: int = 15, 
-                 cell_renderer: Optional[ICellRenderer] = None, **kwargs):
+                 cell_renderer: Optional[ICellRenderer] = None, use_glyph_atlas: bool = True, **kwargs):
         super(MinesweeperView, self).__init__(**kwargs)
         self.orientation = 'vertical'
         
@@ -192,7 +274,8 @@ class MinesweeperView(BoxLayout):
             controller=controller,
             rows=rows,
             cols=cols,
-            cell_renderer=cell_renderer
+            cell_renderer=cell_renderer,
+            use_glyph_atlas=use_glyph_atlas
         )
     
     def get_view_interface(self) -> IGameView: